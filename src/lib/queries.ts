@@ -240,35 +240,28 @@ export type YearStats = {
   mismanage: MismanageRow[];
 };
 
-type OptPlayer = { points: number; eligible: string[]; slot: string; isBench: boolean };
-
-/** Best possible starting points given the slots the team actually started. */
-function optimalPoints(players: OptPlayer[]): number {
-  const width = (s: string) => s.split("/").length;
-  const slots = players
-    .filter((p) => !p.isBench)
-    .map((p) => ({ slot: p.slot, w: width(p.slot), filled: false }));
-  const cands = [...players].sort((a, b) => b.points - a.points);
-  let total = 0;
-  for (const p of cands) {
-    let best: (typeof slots)[number] | null = null;
-    for (const s of slots) {
-      if (s.filled) continue;
-      if (p.eligible.includes(s.slot) && (!best || s.w < best.w)) best = s;
-    }
-    if (best) {
-      best.filled = true;
-      total += p.points;
-    }
-  }
-  return total;
+type TeamSeasonStatsRow = {
+  team_id: number;
+  weeks_played: number;
+  actual_points: number;
+  optimal_points: number;
+};
+
+/** Pipeline-computed season totals (supabase/analytics.py); empty until a sync writes them. */
+async function getTeamSeasonStats(year: number): Promise<TeamSeasonStatsRow[]> {
+  const { data } = await supabase
+    .from("team_season_stats")
+    .select("team_id, weeks_played, actual_points, optimal_points")
+    .eq("year", year);
+  return (data as TeamSeasonStatsRow[]) ?? [];
 }
 
 /** Season-level stat leaderboards for one year. */
 export async function getYearStats(year: number): Promise<YearStats> {
-  const [teams, matchups] = await Promise.all([
+  const [teams, matchups, seasonStats] = await Promise.all([
     getTeams(year),
     getMatchups(year),
+    getTeamSeasonStats(year),
   ]);
   const teamById = new Map<number, Team>(teams.map((t) => [t.id, t]));
   const standings = buildStandings(teams, matchups); // regular season
@@ -342,15 +335,8 @@ export async function getYearStats(year: number): Promise<YearStats> {
     .sort((a, b) => a.score - b.score);
 
   // --- Mismanagement (% of optimal points) ---
-  // All played weeks, including playoffs (mismanagement spans the whole season).
-  const playedIds = matchups
-    .filter((m) => (m.home_score ?? 0) !== 0 || (m.away_score ?? 0) !== 0)
-    .map((m) => m.id);
-  const matchupSide = new Map<number, { home: number; away: number }>();
-  for (const m of matchups) {
-    matchupSide.set(m.id, { home: m.home_team_id, away: m.away_team_id });
-  }
-
+  // All played weeks, including playoffs, scored against the league's lineup
+  // slots by the sync pipeline (supabase/analytics.py).
   const recordByTeam = new Map<number, string>(
     standings.map((s) => [
       s.team.id,
@@ -358,76 +344,22 @@ export async function getYearStats(year: number): Promise<YearStats> {
     ]),
   );
 
-  // teamId -> { week -> OptPlayer[] }
-  const teamWeeks = new Map<number, Map<number, OptPlayer[]>>();
-  const weekByMatchup = new Map<number, number>(
-    matchups.map((m) => [m.id, m.week]),
-  );
-
-  if (playedIds.length > 0) {
-    type SlotQueryRow = {
-      matchup_id: number;
-      team_side: "home" | "away";
-      points: number | null;
-      slot: string;
-      is_bench: boolean | null;
-      eligible_slots: string[] | null;
-    };
-    // Fetch in matchup-id chunks to stay under the 1000-row response cap.
-    const rows: SlotQueryRow[] = [];
-    const CHUNK = 20;
-    for (let i = 0; i < playedIds.length; i += CHUNK) {
-      const chunk = playedIds.slice(i, i + CHUNK);
-      const { data } = await supabase
-        .from("player_slots")
-        .select("matchup_id, team_side, points, slot, is_bench, eligible_slots")
-        .in("matchup_id", chunk);
-      if (data) rows.push(...(data as SlotQueryRow[]));
-    }
-
-    for (const r of rows) {
-      const sides = matchupSide.get(r.matchup_id);
-      if (!sides) continue;
-      const teamId = r.team_side === "home" ? sides.home : sides.away;
-      const week = weekByMatchup.get(r.matchup_id) ?? 0;
-      let wm = teamWeeks.get(teamId);
-      if (!wm) {
-        wm = new Map();
-        teamWeeks.set(teamId, wm);
-      }
-      const arr = wm.get(week) ?? [];
-      arr.push({
-        points: Number(r.points ?? 0),
-        eligible: Array.isArray(r.eligible_slots) ? r.eligible_slots : [],
-        slot: r.slot,
-        isBench: !!r.is_bench,
-      });
-      wm.set(week, arr);
-    }
-  }
-
   const mismanage: MismanageRow[] = [];
-  for (const [teamId, weeks] of teamWeeks) {
-    const team = teamById.get(teamId);
-    if (!team) continue;
-    let actual = 0;
-    let optimal = 0;
-    for (const players of weeks.values()) {
-      actual += players
-        .filter((p) => !p.isBench)
-        .reduce((a, p) => a + p.points, 0);
-      optimal += optimalPoints(players);
-    }
+  for (const r of seasonStats) {
+    const team = teamById.get(r.team_id);
+    if (!team || !r.weeks_played) continue;
+    const actual = Number(r.actual_points);
+    const optimal = Number(r.optimal_points);
     const pointsLeft = optimal - actual;
     mismanage.push({
       team,
-      record: recordByTeam.get(teamId) ?? "",
+      record: recordByTeam.get(r.team_id) ?? "",
       pctOptimal: optimal > 0 ? (actual / optimal) * 100 : 100,
       maxPoints: optimal,
       actualPoints: actual,
       pointsLeft,
-      avgPerWeek: weeks.size ? pointsLeft / weeks.size : 0,
-      weeks: weeks.size,
+      avgPerWeek: pointsLeft / r.weeks_played,
+      weeks: r.weeks_played,
     });
   }
   mismanage.sort((a, b) => a.pctOptimal - b.pctOptimal); // worst first
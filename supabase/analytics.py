@@ -0,0 +1,86 @@
+"""
+Season aggregates the site would otherwise rebuild from `player_slots` on every request.
+
+Built from a `data-YYYY.json` payload (see `build_year_json`) and written by
+`seed.sync_year_payload`:
+
+  team_week_stats    one row per team-week played: score, opponent, starters' points
+                     and the best lineup the league's starting slots allowed
+  team_season_stats  per team: regular-season record and points, plus whole-season
+                     high/low game and optimal vs actual points (the site's
+                     mismanagement table)
+
+Team ids are the payload's ESPN ids; `seed.py` swaps them for `teams.id` before writing.
+The season table is a sum over `team_week_stats` rows, so a live refresh can rebuild it
+from the stored week rows plus the weeks it just fetched.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from lineup_optimizer import LineupOptimizer
+from season_index import SeasonIndex
+
+# ESPN's default schedule (14 regular-season weeks), for payloads written before
+# build_year_json recorded the league's own playoff_start_week
+DEFAULT_PLAYOFF_START_WEEK = 15
+
+
+def playoff_start_week(payload: dict[str, Any]) -> int:
+    """First playoff week; records count the weeks before it."""
+    return int(payload.get("playoff_start_week") or DEFAULT_PLAYOFF_START_WEEK)
+
+
+def team_week_rows(payload: dict[str, Any], index: SeasonIndex | None = None) -> list[dict[str, Any]]:
+    """Played team-weeks (a matchup where either side scored). optimal_points fills the
+    league's starting slots (payload["slot_counts"], the default lineup for payloads
+    written without them), like the site's mismanagement table."""
+    index = index or SeasonIndex.from_payload(payload)
+    playoffs = playoff_start_week(payload)
+    optimizer = LineupOptimizer(payload.get("slot_counts"))
+    rows = []
+    for s in index.scores:
+        if not s.team or (s.score == 0 and s.opponent_score == 0):
+            continue
+        lineup = index.lineup(int(s.team), s.week)
+        rows.append({
+            "week": s.week,
+            "team_id": int(s.team),
+            "opponent_id": int(s.opponent) if s.opponent else None,
+            "score": round(s.score, 2),
+            "opponent_score": round(s.opponent_score, 2),
+            "is_playoff": s.week >= playoffs,
+            "actual_points": round(sum(a.points for a in lineup if not a.bench), 2),
+            "optimal_points": round(optimizer.best_score([(a.points, a.eligible_slots, a.position) for a in lineup]), 2),
+        })
+    return rows
+
+
+def team_season_rows(week_rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Per team_id totals of team_week_stats rows."""
+    teams: dict[Any, dict[str, Any]] = {}
+    for r in sorted(week_rows, key=lambda r: r["week"]):
+        t = teams.get(r["team_id"])
+        if t is None:
+            t = teams[r["team_id"]] = {
+                "team_id": r["team_id"], "wins": 0, "losses": 0, "ties": 0, "points_for": 0.0,
+                "points_against": 0.0, "weeks_played": 0, "high_score": None, "low_score": None,
+                "actual_points": 0.0, "optimal_points": 0.0,
+            }
+        score, against = float(r["score"]), float(r["opponent_score"])
+        if not r["is_playoff"]:
+            t["wins"] += score > against
+            t["losses"] += score < against
+            t["ties"] += score == against
+            t["points_for"] += score
+            t["points_against"] += against
+        t["weeks_played"] += 1
+        t["high_score"] = score if t["high_score"] is None else max(t["high_score"], score)
+        t["low_score"] = score if t["low_score"] is None else min(t["low_score"], score)
+        t["actual_points"] += float(r["actual_points"])
+        t["optimal_points"] += float(r["optimal_points"])
+    for t in teams.values():
+        for key in ("points_for", "points_against", "actual_points", "optimal_points"):
+            t[key] = round(t[key], 2)
+    return list(teams.values())
@@ -28,7 +28,7 @@ def main() -> None:
             sys.path.insert(0, str(p))
 
     import slimify_fantasy_html as slim
-    from seed import create_supabase_client, sync_year_payload, sync_player_season
+    from seed import create_supabase_client, format_sync_report, sync_year_payload, sync_player_season
     from espn_api.football import League
 
     if not slim.ESPN_S2 or not slim.SWID:
@@ -43,26 +43,29 @@ def main() -> None:
             year=year,
             espn_s2=slim.ESPN_S2,
             swid=slim.SWID,
+            cache=slim.RESPONSE_CACHE,
         )
 
         all_weeks: dict[int, list] = {}
         last_week = 0
+        errors: dict[int, Exception] = {}
+        fetched = league.box_scores_range(range(1, MAX_WEEK + 1), errors=errors)
         for week in range(1, MAX_WEEK + 1):
-            try:
-                box = league.box_scores(week=week)
-                if box:
-                    all_weeks[week] = box
-                    last_week = week
-                    print(f"  Week {week}: OK ({len(box)} matchups)")
-            except Exception as e:
-                print(f"  Week {week}: skip ({e})")
+            if week in errors:
+                print(f"  Week {week}: skip ({errors[week]})")
+                continue
+            box = fetched.get(week)
+            if box:
+                all_weeks[week] = box
+                last_week = week
+                print(f"  Week {week}: OK ({len(box)} matchups)")
 
         payload = slim.build_year_json(league, all_weeks, year)
         with open(root / f"data-{year}.json", "w", encoding="utf-8") as f:
             json.dump(payload, f)
         print(f"  Wrote data-{year}.json")
 
-        sync_year_payload(client, payload)
+        print(format_sync_report(sync_year_payload(client, payload)))
 
         ps = slim.build_player_season(league, payload)
         sync_player_season(client, year, ps)
@@ -75,6 +78,8 @@ def main() -> None:
         print(f"  Synced {year} (through week {last_week}).")
 
     print("Backfill complete.")
+    if slim.RESPONSE_CACHE:
+        print(f"ESPN cache: {slim.RESPONSE_CACHE.stats}")
 
 
 if __name__ == "__main__":
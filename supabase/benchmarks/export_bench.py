@@ -0,0 +1,82 @@
+"""
+Size and parse time of the columnar season export (`season_export.py`) against the
+data-YYYY.json it is built from.
+
+For each payload: bytes on disk of the JSON (plain and gzip'd) and of each export
+container, and the time to get from those bytes back to the payload dict. "columns"
+rows stop after decompress + parse, for readers that use the columns as they are. The
+exports are checked to decode to the same payload first.
+
+Run from repo root (the .msgpack.zst rows need msgpack and zstandard):
+  python supabase/benchmarks/export_bench.py data-2024.json data-2025.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import sys
+from pathlib import Path
+
+
+def _ensure_import_paths() -> Path:
+    root = Path(__file__).resolve().parent.parent.parent
+    supabase_dir = Path(__file__).resolve().parent.parent
+    bench_dir = Path(__file__).resolve().parent
+    for p in (root, supabase_dir, bench_dir):
+        if str(p) not in sys.path:
+            sys.path.insert(0, str(p))
+    return root
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("payloads", nargs="+", type=Path, help="data-YYYY.json files")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--save", type=Path, help="write results as json")
+    args = parser.parse_args()
+
+    _ensure_import_paths()
+    import season_export
+    from run_benchmarks import measure
+
+    containers = [season_export.JSON_SUFFIX]
+    if season_export.msgpack is not None and season_export.zstandard is not None:
+        containers.append(season_export.MSGPACK_SUFFIX)
+    else:
+        print(f"msgpack/zstandard not installed; skipping {season_export.MSGPACK_SUFFIX}")
+
+    results: dict[str, dict[str, float]] = {}
+    for path in args.payloads:
+        raw = path.read_bytes()
+        payload = json.loads(raw)
+        gz = gzip.compress(raw, compresslevel=9)
+        label = path.stem
+        rows = {
+            f"{label} json": (len(raw), lambda: json.loads(raw)),
+            f"{label} json.gz": (len(gz), lambda: json.loads(gzip.decompress(gz))),
+        }
+        doc = season_export.encode_payload(payload)
+        for container in containers:
+            data = season_export.dumps(doc, container)
+            if season_export.decode_payload(season_export.loads(data, container)) != payload:
+                raise AssertionError(f"{path.name}: {container} does not decode to the payload")
+            rows[f"{label} export{container} (columns)"] = (len(data), lambda d=data, c=container: season_export.loads(d, c))
+            rows[f"{label} export{container}"] = (
+                len(data), lambda d=data, c=container: season_export.decode_payload(season_export.loads(d, c)))
+        for name, (size, load) in rows.items():
+            results[name] = {"bytes": size, **measure(load, args.repeat)}
+        print(f"{path.name}: every export decodes to the same payload")
+
+    print(f"\n{'format':<52}{'KiB':>10}{'median ms':>12}{'min ms':>10}")
+    for name, r in results.items():
+        print(f"{name:<52}{r['bytes'] / 1024:>10.1f}{r['median_ms']:>12.2f}{r['min_ms']:>10.2f}")
+
+    if args.save:
+        args.save.write_text(json.dumps({"results": results}, indent=2), encoding="utf-8")
+        print(f"\nSaved {args.save}")
+
+
+if __name__ == "__main__":
+    main()
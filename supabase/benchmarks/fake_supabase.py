@@ -0,0 +1,138 @@
+"""
+In-memory stand-in for the supabase-py client, enough of the PostgREST query
+builder for `seed.py` to run against: table().select/insert/upsert/update/delete,
+eq/in_/limit filters and execute(). Every execute() counts as one round trip.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+
+class _Result:
+    def __init__(self, data: list[dict[str, Any]]):
+        self.data = data
+
+
+class _Query:
+    def __init__(self, client: "FakeSupabaseClient", table: str):
+        self._client = client
+        self._table = table
+        self._op = "select"
+        self._rows: list[dict[str, Any]] = []
+        self._values: dict[str, Any] = {}
+        self._on_conflict: list[str] = []
+        self._filters: list[tuple[str, str, Any]] = []
+        self._limit: int | None = None
+
+    def select(self, columns: str = "*") -> "_Query":
+        self._op = "select"
+        return self
+
+    def insert(self, rows) -> "_Query":
+        self._op = "insert"
+        self._rows = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def upsert(self, rows, on_conflict: str = "") -> "_Query":
+        self._op = "upsert"
+        self._rows = rows if isinstance(rows, list) else [rows]
+        self._on_conflict = [c for c in on_conflict.split(",") if c]
+        return self
+
+    def update(self, values: dict[str, Any]) -> "_Query":
+        self._op = "update"
+        self._values = values
+        return self
+
+    def delete(self) -> "_Query":
+        self._op = "delete"
+        return self
+
+    def eq(self, column: str, value: Any) -> "_Query":
+        self._filters.append(("eq", column, value))
+        return self
+
+    def in_(self, column: str, values) -> "_Query":
+        self._filters.append(("in", column, list(values)))
+        return self
+
+    def limit(self, n: int) -> "_Query":
+        self._limit = n
+        return self
+
+    def _matches(self, row: dict[str, Any]) -> bool:
+        for op, column, value in self._filters:
+            if op == "eq" and row.get(column) != value:
+                return False
+            if op == "in" and row.get(column) not in value:
+                return False
+        return True
+
+    def execute(self) -> _Result:
+        self._client.round_trips += 1
+        self._client.calls.append((self._table, self._op))
+        rows = self._client.tables.setdefault(self._table, [])
+
+        if self._op == "select":
+            out = [dict(r) for r in rows if self._matches(r)]
+            return _Result(out[: self._limit] if self._limit else out)
+
+        if self._op == "delete":
+            kept = [r for r in rows if not self._matches(r)]
+            removed = len(rows) - len(kept)
+            self._client.tables[self._table] = kept
+            return _Result([{}] * removed)
+
+        if self._op == "update":
+            out = []
+            for r in rows:
+                if self._matches(r):
+                    r.update(self._values)
+                    out.append(dict(r))
+            return _Result(out)
+
+        upsert = self._op == "upsert" and bool(self._on_conflict)
+        index = {}
+        if upsert:
+            index = {tuple(r.get(c) for c in self._on_conflict): r for r in rows}
+        out = []
+        for new in self._rows:
+            key = tuple(new.get(c) for c in self._on_conflict) if upsert else None
+            existing = index.get(key) if upsert else None
+            if existing is not None:
+                existing.update(new)
+                out.append(dict(existing))
+            else:
+                row = {"id": str(uuid.uuid4()), **new}
+                rows.append(row)
+                if upsert:
+                    index[key] = row
+                out.append(dict(row))
+        return _Result(out)
+
+
+class _Rpc:
+    def __init__(self, client: "FakeSupabaseClient", name: str, params: dict[str, Any]):
+        self._client = client
+        self._name = name
+        self._params = params
+
+    def execute(self) -> _Result:
+        self._client.round_trips += 1
+        self._client.calls.append((self._name, "rpc"))
+        return _Result([])
+
+
+class FakeSupabaseClient:
+    def __init__(self) -> None:
+        self.tables: dict[str, list[dict[str, Any]]] = {}
+        self.round_trips = 0
+        self.calls: list[tuple[str, str]] = []
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+    def rpc(self, name: str, params: dict[str, Any] | None = None) -> _Rpc:
+        return _Rpc(self, name, params or {})
@@ -0,0 +1,258 @@
+"""
+Offline benchmarks for the ESPN -> data-YYYY.json -> Supabase pipeline.
+
+Every ESPN call is answered from a recorded archive (see
+`espn_api/requests/replay.py`) and Supabase writes go to an in-memory fake
+client, so runs are repeatable and need no network or credentials.
+
+Record an archive once (needs ESPN creds in .env):
+  python supabase/benchmarks/run_benchmarks.py --year 2025 --record benchmarks/espn-2025.json.gz
+
+Run, save a baseline, and compare a later run against it:
+  python supabase/benchmarks/run_benchmarks.py --year 2025 --archive benchmarks/espn-2025.json.gz --save baseline-2025.json
+  python supabase/benchmarks/run_benchmarks.py --year 2025 --archive benchmarks/espn-2025.json.gz --compare baseline-2025.json
+
+Each benchmark reports median/min wall time over --repeat runs and the peak
+traced allocation (tracemalloc) of one extra run.
+
+--memory runs slimify_fantasy_html.main() instead, in a scratch directory, and
+reports the process's peak resident set. Peak RSS covers the whole process, so
+this mode runs nothing else:
+  python supabase/benchmarks/run_benchmarks.py --year 2025 --archive benchmarks/espn-2025.json.gz --memory --save main-2025.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+
+def _ensure_import_paths() -> Path:
+    root = Path(__file__).resolve().parent.parent.parent
+    supabase_dir = Path(__file__).resolve().parent.parent
+    bench_dir = Path(__file__).resolve().parent
+    for p in (root, supabase_dir, bench_dir):
+        if str(p) not in sys.path:
+            sys.path.insert(0, str(p))
+    return root
+
+
+def build_benchmarks(args: argparse.Namespace) -> list[tuple[str, Callable[[], Any], int]]:
+    """(name, callable, items) triples; items > 1 also reports time per item."""
+    import slimify_fantasy_html as slim
+    from seed import sync_year_payload
+    from fake_supabase import FakeSupabaseClient
+    from espn_api.football import League
+
+    espn_s2 = slim.ESPN_S2 or "replay"
+    swid = slim.SWID or "replay"
+
+    def new_league():
+        return League(league_id=slim.LEAGUE_ID, year=args.year, espn_s2=espn_s2, swid=swid)
+
+    league = new_league()
+    weeks = list(range(1, int(league.current_week) + 1))
+    week = args.week or weeks[-1]
+    all_weeks = {w: league.box_scores(week=w) for w in weeks}
+    payload = slim.build_year_json(league, all_weeks, args.year)
+
+    rostered = sum(len(team.roster) for team in league.teams)
+    box_players = sum(len(box.home_lineup) + len(box.away_lineup) for box in all_weeks[week])
+    free_agents = len(league.free_agents(week=week, size=250))
+
+    def sync_to_fake():
+        client = FakeSupabaseClient()
+        sync_year_payload(client, payload)
+        return client.round_trips
+
+    synced = FakeSupabaseClient()
+    sync_year_payload(synced, payload)
+
+    def resync_unchanged():
+        return sync_year_payload(synced, payload, incremental=True)
+
+    def season_collectors():
+        index = slim.SeasonIndex.from_box_scores(all_weeks)
+        slim.get_team_year_stats(league, all_weeks, index=index)
+        slim.find_club_performances(league, all_weeks, index=index)
+        slim.calculate_mismanagement_leaderboard(league, all_weeks, index=index)
+        return slim.collect_defense_rankings(league, all_weeks, index=index)
+
+    return [
+        ("League.__init__", new_league, 1),
+        ("League.box_scores (all weeks)", lambda: [league.box_scores(week=w) for w in weeks], len(weeks)),
+        ("League.refresh (rosters)", league.refresh, rostered),
+        ("League.free_agents", lambda: league.free_agents(week=week, size=250), free_agents),
+        ("League.box_scores (one week)", lambda: league.box_scores(week=week), box_players),
+        ("League.standings_weekly", lambda: league.standings_weekly(week), 1),
+        ("League.power_rankings", lambda: league.power_rankings(week), 1),
+        ("build_year_json", lambda: slim.build_year_json(league, all_weeks, args.year), 1),
+        ("build_player_season", lambda: slim.build_player_season(league, payload), 1),
+        ("season collectors (SeasonIndex)", season_collectors, 1),
+        ("seed.sync_year_payload (fake client)", sync_to_fake, 1),
+        ("seed.sync_year_payload (no changes)", resync_unchanged, 1),
+    ]
+
+
+def run_main() -> None:
+    """slimify_fantasy_html.main() with its output files and prints kept out of the way."""
+    import slimify_fantasy_html as slim
+
+    slim.ESPN_S2 = slim.ESPN_S2 or "replay"
+    slim.SWID = slim.SWID or "replay"
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch, contextlib.redirect_stdout(io.StringIO()):
+        os.chdir(scratch)
+        try:
+            slim.main()
+        finally:
+            os.chdir(cwd)
+
+
+def measure_main_memory() -> dict[str, float]:
+    start = time.perf_counter()
+    run_main()
+    elapsed = (time.perf_counter() - start) * 1000
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        rss //= 1024
+
+    tracemalloc.start()
+    run_main()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "median_ms": round(elapsed, 3),
+        "min_ms": round(elapsed, 3),
+        "runs": 1,
+        "peak_kib": round(peak / 1024, 1),
+        "rss_kib": rss,
+    }
+
+
+def measure(fn: Callable[[], Any], repeat: int, items: int = 1) -> dict[str, float]:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(durations)
+    result = {
+        "median_ms": round(median, 3),
+        "min_ms": round(min(durations), 3),
+        "runs": repeat,
+        "peak_kib": round(peak / 1024, 1),
+    }
+    if items > 1:
+        result["items"] = items
+        result["per_item_us"] = round(median * 1000 / items, 2)
+    return result
+
+
+def compare(results: dict[str, dict[str, float]], baseline_path: Path, threshold: float) -> bool:
+    """Print current vs baseline medians; returns False if anything regressed past threshold."""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+    ok = True
+    print(f"\n{'benchmark':<42}{'baseline ms':>14}{'current ms':>14}{'change':>10}{'peak KiB':>12}")
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if not base:
+            print(f"{name:<42}{'-':>14}{cur['median_ms']:>14.2f}{'new':>10}")
+            continue
+        change = (cur["median_ms"] - base["median_ms"]) / base["median_ms"] if base["median_ms"] else 0.0
+        flag = ""
+        if change > threshold:
+            ok = False
+            flag = "  REGRESSION"
+        peak = f"{(cur['peak_kib'] - base['peak_kib']) / base['peak_kib']:+.1%}" if base.get("peak_kib") else "-"
+        print(f"{name:<42}{base['median_ms']:>14.2f}{cur['median_ms']:>14.2f}{change:>+10.1%}{peak:>12}{flag}")
+        if "rss_kib" in cur and base.get("rss_kib"):
+            print(f"{'  peak RSS KiB':<42}{base['rss_kib']:>14}{cur['rss_kib']:>14}"
+                  f"{(cur['rss_kib'] - base['rss_kib']) / base['rss_kib']:>+10.1%}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--year", type=int, required=True)
+    parser.add_argument("--league-id", type=int, help="ESPN league id (default: ESPN_LEAGUE_ID from .env)")
+    parser.add_argument("--week", type=int, help="week for the per-week benchmarks (default: current week)")
+    parser.add_argument("--archive", type=Path, help="recorded ESPN archive to replay")
+    parser.add_argument("--record", type=Path, help="run once against live ESPN and write an archive here")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per replayed request")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--memory", action="store_true", help="measure peak RSS of slimify_fantasy_html.main() only")
+    parser.add_argument("--save", type=Path, help="write results as a baseline json file")
+    parser.add_argument("--compare", type=Path, help="baseline json file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before flagging (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if not args.archive and not args.record:
+        parser.error("pass --archive to replay or --record to capture one")
+
+    if args.league_id:
+        os.environ["ESPN_LEAGUE_ID"] = str(args.league_id)
+    _ensure_import_paths()
+    from espn_api.requests import replay
+
+    if args.record:
+        recorder = replay.record(str(args.record))
+        for name, fn, items in build_benchmarks(args):
+            fn()
+        run_main()
+        print(f"Recorded {len(recorder.entries)} ESPN responses to {recorder.save()}")
+        return
+
+    replay.replay(str(args.archive), latency=args.latency)
+    results: dict[str, dict[str, float]] = {}
+    if args.memory:
+        results["slimify main()"] = r = measure_main_memory()
+        print(f"{'slimify main()':<42}{r['median_ms']:>10.2f} ms  peak RSS {r['rss_kib']} KiB  traced peak {r['peak_kib']:.0f} KiB")
+    for name, fn, items in [] if args.memory else build_benchmarks(args):
+        results[name] = measure(fn, args.repeat, items)
+        r = results[name]
+        per_item = f"  {r['per_item_us']:.1f} us/item (x{items})" if "per_item_us" in r else ""
+        print(f"{name:<42}{r['median_ms']:>10.2f} ms (min {r['min_ms']:.2f})  peak {r['peak_kib']:.0f} KiB{per_item}")
+
+    if args.save:
+        args.save.write_text(
+            json.dumps(
+                {
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "python": platform.python_version(),
+                    "year": args.year,
+                    "archive": args.archive.name,
+                    "results": results,
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        print(f"Saved baseline to {args.save}")
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
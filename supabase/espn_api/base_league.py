@@ -1,3 +1,4 @@
+import threading
 from abc import ABC
 from typing import List, Tuple
 
@@ -5,17 +6,26 @@ from .base_settings import BaseSettings
 from .base_pick import BasePick
 from .utils.logger import Logger
 from .requests.espn_requests import EspnFantasyRequests
+from .requests.cache import ResponseCache
 
 class BaseLeague(ABC):
     '''Creates a League instance for Public/Private ESPN league'''
-    def __init__(self, league_id: int, year: int, sport: str, espn_s2=None, swid=None, debug=False):
-        self.logger = Logger(name=f'{sport} league', debug=debug)
+    def __init__(self, league_id: int, year: int, sport: str, espn_s2=None, swid=None, debug=False, cache: ResponseCache = None,
+                 request_sinks: List = None):
+        # request_sinks: callables given one structured record per ESPN request (see utils.logger)
+        self.logger = Logger(name=f'{sport} league', debug=debug, sinks=request_sinks)
         self.league_id = league_id
         self.year = year
         self.teams = []
+        # team_id -> Team, rebuilt whenever teams are fetched
+        self._teams_by_id = {}
         self.members = []
         self.draft = []
         self.player_map = {}
+        # season-scoped response caches, dropped by clear_cache()
+        self._cache_lock = threading.Lock()
+        self._pro_schedule_data = None
+        self._pro_schedule_by_period = {}
 
         cookies = None
         if espn_s2 and swid:
@@ -23,12 +33,14 @@ class BaseLeague(ABC):
                 'espn_s2': espn_s2,
                 'SWID': swid
             }
-        self.espn_request = EspnFantasyRequests(sport=sport, year=year, league_id=league_id, cookies=cookies, logger=self.logger)
+        self.espn_request = EspnFantasyRequests(sport=sport, year=year, league_id=league_id, cookies=cookies, logger=self.logger, cache=cache)
 
     def __repr__(self):
         return 'League(%s, %s)' % (self.league_id, self.year, )
 
     def _fetch_league(self, SettingsClass = BaseSettings):
+        # every sport's fetch_league/refresh comes through here: drop what the last fetch cached
+        self.clear_cache()
         data = self.espn_request.get_league()
         self.currentMatchupPeriod = data['status']['currentMatchupPeriod']
         self.scoringPeriodId = data['scoringPeriodId']
@@ -41,6 +53,8 @@ class BaseLeague(ABC):
             self.current_week = data['scoringPeriodId']
         else:
             self.current_week = self.scoringPeriodId if self.scoringPeriodId <= data['status']['finalScoringPeriod'] else data['status']['finalScoringPeriod']
+        self.espn_request.live_scoring_period = self.scoringPeriodId
+        self.espn_request.season_complete = data['status'].get('isActive') is False or self.scoringPeriodId > self.finalScoringPeriod
         self.settings = SettingsClass(data['settings'])
         self.members = data.get('members', [])
         return data
@@ -52,6 +66,10 @@ class BaseLeague(ABC):
         if not data.get('draftDetail', {}).get('drafted'):
             return
 
+        with self.espn_request.timings.span('mDraftDetail'):
+            self._build_draft(data)
+
+    def _build_draft(self, data):
         picks = data.get('draftDetail', {}).get('picks', [])
         for pick in picks:
             team = self.get_team_data(pick.get('teamId'))
@@ -68,6 +86,10 @@ class BaseLeague(ABC):
 
     def _fetch_teams(self, data, TeamClass, pro_schedule = None):
         '''Fetch teams in league'''
+        with self.espn_request.timings.span('mTeam'):
+            self._build_teams(data, TeamClass, pro_schedule)
+
+    def _build_teams(self, data, TeamClass, pro_schedule = None):
         self.teams = []
         teams = data['teams']
         schedule = data['schedule']
@@ -80,37 +102,55 @@ class BaseLeague(ABC):
 
         for team in teams:
             roster = team_roster[team['id']]
-            owners = [member for member in members if member.get('id') in team.get('owners', [])]
+            owner_ids = set(team.get('owners', []))
+            owners = [member for member in members if member.get('id') in owner_ids]
             self.teams.append(TeamClass(team, roster=roster, schedule=schedule, year=seasonId, owners=owners, pro_schedule=pro_schedule))
 
         # sort by team ID
         self.teams = sorted(self.teams, key=lambda x: x.team_id, reverse=False)
+        self._teams_by_id = {team.team_id: team for team in self.teams}
 
     def _fetch_players(self):
-        data = self.espn_request.get_pro_players()
-        # Map all player id's to player name
-        for player in data:
+        # Map all player id's to player name, one streamed player at a time
+        for player in self.espn_request.iter_pro_players():
             # two way map to find playerId's by name
             self.player_map[player['id']] = player['fullName']
             # if two players have the same fullname use first one for now TODO update for multiple player names
             if player['fullName'] not in self.player_map:
                 self.player_map[player['fullName']] = player['id']
 
-    def _get_pro_schedule(self, scoringPeriodId: int = None):
-        data = self.espn_request.get_pro_schedule()
+    def clear_cache(self):
+        '''Drops cached season documents so the next call refetches them; run on every league fetch'''
+        with self._cache_lock:
+            self._pro_schedule_data = None
+            self._pro_schedule_by_period = {}
 
-        pro_teams = data['settings']['proTeams']
-        pro_team_schedule = {}
+    def _get_pro_schedule_data(self):
+        '''Downloads the pro team schedule once per season and reuses it'''
+        with self._cache_lock:
+            if self._pro_schedule_data is None:
+                self._pro_schedule_data = self.espn_request.get_pro_schedule()
+            return self._pro_schedule_data
 
-        for team in pro_teams:
-            pro_game = team.get('proGamesByScoringPeriod', {})
-            if team['id'] != 0 and (str(scoringPeriodId) in pro_game.keys() and pro_game[str(scoringPeriodId)]):
-                game_data = pro_game[str(scoringPeriodId)][0]
-                pro_team_schedule[team['id']] = (game_data['homeProTeamId'], game_data['date'])  if team['id'] == game_data['awayProTeamId'] else (game_data['awayProTeamId'], game_data['date'])
-        return pro_team_schedule
+    def _get_pro_schedule(self, scoringPeriodId: int = None):
+        data = self._get_pro_schedule_data()
+        with self._cache_lock:
+            if scoringPeriodId in self._pro_schedule_by_period:
+                return self._pro_schedule_by_period[scoringPeriodId]
+
+            pro_teams = data['settings']['proTeams']
+            pro_team_schedule = {}
+
+            for team in pro_teams:
+                pro_game = team.get('proGamesByScoringPeriod', {})
+                if team['id'] != 0 and (str(scoringPeriodId) in pro_game.keys() and pro_game[str(scoringPeriodId)]):
+                    game_data = pro_game[str(scoringPeriodId)][0]
+                    pro_team_schedule[team['id']] = (game_data['homeProTeamId'], game_data['date'])  if team['id'] == game_data['awayProTeamId'] else (game_data['awayProTeamId'], game_data['date'])
+            self._pro_schedule_by_period[scoringPeriodId] = pro_team_schedule
+            return pro_team_schedule
     
     def _get_all_pro_schedule(self):
-        data = self.espn_request.get_pro_schedule()
+        data = self._get_pro_schedule_data()
 
         pro_teams = data.get('settings', {}).get('proTeams', {})
         pro_team_schedule = {}
@@ -120,12 +160,13 @@ class BaseLeague(ABC):
             pro_team_schedule[team['id']] = pro_game
         return pro_team_schedule
 
+    def request_timings(self) -> dict:
+        '''{view: requests, bytes and connect/ttfb/download/decode/build/total ms} for every ESPN call so far'''
+        return self.espn_request.request_timings()
+
     def standings(self) -> List:
         standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
         return standings
 
     def get_team_data(self, team_id: int) -> List:
-        for team in self.teams:
-            if team_id == team.team_id:
-                return team
-        return None
+        return self._teams_by_id.get(team_id)
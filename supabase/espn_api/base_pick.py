@@ -1,6 +1,8 @@
 
 class BasePick(object):
     ''' Pick represents a pick in draft '''
+    __slots__ = ('team', 'playerId', 'playerName', 'round_num', 'round_pick', 'bid_amount', 'keeper_status',
+                 'nominatingTeam')
     def __init__(self, team, playerId, playerName, round_num, round_pick, bid_amount, keeper_status, nominatingTeam):
         self.team = team
         self.playerId = playerId
@@ -5,6 +5,8 @@ from datetime import datetime, timedelta
 
 class BoxPlayer(Player):
     '''player with extra data from a matchup'''
+    __slots__ = ('slot_position', 'pro_opponent', 'pro_pos_rank', 'game_played', 'on_bye_week', 'points',
+                 'points_breakdown', 'projected_points', 'projected_breakdown', 'game_date')
     def __init__(self, data, pro_schedule, week, year):
         super(BoxPlayer, self).__init__(data, year)
         self.slot_position = 'FA'
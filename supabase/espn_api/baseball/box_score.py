@@ -5,6 +5,7 @@ from .constant import STATS_MAP
 
 class BoxScore(ABC):
     ''' '''
+    __slots__ = ('winner', 'home_team', 'away_team')
     def __init__(self, data):
         self.winner = data['winner']
         
@@ -35,6 +36,8 @@ class BoxScore(ABC):
 
 class H2HCategoryBoxScore(BoxScore):
     '''Boxscore class for head to head categories leagues'''
+    __slots__ = ('home_wins', 'home_losses', 'home_ties', 'home_stats', 'away_wins', 'away_losses', 'away_ties',
+                 'away_stats')
     def __init__(self, data, pro_schedule, year, scoring_period = 0):
         super().__init__(data)
 
@@ -69,6 +72,7 @@ class H2HCategoryBoxScore(BoxScore):
 
 class H2HPointsBoxScore(BoxScore):
     '''Boxscore class for head to head points leagues'''
+    __slots__ = ('home_score', 'home_projected', 'home_lineup', 'away_score', 'away_projected', 'away_lineup')
     def __init__(self, data, pro_schedule, year, scoring_period = 0):
         super().__init__(data)
 
@@ -1,19 +1,24 @@
 from .constant import POSITION_MAP, PRO_TEAM_MAP, STATS_MAP
-from .utils import json_parsing
+from .utils import json_parsing_keys
 import pdb
 
 class Player(object):
     '''Player are part of team'''
+    __slots__ = ('name', 'playerId', 'position', 'lineupSlot', 'eligibleSlots', 'acquisitionType', 'proTeam',
+                 'injuryStatus', 'status', 'stats', 'injured', 'percent_owned', 'percent_started', 'total_points',
+                 'projected_total_points')
     def __init__(self, data, year):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.position = POSITION_MAP.get(json_parsing(data, 'defaultPositionId') - 1, json_parsing(data, 'defaultPositionId') - 1)
+        fields = json_parsing_keys(data, ('fullName', 'id', 'defaultPositionId', 'eligibleSlots', 'acquisitionType',
+                                          'proTeamId', 'injuryStatus', 'status'))
+        self.name = fields['fullName']
+        self.playerId = fields['id']
+        self.position = POSITION_MAP.get(fields['defaultPositionId'] - 1, fields['defaultPositionId'] - 1)
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP.get(pos, pos) for pos in json_parsing(data, 'eligibleSlots')]  # if position isn't in position map, just use the position id number
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP.get(json_parsing(data, 'proTeamId'), json_parsing(data, 'proTeamId'))
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
-        self.status = json_parsing(data, 'status')
+        self.eligibleSlots = [POSITION_MAP.get(pos, pos) for pos in fields['eligibleSlots']]  # if position isn't in position map, just use the position id number
+        self.acquisitionType = fields['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP.get(fields['proTeamId'], fields['proTeamId'])
+        self.injuryStatus = fields['injuryStatus']
+        self.status = fields['status']
         self.stats = {}
 
         player = data.get('playerPoolEntry', {}).get('player') or data['player']
@@ -5,6 +5,8 @@ from .constant import STATS_MAP
 
 class Team(object):
     '''Teams are part of the league'''
+    __slots__ = ('team_id', 'team_abbrev', 'team_name', 'division_id', 'division_name', 'wins', 'losses', 'ties',
+                 'logo_url', 'standing', 'final_standing', 'roster', 'schedule', 'owners')
     def __init__(self, data, roster, schedule, year, **kwargs):
         self.team_id = data['id']
         self.team_abbrev = data['abbrev']
@@ -5,6 +5,7 @@ from .box_player import BoxPlayer
 
 class BoxScore(ABC):
   ''' '''
+  __slots__ = ('winner', 'home_team', 'away_team', 'scoring_period')
   def __init__(self, data, scoring_period):
       self.winner = data.get('winner', 'UNDECIDED')
       self.home_team = data.get('home', {}).get('teamId', 0)
@@ -27,6 +28,7 @@ class BoxScore(ABC):
     return lineup
 
 class H2HPointsBoxScore(BoxScore):
+  __slots__ = ('home_score', 'home_projected', 'home_lineup', 'away_score', 'away_projected', 'away_lineup')
   def __init__(self, data, pro_schedule, by_matchup, year, scoring_period = 0):
     super().__init__(data, scoring_period)
 
@@ -51,6 +53,8 @@ class H2HPointsBoxScore(BoxScore):
     return (team_score, team_projected, lineup)
 
 class H2HCategoryBoxScore(BoxScore):
+  __slots__ = ('home_wins', 'home_ties', 'home_losses', 'home_stats', 'home_lineup', 'away_wins', 'away_ties',
+               'away_losses', 'away_stats', 'away_lineup')
   def __init__(self, data, pro_schedule, by_matchup, year, scoring_period = 0):
     super().__init__(data, scoring_period)
 
@@ -53,12 +53,9 @@ class League(BaseLeague):
         # replace opponentIds in schedule with team instances
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
-            for week, matchup in enumerate(team.schedule):
-                for opponent in self.teams:
-                    if matchup.away_team == opponent.team_id:
-                        matchup.away_team = opponent
-                    if matchup.home_team == opponent.team_id:
-                        matchup.home_team = opponent
+            for matchup in team.schedule:
+                matchup.away_team = self._teams_by_id.get(matchup.away_team, matchup.away_team)
+                matchup.home_team = self._teams_by_id.get(matchup.home_team, matchup.home_team)
 
     def standings(self) -> List[Team]:
         standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
@@ -76,12 +73,9 @@ class League(BaseLeague):
         schedule = data['schedule']
         matchups = [Matchup(matchup) for matchup in schedule if matchup['matchupPeriodId'] == matchupPeriod]
 
-        for team in self.teams:
-            for matchup in matchups:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in matchups:
+            matchup.home_team = self._teams_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._teams_by_id.get(matchup.away_team, matchup.away_team)
 
         return matchups
 
@@ -186,12 +180,9 @@ class League(BaseLeague):
         schedule = data['schedule']
         box_data = [self.BoxScoreClass(matchup, self.pro_schedule, matchup_total, self.year, scoring_id) for matchup in schedule]
 
-        for team in self.teams:
-            for matchup in box_data:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in box_data:
+            matchup.home_team = self._teams_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._teams_by_id.get(matchup.away_team, matchup.away_team)
         return box_data
 
     def player_info(self, name: str = None, playerId: Union[int, list] = None, include_news = False) -> Union[Player, List[Player]]:
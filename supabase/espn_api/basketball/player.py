@@ -1,29 +1,34 @@
 from .constant import NINE_CAT_STATS, POSITION_MAP, PRO_TEAM_MAP, STATS_MAP, STAT_ID_MAP
-from espn_api.utils.utils import json_parsing
+from espn_api.utils.utils import json_parsing_keys
 from datetime import datetime
-from functools import cached_property
 
 class Player(object):
     '''Player are part of team'''
+    __slots__ = ('name', 'playerId', 'year', 'position', 'lineupSlot', 'eligibleSlots', 'acquisitionType',
+                 'proTeam', 'injuryStatus', 'posRank', 'stats', 'schedule', 'news', 'expected_return_date',
+                 'injured', 'total_points', 'avg_points', 'projected_total_points', 'projected_avg_points', '_nine_cat_averages')
     def __init__(self, data, year, pro_team_schedule = None, news = None):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
+        fields = json_parsing_keys(data, ('fullName', 'id', 'defaultPositionId', 'eligibleSlots', 'acquisitionType',
+                                          'proTeamId', 'injuryStatus', 'positionalRanking', 'expectedReturnDate'))
+        self.name = fields['fullName']
+        self.playerId = fields['id']
         self.year = year
-        self.position = POSITION_MAP[json_parsing(data, 'defaultPositionId') - 1]
+        self.position = POSITION_MAP[fields['defaultPositionId'] - 1]
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP[pos] for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP[json_parsing(data, 'proTeamId')]
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
-        self.posRank = json_parsing(data, 'positionalRanking')
+        self.eligibleSlots = [POSITION_MAP[pos] for pos in fields['eligibleSlots']]
+        self.acquisitionType = fields['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP[fields['proTeamId']]
+        self.injuryStatus = fields['injuryStatus']
+        self.posRank = fields['positionalRanking']
         self.stats = {}
         self.schedule = {}
         self.news = {}
-        expected_return_date = json_parsing(data, 'expectedReturnDate')
+        self._nine_cat_averages = None
+        expected_return_date = fields['expectedReturnDate']
         self.expected_return_date = datetime(*expected_return_date).date() if expected_return_date else None
 
         if pro_team_schedule:
-            pro_team_id = json_parsing(data, 'proTeamId')
+            pro_team_id = fields['proTeamId']
             pro_team = pro_team_schedule.get(pro_team_id, {})
             for key in pro_team:
                 game = pro_team[key][0]
@@ -73,10 +78,13 @@ class Player(object):
         id_type = STAT_ID_MAP.get(id[:2])
         return f'{id[2:]}_{id_type}' if id_type else str(scoring_period)
 
-    @cached_property
+    @property
     def nine_cat_averages(self):
-        return {
-            k: round(v, (3 if k in {'FG%', 'FT%'} else 1))
-            for k, v in self.stats.get(f'{self.year}_total', {}).get("avg", {}).items()
-            if k in NINE_CAT_STATS
-        }
+        # computed on first read; __slots__ leaves no __dict__ for cached_property
+        if self._nine_cat_averages is None:
+            self._nine_cat_averages = {
+                k: round(v, (3 if k in {'FG%', 'FT%'} else 1))
+                for k, v in (self.stats.get(f'{self.year}_total', {}).get("avg") or {}).items()
+                if k in NINE_CAT_STATS
+            }
+        return self._nine_cat_averages
@@ -1,10 +1,12 @@
-from .constant import POSITION_MAP, PRO_TEAM_MAP, PLAYER_STATS_MAP
+from .constant import POSITION_MAP, PRO_TEAM_MAP
 from .player import Player
 from datetime import datetime, timedelta
 
 
 class BoxPlayer(Player):
     '''player with extra data from a matchup'''
+    __slots__ = ('slot_position', 'pro_opponent', 'pro_pos_rank', 'game_played', 'on_bye_week', 'week', 'points',
+                 'projected_points', 'game_date')
     def __init__(self, data, pro_schedule, positional_rankings, week, year):
         super(BoxPlayer, self).__init__(data, year)
         self.slot_position = 'FA'
@@ -28,13 +30,27 @@ class BoxPlayer(Player):
         else: # bye week
             self.on_bye_week = True
 
-        stats = self.stats.get(week, {})
-        self.points = stats.get('points', 0)
-        self.breakdown = stats.get('breakdown', {})
-        self.points_breakdown = stats.get('points_breakdown', {})
-        self.projected_points = stats.get('projected_points', 0)
-        self.projected_breakdown = stats.get('projected_breakdown', {})
-        self.projected_points_breakdown = stats.get('projected_points_breakdown', {})
+        self.week = week
+        totals = self.stats.totals(week)
+        self.points = totals.get('points', 0)
+        self.projected_points = totals.get('projected_points', 0)
+
+    # breakdowns are decoded from the raw stat splits on first read
+    @property
+    def breakdown(self):
+        return self.stats.get(self.week, {}).get('breakdown', {})
+
+    @property
+    def points_breakdown(self):
+        return self.stats.get(self.week, {}).get('points_breakdown', {})
+
+    @property
+    def projected_breakdown(self):
+        return self.stats.get(self.week, {}).get('projected_breakdown', {})
+
+    @property
+    def projected_points_breakdown(self):
+        return self.stats.get(self.week, {}).get('projected_points_breakdown', {})
 
     def __repr__(self):
         return f'Player({self.name}, points:{self.points}, projected:{self.projected_points})'
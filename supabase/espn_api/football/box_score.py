@@ -2,6 +2,8 @@ from .box_player import BoxPlayer
 
 class BoxScore(object):
     ''' '''
+    __slots__ = ('matchup_type', 'is_playoff', 'home_team', 'home_score', 'home_projected', 'home_lineup',
+                 'away_team', 'away_score', 'away_projected', 'away_lineup')
     def __init__(self, data, pro_schedule, positional_rankings, week, year):
         self.matchup_type = data.get('playoffTierType', 'NONE') 
         self.is_playoff = self.matchup_type != 'NONE'
@@ -1,8 +1,11 @@
 import json
 import random
-from typing import Callable, Dict, List, Set, Tuple, Union
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Union
 
 from ..base_league import BaseLeague
+from ..requests.cache import ResponseCache
 from .team import Team
 from .matchup import Matchup
 from .box_score import BoxScore
@@ -26,8 +29,12 @@ from .helper import (
 
 class League(BaseLeague):
     '''Creates a League instance for Public/Private ESPN league'''
-    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False):
-        super().__init__(league_id=league_id, year=year, sport='nfl', espn_s2=espn_s2, swid=swid, debug=debug)
+    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False, cache: ResponseCache = None,
+                 request_sinks: List = None):
+        super().__init__(league_id=league_id, year=year, sport='nfl', espn_s2=espn_s2, swid=swid, debug=debug, cache=cache,
+                         request_sinks=request_sinks)
+        self._positional_ratings = {}
+        self._free_agent_pools = {}
 
         if fetch_league:
             self.fetch_league()
@@ -51,10 +58,8 @@ class League(BaseLeague):
         # replace opponentIds in schedule with team instances
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
-            for week, matchup in enumerate(team.schedule):
-                for opponent in self.teams:
-                    if matchup == opponent.team_id:
-                        team.schedule[week] = opponent
+            for week, opponent_id in enumerate(team.schedule):
+                team.schedule[week] = self._teams_by_id.get(opponent_id, opponent_id)
 
         # calculate margin of victory
         for team in self.teams:
@@ -62,21 +67,31 @@ class League(BaseLeague):
                 mov = team.scores[week] - opponent.scores[week]
                 team.mov.append(mov)
 
+    def clear_cache(self):
+        super().clear_cache()
+        self._positional_ratings = {}
+        self._free_agent_pools = {}
+
     def _get_positional_ratings(self, week: int):
-        params = {
-            'view': 'mPositionalRatings',
-            'scoringPeriodId': week,
-        }
-        data = self.espn_request.league_get(params=params)
-        ratings = data.get('positionAgainstOpponent', {}).get('positionalRatings', {})
+        with self._cache_lock:
+            if week in self._positional_ratings:
+                return self._positional_ratings[week]
 
-        positional_ratings = {}
-        for pos, rating in ratings.items():
-            teams_rating = {}
-            for team, data in rating['ratingsByOpponent'].items():
-                teams_rating[team] = data['rank']
-            positional_ratings[pos] = teams_rating
-        return positional_ratings
+            params = {
+                'view': 'mPositionalRatings',
+                'scoringPeriodId': week,
+            }
+            data = self.espn_request.league_get(params=params)
+            ratings = data.get('positionAgainstOpponent', {}).get('positionalRatings', {})
+
+            positional_ratings = {}
+            for pos, rating in ratings.items():
+                teams_rating = {}
+                for team, data in rating['ratingsByOpponent'].items():
+                    teams_rating[team] = data['rank']
+                positional_ratings[pos] = teams_rating
+            self._positional_ratings[week] = positional_ratings
+            return positional_ratings
 
     def refresh(self):
         '''Gets latest league data. This can be used instead of creating a new League class each week'''
@@ -281,14 +296,14 @@ class League(BaseLeague):
         data = self.espn_request.league_get(params=params)
 
         schedule = data['schedule']
-        matchups = [Matchup(matchup) for matchup in schedule if matchup['matchupPeriodId'] == week]
+        with self.espn_request.timings.span('mMatchupScore'):
+            matchups = [Matchup(matchup) for matchup in schedule if matchup['matchupPeriodId'] == week]
 
-        for team in self.teams:
-            for matchup in matchups:
-                if matchup._home_team_id == team.team_id:
-                    matchup.home_team = team
-                elif matchup._away_team_id == team.team_id:
-                    matchup.away_team = team
+        for matchup in matchups:
+            if matchup._home_team_id in self._teams_by_id:
+                matchup.home_team = self._teams_by_id[matchup._home_team_id]
+            if matchup._away_team_id in self._teams_by_id:
+                matchup.away_team = self._teams_by_id[matchup._away_team_id]
 
         return matchups
 
@@ -318,14 +333,36 @@ class League(BaseLeague):
         schedule = data['schedule']
         pro_schedule = self._get_pro_schedule(scoring_period)
         positional_rankings = self._get_positional_ratings(scoring_period)
-        box_data = [BoxScore(matchup, pro_schedule, positional_rankings, scoring_period, self.year) for matchup in schedule]
+        with self.espn_request.timings.span('mMatchupScore'):
+            box_data = [BoxScore(matchup, pro_schedule, positional_rankings, scoring_period, self.year) for matchup in schedule]
 
-        for team in self.teams:
-            for matchup in box_data:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in box_data:
+            matchup.home_team = self._teams_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._teams_by_id.get(matchup.away_team, matchup.away_team)
+        return box_data
+
+    def box_scores_range(self, weeks: Iterable[int], max_workers: int = 4, errors: Dict[int, Exception] = None) -> Dict[int, List[BoxScore]]:
+        '''Returns {week: box scores} for several weeks fetched concurrently\n
+        A failing week is left out of the result (and recorded in errors when given)
+        so one bad week does not sink the rest'''
+        weeks = sorted(set(weeks))
+        if not weeks:
+            return {}
+
+        def fetch(week):
+            try:
+                return week, self.box_scores(week=week), None
+            except Exception as e:
+                return week, None, e
+
+        box_data = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(weeks)))) as executor:
+            for week, box_scores, error in executor.map(fetch, weeks):
+                if error is not None:
+                    if errors is not None:
+                        errors[week] = error
+                    continue
+                box_data[week] = box_scores
         return box_data
 
     def power_rankings(self, week: int=None):
@@ -378,7 +415,74 @@ class League(BaseLeague):
         pro_schedule = self._get_pro_schedule(week)
         positional_rankings = self._get_positional_ratings(week)
 
-        return [BoxPlayer(player, pro_schedule, positional_rankings, week, self.year) for player in players]
+        with self.espn_request.timings.span('kona_player_info'):
+            return [BoxPlayer(player, pro_schedule, positional_rankings, week, self.year) for player in players]
+
+    def free_agent_pool(self, week: int = None, positions: Iterable[str] = ('QB', 'RB', 'WR', 'TE', 'K', 'D/ST'),
+                        size: int = 250, page_size: int = 500) -> Dict[str, List[BoxPlayer]]:
+        '''Returns {position: free agents} for several positions from combined slot filters
+
+        Pages through the pool (page_size players per request, best owned first) with one slot filter
+        for the positions still short of size players, so a position stops at min(size, available).
+        Each position's list matches what free_agents(position=...) would return. Pools are memoized
+        per scoring period: later calls only fetch positions (or players) not fetched yet'''
+        if self.year < 2019:
+            raise Exception('Cant use free agents before 2019')
+        if not week:
+            week = self.current_week
+        positions = [position for position in positions if position in POSITION_MAP]
+
+        # position -> stream: the players one slot filter returned so far (a prefix of that filter's
+        # ordering, so also of each of its positions') and whether the filter ran out
+        with self._cache_lock:
+            streams = dict(self._free_agent_pools.get(week, {}))
+
+        def eligible(player, slots):
+            return any(slot in player.eligibleSlots for slot in slots)
+
+        def short(position):
+            stream = streams.get(position)
+            if stream is None:
+                return True
+            return not stream['exhausted'] and sum(position in player.eligibleSlots for player in stream['players']) < size
+
+        fetched = {}
+        pending = [position for position in positions if short(position)]
+        if pending:
+            pro_schedule = self._get_pro_schedule(week)
+            positional_rankings = self._get_positional_ratings(week)
+            params = {
+                'view': 'kona_player_info',
+                'scoringPeriodId': week,
+            }
+        while pending:
+            # positions that share a stream page together; filtering a stream down to some of its
+            # positions keeps it a prefix of the narrower filter's ordering
+            groups = {}
+            for position in pending:
+                groups.setdefault(id(streams.get(position)), []).append(position)
+            for group in groups.values():
+                old = streams.get(group[0])
+                stream = {
+                    'players': [player for player in old['players'] if eligible(player, group)] if old else [],
+                    'exhausted': False,
+                }
+                slot_filter = sorted(POSITION_MAP[position] for position in group)
+                filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter},"limit":page_size,"offset":len(stream['players']),"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
+                headers = {'x-fantasy-filter': json.dumps(filters)}
+                players = self.espn_request.league_get(params=params, headers=headers)['players']
+                with self.espn_request.timings.span('kona_player_info'):
+                    stream['players'].extend(BoxPlayer(player, pro_schedule, positional_rankings, week, self.year) for player in players)
+                stream['exhausted'] = len(players) < page_size
+                for position in group:
+                    streams[position] = fetched[position] = stream
+            pending = [position for position in pending if short(position)]
+        if fetched:
+            with self._cache_lock:
+                self._free_agent_pools.setdefault(week, {}).update(fetched)
+
+        return {position: [player for player in streams[position]['players'] if position in player.eligibleSlots][:size]
+                for position in positions}
 
     def player_info(self, name: str = None, playerId: Union[int, list] = None) -> Union[Player, List[Player]]:
         ''' Returns Player class if name found '''
@@ -397,6 +501,50 @@ class League(BaseLeague):
         if len(data['players']) > 1:
             return [Player(player, self.year, pro_schedule) for player in data['players']]
 
+    def player_cards(self, playerIds: Iterable[int], chunk_size: int = 40, max_workers: int = 4,
+                     errors: Dict[int, Exception] = None, target_seconds: float = 1.0) -> Dict[int, Player]:
+        '''Returns {playerId: Player} for many players, fetched as concurrent player card requests
+
+        Chunks start at chunk_size ids and grow or shrink (between a quarter and four times chunk_size)
+        so each request takes about target_seconds; target_seconds=None keeps every chunk at chunk_size.
+        Ids in a failing chunk are left out of the result (and recorded in errors when given)'''
+        pending = list(dict.fromkeys(playerIds))
+        if not pending:
+            return {}
+        pro_schedule = self._get_all_pro_schedule()
+        min_size, max_size = max(1, chunk_size // 4), max(1, chunk_size * 4)
+
+        def fetch(chunk):
+            start = time.perf_counter()
+            try:
+                cards = self.espn_request.iter_player_cards(chunk, self.finalScoringPeriod)
+                players = [Player(player, self.year, pro_schedule) for player in cards]
+                return chunk, players, time.perf_counter() - start, None
+            except Exception as e:
+                return chunk, None, time.perf_counter() - start, e
+
+        cards = {}
+        size = max(1, chunk_size)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            running = set()
+            while pending or running:
+                while pending and len(running) < max(1, max_workers):
+                    running.add(executor.submit(fetch, pending[:size]))
+                    pending = pending[size:]
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk, players, elapsed, error = future.result()
+                    if error is not None:
+                        if errors is not None:
+                            errors.update({playerId: error for playerId in chunk})
+                        continue
+                    for player in players:
+                        cards[player.playerId] = player
+                    # scale the next chunk toward target_seconds per request
+                    if target_seconds and elapsed > 0:
+                        size = min(max_size, max(min_size, int(len(chunk) * target_seconds / elapsed)))
+        return cards
+
     def message_board(self, msg_types: List[str] = None):
         ''' Returns a list of league messages'''
         data = self.espn_request.get_league_message_board(msg_types)
@@ -2,6 +2,8 @@ from .team import Team
 
 class Matchup(object):
     '''Creates Matchup instance'''
+    __slots__ = ('matchup_type', 'is_playoff', '_home_team_id', 'home_score', '_away_team_id', 'away_score',
+                 'home_team', 'away_team')
     def __init__(self, data):
         self.matchup_type = data.get('playoffTierType', 'NONE')
         self.is_playoff = self.matchup_type != 'NONE'
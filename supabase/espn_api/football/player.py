@@ -1,31 +1,173 @@
 from .constant import POSITION_MAP, PRO_TEAM_MAP, PLAYER_STATS_MAP
-from .utils import json_parsing
+from .utils import json_parsing_keys
 from datetime import datetime
 
+
+def _decode_splits(splits):
+    '''builds one scoring period's stats from its raw ESPN stat splits'''
+    period_stats = {}
+    for stats in splits:
+        # real game stats (number of yards, number of passes, etc)- PLAYER_MAP may not be quite correct
+        breakdown = {PLAYER_STATS_MAP.get(int(k), k):v for (k,v) in stats.get('stats', {}).items()}
+        # fantasy stats (points per td, ppr, points per yard bucket)
+        points_breakdown = {PLAYER_STATS_MAP.get(int(k), k):v for (k,v) in stats.get('appliedStats', {}).items()}
+
+        points = round(stats.get('appliedTotal', 0), 2)
+        avg_points = round(stats.get('appliedAverage', 0), 2)
+        (points_type, breakdown_type, points_breakdown_type, avg_type) = ('points', 'breakdown', 'points_breakdown', 'avg_points') if stats.get('statSourceId') == 0 else ('projected_points', 'projected_breakdown', 'projected_points_breakdown', 'projected_avg_points')
+        period_stats[points_type] = points
+        period_stats[breakdown_type] = breakdown
+        period_stats[points_breakdown_type] = points_breakdown
+        period_stats[avg_type] = avg_points
+    return period_stats
+
+
+# placeholder value for a period whose splits are not decoded yet
+_UNDECODED = object()
+
+
+class PlayerStats(dict):
+    '''scoring period -> stats dict, decoded from the raw ESPN splits the first time a period is read.
+    Every period is a real key from the start (len, iteration order and json.dumps see it);
+    its value is a placeholder until decoded, so reads of values go through _decode'''
+    def __init__(self, splits):
+        super(PlayerStats, self).__init__(dict.fromkeys(splits, _UNDECODED))
+        self._raw = splits
+
+    def totals(self, period):
+        '''points and average points for a period without decoding its breakdowns'''
+        if period not in self._raw:
+            return dict.get(self, period, {})
+        totals = {}
+        for stats in self._raw[period]:
+            (points_type, avg_type) = ('points', 'avg_points') if stats.get('statSourceId') == 0 else ('projected_points', 'projected_avg_points')
+            totals[points_type] = round(stats.get('appliedTotal', 0), 2)
+            totals[avg_type] = round(stats.get('appliedAverage', 0), 2)
+        return totals
+
+    def _decode(self, period):
+        period_stats = _decode_splits(self._raw.pop(period))
+        dict.__setitem__(self, period, period_stats)
+        return period_stats
+
+    def _decode_all(self):
+        for period in list(self._raw):
+            self._decode(period)
+        return self
+
+    def __getitem__(self, period):
+        if period in self._raw:
+            return self._decode(period)
+        return dict.__getitem__(self, period)
+
+    def get(self, period, default=None):
+        if period in self._raw:
+            return self._decode(period)
+        return dict.get(self, period, default)
+
+    def __iter__(self):
+        # overriding __iter__ makes dict(stats), {**stats} and dict.update(stats) copy
+        # through keys() and __getitem__ instead of the placeholder values
+        return dict.__iter__(self)
+
+    def values(self):
+        return dict.values(self._decode_all())
+
+    def items(self):
+        return dict.items(self._decode_all())
+
+    def copy(self):
+        return dict(dict.items(self._decode_all()))
+
+    def __eq__(self, other):
+        if isinstance(other, PlayerStats):
+            other._decode_all()
+        return dict.__eq__(self._decode_all(), other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return dict.__repr__(self._decode_all())
+
+    def __or__(self, other):
+        return self.copy() | other
+
+    def __ror__(self, other):
+        return other | self.copy()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __setitem__(self, period, value):
+        self._raw.pop(period, None)
+        dict.__setitem__(self, period, value)
+
+    def __delitem__(self, period):
+        self._raw.pop(period, None)
+        dict.__delitem__(self, period)
+
+    def pop(self, period, *default):
+        if period in self._raw:
+            self._decode(period)
+        return dict.pop(self, period, *default)
+
+    def popitem(self):
+        period, value = dict.popitem(self)
+        if period in self._raw:
+            value = _decode_splits(self._raw.pop(period))
+        return period, value
+
+    def setdefault(self, period, default=None):
+        if period not in self:
+            self[period] = default
+        return self[period]
+
+    def update(self, *args, **kwargs):
+        for period, value in dict(*args, **kwargs).items():
+            self[period] = value
+
+    def clear(self):
+        self._raw.clear()
+        dict.clear(self)
+
+    def __reduce__(self):
+        return (dict, (dict(dict.items(self._decode_all())),))
+
+
 class Player(object):
     '''Player are part of team'''
+    __slots__ = ('name', 'playerId', 'posRank', 'eligibleSlots', 'acquisitionType', 'proTeam', 'jersey',
+                 'injuryStatus', 'onTeamId', 'lineupSlot', 'schedule', 'injured', 'percent_owned',
+                 'percent_started', 'active_status', 'stats', 'total_points', 'projected_total_points',
+                 'avg_points', 'projected_avg_points', 'position')
     def __init__(self, data, year, pro_team_schedule = None):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.posRank = json_parsing(data, 'positionalRanking')
-        self.eligibleSlots = [POSITION_MAP[pos] for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP[json_parsing(data, 'proTeamId')]
-        self.jersey = json_parsing(data, 'jersey')
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
-        self.onTeamId = json_parsing(data, 'onTeamId')
+        fields = json_parsing_keys(data, ('fullName', 'id', 'positionalRanking', 'eligibleSlots', 'acquisitionType',
+                                          'proTeamId', 'jersey', 'injuryStatus', 'onTeamId'))
+        self.name = fields['fullName']
+        self.playerId = fields['id']
+        self.posRank = fields['positionalRanking']
+        self.eligibleSlots = [POSITION_MAP[pos] for pos in fields['eligibleSlots']]
+        self.acquisitionType = fields['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP[fields['proTeamId']]
+        self.jersey = fields['jersey']
+        self.injuryStatus = fields['injuryStatus']
+        self.onTeamId = fields['onTeamId']
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.stats = {}
         self.schedule = {}
 
         # Get players main position
-        for pos in json_parsing(data, 'eligibleSlots'):
+        for pos in fields['eligibleSlots']:
             if (pos != 25 and '/' not in POSITION_MAP[pos]) or '/' in self.name:
                 self.position = POSITION_MAP[pos]
                 break
 
         if pro_team_schedule:
-            pro_team_id = json_parsing(data, 'proTeamId')
+            pro_team_id = fields['proTeamId']
             pro_team = pro_team_schedule.get(pro_team_id, {})
             for key in pro_team:
                 game = pro_team[key][0]
@@ -40,39 +182,19 @@ class Player(object):
         self.percent_started = round(player.get('ownership', {}).get('percentStarted', -1), 2)
 
         self.active_status = 'bye'
-        player_stats = player.get('stats', [])
-        for stats in player_stats:
+        splits = {}
+        for stats in player.get('stats', []):
             if stats.get('seasonId') != year or stats.get('statSplitTypeId') == 2:
                 continue
-
-            # real game stats (number of yards, number of passes, etc)- PLAYER_MAP may not be quite correct
-            stats_breakdown = stats.get('stats', {})
-            breakdown = {PLAYER_STATS_MAP.get(int(k), k):v for (k,v) in stats_breakdown.items()}
-            # fantasy stats (points per td, ppr, points per yard bucket)
-            applied_stats = stats.get('appliedStats', {})
-            points_breakdown = {PLAYER_STATS_MAP.get(int(k), k):v for (k,v) in applied_stats.items()}
-
-            points = round(stats.get('appliedTotal', 0), 2)
-            avg_points = round(stats.get('appliedAverage', 0), 2)
-            scoring_period = stats.get('scoringPeriodId')
-            stat_source = stats.get('statSourceId')
-            (points_type, breakdown_type, points_breakdown_type, avg_type) = ('points', 'breakdown', 'points_breakdown', 'avg_points') if stat_source == 0 else ('projected_points', 'projected_breakdown', 'projected_points_breakdown', 'projected_avg_points')
-            if self.stats.get(scoring_period):
-                self.stats[scoring_period][points_type] = points
-                self.stats[scoring_period][breakdown_type] = breakdown
-                self.stats[scoring_period][points_breakdown_type] = points_breakdown
-                self.stats[scoring_period][avg_type] = avg_points
-            else:
-                self.stats[scoring_period] = {points_type: points, breakdown_type: breakdown, points_breakdown_type: points_breakdown, avg_type: avg_points}
-            if not stat_source:
-                if not self.stats[scoring_period][breakdown_type]:
-                    self.active_status = 'inactive'
-                else:
-                    self.active_status = 'active'
-        self.total_points = self.stats.get(0, {}).get('points', 0)
-        self.projected_total_points = self.stats.get(0, {}).get('projected_points', 0)
-        self.avg_points = self.stats.get(0, {}).get('avg_points', 0)
-        self.projected_avg_points = self.stats.get(0, {}).get('projected_avg_points', 0)
+            splits.setdefault(stats.get('scoringPeriodId'), []).append(stats)
+            if not stats.get('statSourceId'):
+                self.active_status = 'active' if stats.get('stats') else 'inactive'
+        self.stats = PlayerStats(splits)
+        season = self.stats.totals(0)
+        self.total_points = season.get('points', 0)
+        self.projected_total_points = season.get('projected_points', 0)
+        self.avg_points = season.get('avg_points', 0)
+        self.projected_avg_points = season.get('projected_avg_points', 0)
 
     def __repr__(self):
         return f'Player({self.name})'
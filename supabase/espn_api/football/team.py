@@ -3,6 +3,11 @@ from .constant import PLAYER_STATS_MAP
 
 class Team(object):
     '''Teams are part of the league'''
+    __slots__ = ('team_id', 'team_abbrev', 'team_name', 'division_id', 'division_name', 'wins', 'losses', 'ties',
+                 'points_for', 'points_against', 'acquisitions', 'acquisition_budget_spent', 'drops', 'trades',
+                 'move_to_ir', 'playoff_pct', 'draft_projected_rank', 'streak_length', 'streak_type', 'standing',
+                 'final_standing', 'waiver_rank', 'roster', 'schedule', 'scores', 'outcomes', 'mov', 'owners',
+                 'stats', 'logo_url')
     def __init__(self, data, roster, schedule, year, **kwargs):
         self.team_id = data['id']
         self.team_abbrev = data['abbrev']
@@ -3,6 +3,8 @@ from espn_api.hockey.box_player import BoxPlayer
 
 class BoxScore(object):
     ''' '''
+    __slots__ = ('winner', 'home_team', 'home_projected', 'home_lineup', 'away_team', 'away_score', 'away_lineup',
+                 'away_projected', 'home_score')
     def __init__(self, data, pro_schedule, by_matchup):
         self.winner = data['winner']
         self.home_team = data['home']['teamId']
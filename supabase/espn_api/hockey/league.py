@@ -50,12 +50,9 @@ class League(BaseLeague):
         # replace opponentIds in schedule with team instances
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
-            for week, matchup in enumerate(team.schedule):
-                for opponent in self.teams:
-                    if matchup.away_team == opponent.team_id:
-                        matchup.away_team = opponent
-                    if matchup.home_team == opponent.team_id:
-                        matchup.home_team = opponent
+            for matchup in team.schedule:
+                matchup.away_team = self._teams_by_id.get(matchup.away_team, matchup.away_team)
+                matchup.home_team = self._teams_by_id.get(matchup.home_team, matchup.home_team)
 
 
     def standings(self) -> List[Team]:
@@ -76,12 +73,9 @@ class League(BaseLeague):
         schedule = data['schedule']
         matchups = [Matchup(matchup) for matchup in schedule if matchup['matchupPeriodId'] == matchupPeriod]
 
-        for team in self.teams:
-            for matchup in matchups:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in matchups:
+            matchup.home_team = self._teams_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._teams_by_id.get(matchup.away_team, matchup.away_team)
 
         return matchups
 
@@ -175,11 +169,8 @@ class League(BaseLeague):
         pro_schedule = self._get_pro_schedule(scoring_id)
         box_data = [BoxScore(matchup, pro_schedule, matchup_total) for matchup in schedule]
 
-        for team in self.teams:
-            for matchup in box_data:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in box_data:
+            matchup.home_team = self._teams_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._teams_by_id.get(matchup.away_team, matchup.away_team)
         return box_data
 
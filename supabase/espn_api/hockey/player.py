@@ -1,20 +1,23 @@
-from espn_api.utils.utils import json_parsing
+from espn_api.utils.utils import json_parsing_keys
 from .constant import POSITION_MAP, STATS_MAP, PRO_TEAM_MAP, STATS_IDENTIFIER
 
 
 class Player(object):
+    __slots__ = ('name', 'playerId', 'position', 'lineupSlot', 'eligibleSlots', 'acquisitionType', 'proTeam',
+                 'injuryStatus', 'stats', 'injured')
 
     def __init__(self, data):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.position = POSITION_MAP.get(json_parsing(data, 'defaultPositionId') - 1
-                                         if json_parsing(data, 'defaultPositionId') and json_parsing(data, 'defaultPositionId') <= 3 
-                                         else json_parsing(data, 'defaultPositionId'), '')
+        fields = json_parsing_keys(data, ('fullName', 'id', 'defaultPositionId', 'eligibleSlots', 'acquisitionType',
+                                          'proTeamId', 'injuryStatus'))
+        self.name = fields['fullName']
+        self.playerId = fields['id']
+        position_id = fields['defaultPositionId']
+        self.position = POSITION_MAP.get(position_id - 1 if position_id and position_id <= 3 else position_id, '')
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP.get(pos, '') for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP.get(json_parsing(data, 'proTeamId'), 'Unknown Team')
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
+        self.eligibleSlots = [POSITION_MAP.get(pos, '') for pos in fields['eligibleSlots']]
+        self.acquisitionType = fields['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP.get(fields['proTeamId'], 'Unknown Team')
+        self.injuryStatus = fields['injuryStatus']
         self.stats = {}
 
         '''
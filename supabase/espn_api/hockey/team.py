@@ -5,6 +5,9 @@ from .player import Player
 
 class Team(object):
     '''Teams are part of the league'''
+    __slots__ = ('team_id', 'team_abbrev', 'team_name', 'division_id', 'division_name', 'wins', 'losses', 'ties',
+                 'owner', 'logo_url', 'stats', 'standing', 'final_standing', 'roster', 'schedule', 'year',
+                 'owners')
 
     def __init__(self, data, roster, schedule, year, **kwargs):
         self.team_id = data['id']
@@ -1,3 +1,4 @@
-__all__ = ['EspnFantasyRequests']
+__all__ = ['EspnFantasyRequests', 'ResponseCache']
 
-from .espn_requests import EspnFantasyRequests
\ No newline at end of file
+from .espn_requests import EspnFantasyRequests
+from .cache import ResponseCache
\ No newline at end of file
@@ -0,0 +1,160 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .constant import CACHE_CORRECTION_PERIODS, CACHE_DEFAULT_TTL, CACHE_SETTLED_TTL, CACHE_VIEW_TTLS
+
+
+def _views(params: dict) -> list:
+    view = (params or {}).get('view', [])
+    return view if isinstance(view, list) else [view]
+
+
+class ResponseCache(object):
+    '''Opt-in on-disk cache for ESPN GET responses.
+    Bodies are stored gzip compressed next to a small json metadata file.
+    Entries for completed seasons never expire. Scoring periods older than the
+    correction window expire after settled_ttl; the rest expire per view. Stale
+    entries are revalidated with If-None-Match/If-Modified-Since when ESPN sent validators.'''
+    def __init__(self, directory: str, view_ttls: dict = None, default_ttl: int = CACHE_DEFAULT_TTL,
+                 correction_periods: int = CACHE_CORRECTION_PERIODS, settled_ttl: int = CACHE_SETTLED_TTL):
+        self.directory = directory
+        self.view_ttls = dict(CACHE_VIEW_TTLS, **(view_ttls or {}))
+        self.default_ttl = default_ttl
+        self.correction_periods = correction_periods
+        self.settled_ttl = settled_ttl
+        self.stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stores': 0, 'bytes_saved': 0}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self):
+        return f'ResponseCache({self.directory})'
+
+    def key(self, endpoint: str, params: dict = None, headers: dict = None, cookies: dict = None) -> str:
+        '''Hashes the endpoint, params, fantasy filter and cookie identity (never the raw cookies)'''
+        identity = hashlib.sha256(json.dumps(cookies or {}, sort_keys=True).encode()).hexdigest()
+        parts = {
+            'endpoint': endpoint,
+            'params': params or {},
+            'filter': (headers or {}).get('x-fantasy-filter', ''),
+            'identity': identity,
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+    def ttl(self, params: dict = None, live_scoring_period: int = None, season_complete: bool = False) -> Optional[int]:
+        '''Seconds an entry stays fresh, None when the data can no longer change'''
+        if season_complete:
+            return None
+        scoring_period = (params or {}).get('scoringPeriodId')
+        if scoring_period is not None and live_scoring_period is not None and \
+                int(scoring_period) < live_scoring_period - self.correction_periods:
+            return self.settled_ttl
+        ttls = [self.view_ttls[view] for view in _views(params) if view in self.view_ttls]
+        return min(ttls) if ttls else self.default_ttl
+
+    def _paths(self, key: str):
+        return os.path.join(self.directory, key + '.json'), os.path.join(self.directory, key + '.gz')
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._lock:
+            self.stats[stat] += amount
+
+    def load(self, key: str):
+        '''Returns (meta, body) for a stored entry or (None, None)'''
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = gzip.decompress(f.read())
+        except (OSError, ValueError, EOFError):
+            return None, None
+        return meta, body
+
+    def is_fresh(self, meta: dict) -> bool:
+        return meta['ttl'] is None or time.time() - meta['stored_at'] < meta['ttl']
+
+    def validators(self, meta: dict) -> dict:
+        '''Conditional request headers for a stale entry'''
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, key: str, response: requests.Response, ttl: Optional[int]) -> None:
+        meta = {
+            'url': response.url,
+            'stored_at': time.time(),
+            'ttl': ttl,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type', 'application/json'),
+            'size': len(response.content),
+        }
+        self._write(key, meta, gzip.compress(response.content))
+        self._count('stores')
+
+    def touch(self, key: str, meta: dict, ttl: Optional[int]) -> None:
+        '''Restarts the freshness window of an entry ESPN confirmed as unchanged'''
+        meta = dict(meta, stored_at=time.time(), ttl=ttl)
+        meta_path, _ = self._paths(key)
+        self._atomic_write(meta_path, json.dumps(meta).encode())
+
+    def _write(self, key: str, meta: dict, compressed: bytes) -> None:
+        meta_path, body_path = self._paths(key)
+        self._atomic_write(body_path, compressed)
+        self._atomic_write(meta_path, json.dumps(meta).encode())
+
+    def _atomic_write(self, path: str, data: bytes) -> None:
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def response(self, meta: dict, body: bytes) -> requests.Response:
+        '''Builds a 200 response from a cached body'''
+        r = requests.Response()
+        r.status_code = 200
+        r.url = meta.get('url', '')
+        r.encoding = 'utf-8'
+        r.headers = CaseInsensitiveDict({'Content-Type': meta.get('content_type', 'application/json')})
+        r._content = body
+        r._content_consumed = True
+        return r
+
+    def get(self, session: requests.Session, endpoint: str, params: dict = None, headers: dict = None,
+            cookies: dict = None, timeout=None, live_scoring_period: int = None, season_complete: bool = False) -> requests.Response:
+        '''Serves a request from disk when fresh, otherwise fetches (or revalidates) and stores it'''
+        key = self.key(endpoint, params, headers, cookies)
+        ttl = self.ttl(params, live_scoring_period, season_complete)
+        meta, body = self.load(key)
+
+        if meta is not None and self.is_fresh(meta):
+            self._count('hits')
+            self._count('bytes_saved', len(body))
+            return self.response(meta, body)
+
+        request_headers = dict(headers or {})
+        if meta is not None:
+            request_headers.update(self.validators(meta))
+        r = session.get(endpoint, params=params, headers=request_headers, cookies=cookies, timeout=timeout)
+
+        if r.status_code == 304 and meta is not None:
+            self.touch(key, meta, ttl)
+            self._count('revalidated')
+            self._count('bytes_saved', len(body))
+            return self.response(meta, body)
+
+        self._count('misses')
+        if r.status_code == 200:
+            self.store(key, r, ttl)
+        return r
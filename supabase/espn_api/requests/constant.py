@@ -6,4 +6,37 @@ FANTASY_SPORTS = {
     'nhl' : 'fhl',
     'mlb' : 'flb',
     'wnba' : 'wfba'
-}
\ No newline at end of file
+}
+# connection pool size per sport/season session and (connect, read) timeout in seconds
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = (5, 30)
+
+# response cache time-to-live in seconds by view; only completed seasons never expire
+CACHE_DEFAULT_TTL = 60 * 60
+# scoring periods before the live one that still take stat corrections and keep the view TTLs
+CACHE_CORRECTION_PERIODS = 1
+# older scoring periods rarely change; they are revalidated this often
+CACHE_SETTLED_TTL = 7 * 24 * 60 * 60
+CACHE_VIEW_TTLS = {
+    'mMatchupScore': 60,
+    'mScoreboard': 60,
+    'mRoster': 5 * 60,
+    'kona_player_info': 15 * 60,
+    'kona_league_communication': 5 * 60,
+    'mTransactions2': 5 * 60,
+    'proTeamSchedules_wl': 24 * 60 * 60,
+    'players_wl': 24 * 60 * 60,
+}
+
+# requests per second and burst of the token bucket shared by every session in the process (None = unlimited)
+RATE_LIMIT_PER_SECOND = 8
+RATE_LIMIT_BURST = 16
+# retry policy by endpoint class (see throttle.endpoint_class); delays are seconds and
+# jittered exponential up to max_delay, unless the response sends Retry-After
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_POLICIES = {
+    'league': {'retries': 4, 'base_delay': 0.5, 'max_delay': 30},
+    'players': {'retries': 3, 'base_delay': 1, 'max_delay': 60},
+    'season': {'retries': 3, 'base_delay': 1, 'max_delay': 60},
+    'news': {'retries': 1, 'base_delay': 1, 'max_delay': 10},
+}
@@ -1,8 +1,19 @@
 import requests
+import copy
 import json
-from .constant import FANTASY_BASE_ENDPOINT, NEWS_BASE_ENDPOINT, FANTASY_SPORTS
-from ..utils.logger import Logger
-from typing import List
+import threading
+import time
+from .constant import FANTASY_BASE_ENDPOINT, NEWS_BASE_ENDPOINT, FANTASY_SPORTS, DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT
+from .session import get_session, connection_stats, take_request_stats
+from .cache import ResponseCache
+from ..utils.logger import Logger, request_view
+from ..utils.timing import RequestTimings
+from typing import Iterator, List
+
+try:
+    import ijson
+except ImportError:  # optional: without it streamed views fall back to one full r.json()
+    ijson = None
 
 
 class ESPNAccessDenied(Exception):
@@ -17,8 +28,68 @@ class ESPNUnknownError(Exception):
     pass
 
 
+class ESPNRateLimited(ESPNUnknownError):
+    '''ESPN kept answering 429 after every retry'''
+    pass
+
+
+class _ResponseReader(object):
+    '''File-like read() over a response body, pulled chunk by chunk for ijson'''
+    def __init__(self, response: requests.Response, chunk_size: int = 64 * 1024):
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        self._buffer = b''
+        self.bytes_read = 0
+        # time spent waiting on the body, as opposed to parsing it
+        self.read_ms = 0.0
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            start = time.perf_counter()
+            chunk = next(self._chunks, None)
+            self.read_ms += (time.perf_counter() - start) * 1000
+            if chunk is None:
+                break
+            self.bytes_read += len(chunk)
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _items_at(document, prefix: str):
+    '''Yields what an ijson prefix ('item', 'players.item', ...) selects from a decoded document'''
+    values = [document]
+    for key in prefix.split('.'):
+        if key == 'item':
+            values = [item for value in values if isinstance(value, list) for item in value]
+        else:
+            values = [value[key] for value in values if isinstance(value, dict) and key in value]
+    return iter(values)
+
+
+class _Flight(object):
+    '''A request in progress that identical concurrent calls wait on instead of sending again'''
+    __slots__ = ('done', 'response', 'error', 'followers')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+        self.followers = 0
+
+
+def _request_key(endpoint: str, params: dict = None, headers: dict = None) -> str:
+    '''Canonical form of a request, so the same params and filter in any key order match'''
+    headers = dict(headers or {})
+    if 'x-fantasy-filter' in headers:
+        headers['x-fantasy-filter'] = json.loads(headers['x-fantasy-filter'])
+    return json.dumps([endpoint, params or {}, headers], sort_keys=True, default=str)
+
+
 class EspnFantasyRequests(object):
-    def __init__(self, sport: str, year: int, league_id: int, cookies: dict = None, logger: Logger = None):
+    def __init__(self, sport: str, year: int, league_id: int, cookies: dict = None, logger: Logger = None,
+                 pool_size: int = DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, cache: ResponseCache = None):
         if sport not in FANTASY_SPORTS:
             raise Exception(f'Unknown sport: {sport}, available options are {FANTASY_SPORTS.keys()}')
         self.year = year
@@ -27,6 +98,18 @@ class EspnFantasyRequests(object):
         self.NEWS_ENDPOINT = NEWS_BASE_ENDPOINT + FANTASY_SPORTS[sport] + '/news/' + 'players'
         self.cookies = cookies
         self.logger = logger
+        self.timeout = timeout
+        self.session = get_session(sport, year, pool_size)
+        self.cache = cache
+        # per-view request phase totals, see utils.timing
+        self.timings = RequestTimings()
+        # single-flight: canonical request key -> _Flight of the call currently fetching it
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+        self._coalesced = {'calls': 0, 'deduplicated': 0, 'by_view': {}}
+        # set by the league once known, used to decide which cached views can never change
+        self.live_scoring_period = None
+        self.season_complete = False
 
         self.LEAGUE_ENDPOINT = FANTASY_BASE_ENDPOINT + FANTASY_SPORTS[sport]
         # older season data is stored at a different endpoint
@@ -48,11 +131,11 @@ class EspnFantasyRequests(object):
                 self.LEAGUE_ENDPOINT = f"{base_endpoint}/leagueHistory/{self.league_id}?seasonId={self.year}"
 
             #try the alternate endpoint
-            r = requests.get(self.LEAGUE_ENDPOINT + extend, params=params, headers=headers, cookies=self.cookies)
+            r, spans = self._fetch(self.LEAGUE_ENDPOINT + extend, params=params, headers=headers)
 
             if r.status_code == 200:
                 # Return the updated response if alternate works
-                return r.json()
+                return self._json(r, self.LEAGUE_ENDPOINT + extend, params, headers, spans)
 
             # If all endpoints failed, raise the corresponding error
             if not self.cookies or 'espn_s2' not in self.cookies or 'SWID' not in self.cookies:
@@ -63,41 +146,179 @@ class EspnFantasyRequests(object):
         elif status == 404:
             raise ESPNInvalidLeague(f"League {self.league_id} does not exist")
 
+        elif status == 429:
+            raise ESPNRateLimited("ESPN returned HTTP 429 (rate limited) after retrying")
+
         elif status != 200:
             raise ESPNUnknownError(f"ESPN returned an HTTP {status}")
 
         # If no issues with the status code, return None
         return None
 
+    def _get(self, endpoint: str, params: dict = None, headers: dict = None, stream: bool = False) -> requests.Response:
+        '''Sends a GET over the shared keep-alive session, through the disk cache when enabled.
+        stream=True leaves the body unread for iter_content (cached responses are already in memory)'''
+        if self.cache:
+            return self.cache.get(self.session, endpoint, params=params, headers=headers, cookies=self.cookies, timeout=self.timeout,
+                                  live_scoring_period=self.live_scoring_period, season_complete=self.season_complete)
+        return self.session.get(endpoint, params=params, headers=headers, cookies=self.cookies, timeout=self.timeout, stream=stream)
+
+    def _fetch(self, endpoint: str, params: dict = None, headers: dict = None, stream: bool = False):
+        '''_get plus the connect/ttfb/download split of the request, returned as (response, spans)'''
+        take_request_stats()
+        start = time.perf_counter()
+        r = self._get(endpoint, params=params, headers=headers, stream=stream)
+        fetched_ms = (time.perf_counter() - start) * 1000
+        stats = take_request_stats()
+        # elapsed runs from handing the request to the adapter to parsing the headers, so it includes
+        # rate limiter waits, retries and connecting (zero for cached/replayed responses)
+        headers_ms = r.elapsed.total_seconds() * 1000 if r.elapsed else 0.0
+        spans = {
+            'start': start,
+            'wait_ms': stats['throttle_ms'],
+            'connect_ms': stats['connect_ms'],
+            'ttfb_ms': max(headers_ms - stats['throttle_ms'] - stats['connect_ms'], 0.0),
+            'download_ms': max(fetched_ms - headers_ms, 0.0),
+            'retries': stats['retries'],
+        }
+        return r, spans
+
+    def _record(self, r: requests.Response, endpoint: str, params: dict, headers: dict, spans: dict, response, nbytes: int):
+        '''Adds a finished request to the per-view timings and hands it to the logger'''
+        total_ms = (time.perf_counter() - spans.pop('start')) * 1000
+        self.timings.add(request_view(params, endpoint), nbytes=nbytes, total_ms=total_ms, **spans)
+        if self.logger and self.logger.enabled:
+            decode_ms = spans.pop('decode_ms')
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=response, status=r.status_code,
+                                    nbytes=nbytes, decode_ms=decode_ms, total_ms=total_ms, spans=spans)
+
+    def _iter_items(self, endpoint: str, prefix: str, params: dict = None, headers: dict = None, extend: str = None) -> Iterator:
+        '''Yields the values at an ijson prefix one by one without decoding the whole document.
+        extend is set for league endpoints, which may retry on the alternate league endpoint'''
+        r, spans = self._fetch(endpoint, params=params, headers=headers, stream=ijson is not None)
+        try:
+            if extend is not None:
+                alternate_response = self.checkRequestStatus(r.status_code, extend=extend, params=params, headers=headers)
+                if alternate_response:
+                    # league_get semantics: a leagueHistory list answer means its first element
+                    if isinstance(alternate_response, list):
+                        alternate_response = alternate_response[0]
+                    yield from _items_at(alternate_response, prefix[len('item.'):] if prefix.startswith('item.') else prefix)
+                    return
+            else:
+                self.checkRequestStatus(r.status_code)
+
+            # the caller builds its objects between items, so time outside the parser is build time
+            count = 0
+            parse = 0.0
+            build = 0.0
+            reader = _ResponseReader(r) if ijson else None
+            mark = time.perf_counter()
+            items = ijson.items(reader, prefix, use_float=True) if ijson else _items_at(r.json(), prefix)
+            for item in items:
+                now = time.perf_counter()
+                parse += now - mark
+                count += 1
+                yield item
+                mark = time.perf_counter()
+                build += mark - now
+            parse += time.perf_counter() - mark
+            read_ms = reader.read_ms if reader else 0.0
+            spans['download_ms'] += read_ms
+            spans['decode_ms'] = parse * 1000 - read_ms
+            spans['build_ms'] = build * 1000
+            self._record(r, endpoint, params, headers, spans, f'<{count} items streamed at {prefix}>',
+                         reader.bytes_read if reader else len(r.content))
+        finally:
+            r.close()
+
+    def _json(self, r: requests.Response, endpoint: str, params: dict, headers: dict, spans: dict):
+        '''Decodes a response once and records its timings'''
+        decode_start = time.perf_counter()
+        response = r.json()
+        spans['decode_ms'] = (time.perf_counter() - decode_start) * 1000
+        self._record(r, endpoint, params, headers, spans, response, len(r.content))
+        return response
+
+    def _single_flight(self, endpoint: str, params: dict, headers: dict, fetch):
+        '''Runs fetch() unless an identical request is already in flight, in which case it waits
+        for that call and gets its own deep copy of the decoded response (or the same exception),
+        so a caller mutating its response never changes what another caller sees'''
+        key = _request_key(endpoint, params, headers)
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            self._coalesced['calls'] += 1
+            if not leader:
+                flight.followers += 1
+                view = request_view(params, endpoint)
+                self._coalesced['deduplicated'] += 1
+                self._coalesced['by_view'][view] = self._coalesced['by_view'].get(view, 0) + 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.response)
+
+        try:
+            flight.response = fetch()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+        # followers copy flight.response after done is set, so the leader must not hand out the original
+        return copy.deepcopy(flight.response) if flight.followers else flight.response
+
+    def coalescing_stats(self) -> dict:
+        '''Decoded calls made, how many joined an identical in-flight request instead of sending, and by which view'''
+        with self._flights_lock:
+            return dict(self._coalesced, by_view=dict(self._coalesced['by_view']))
+
+    def request_timings(self) -> dict:
+        '''Per-view request counts, bytes and phase milliseconds (see utils.timing.RequestTimings)'''
+        return self.timings.summary()
+
+    def connection_stats(self) -> dict:
+        '''Request/connection counters for the session shared by this sport and season'''
+        return connection_stats(self.session)
+
     def league_get(self, params: dict = None, headers: dict = None, extend: str = ''):
         endpoint = self.LEAGUE_ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
-        alternate_response = self.checkRequestStatus(r.status_code, extend=extend, params=params, headers=headers)
-
+        return self._single_flight(endpoint, params, headers, lambda: self._league_get(endpoint, params, headers, extend))
 
-        response = alternate_response if alternate_response else r.json()
+    def _league_get(self, endpoint: str, params: dict, headers: dict, extend: str):
+        r, spans = self._fetch(endpoint, params=params, headers=headers)
+        alternate_response = self.checkRequestStatus(r.status_code, extend=extend, params=params, headers=headers)
 
-        if self.logger:
-            self.logger.log_request(endpoint=self.LEAGUE_ENDPOINT + extend, params=params, headers=headers, response=response)
+        # the alternate endpoint's response was already decoded and logged by checkRequestStatus
+        response = alternate_response if alternate_response else self._json(r, endpoint, params, headers, spans)
 
         return response[0] if isinstance(response, list) else response
 
     def get(self, params: dict = None, headers: dict = None, extend: str = ''):
         endpoint = self.ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        return self._single_flight(endpoint, params, headers, lambda: self._season_get(endpoint, params, headers))
+
+    def _season_get(self, endpoint: str, params: dict, headers: dict):
+        r, spans = self._fetch(endpoint, params=params, headers=headers)
         self.checkRequestStatus(r.status_code)
 
-        if self.logger:
-            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=r.json())
-        return r.json()
+        return self._json(r, endpoint, params, headers, spans)
 
     def news_get(self, params: dict = None, headers: dict = None, extend: str = ''):
         endpoint = self.NEWS_ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        return self._single_flight(endpoint, params, headers, lambda: self._news_get(endpoint, params, headers))
+
+    def _news_get(self, endpoint: str, params: dict, headers: dict):
+        r, spans = self._fetch(endpoint, params=params, headers=headers)
 
-        if self.logger:
-            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=r.json())
-        return r.json()
+        return self._json(r, endpoint, params, headers, spans)
 
     def get_league(self):
         '''Gets all of the leagues initial data (teams, roster, matchups, settings)'''
@@ -125,6 +346,15 @@ class EspnFantasyRequests(object):
         data = self.get(extend='/players', params=params, headers=headers)
         return data
 
+    def iter_pro_players(self) -> Iterator[dict]:
+        '''Yields the current sports professional players one at a time (streamed when ijson is installed)'''
+        params = {
+            'view': 'players_wl'
+        }
+        filters = {"filterActive": {"value": True}}
+        headers = {'x-fantasy-filter': json.dumps(filters)}
+        return self._iter_items(self.ENDPOINT + '/players', 'item', params=params, headers=headers)
+
     def get_league_draft(self):
         '''Gets the leagues draft'''
         params = {
@@ -164,6 +394,19 @@ class EspnFantasyRequests(object):
         data = self.league_get(params=params, headers=headers)
         return data
 
+    def iter_player_cards(self, playerIds: List[int], max_scoring_period: int, additional_filters: List = None) -> Iterator[dict]:
+        '''Yields player card entries one at a time (streamed when ijson is installed)'''
+        params = { 'view': 'kona_playercard' }
+
+        additional_value = ["00{}".format(self.year), "10{}".format(self.year)]
+        if additional_filters : additional_value += additional_filters
+
+        filters = {'players':{'filterIds':{'value': playerIds}, 'filterStatsForTopScoringPeriodIds':{'value': max_scoring_period, 'additionalValue': additional_value}}}
+        headers = {'x-fantasy-filter': json.dumps(filters)}
+        # leagueHistory answers with a list of league documents
+        prefix = 'item.players.item' if '/leagueHistory/' in self.LEAGUE_ENDPOINT else 'players.item'
+        return self._iter_items(self.LEAGUE_ENDPOINT, prefix, params=params, headers=headers, extend='')
+
     def get_player_news(self, playerId):
         '''Gets the player news'''
         params = {'playerId': playerId}
@@ -0,0 +1,127 @@
+import gzip
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .constant import DEFAULT_POOL_SIZE
+from .session import mount_transport, mounted_transport
+
+ARCHIVE_VERSION = 1
+
+
+class ReplayMiss(Exception):
+    pass
+
+
+def request_key(method: str, url: str, headers=None) -> str:
+    '''Canonical form of a request: method, url with sorted query and the fantasy filter'''
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    fantasy_filter = (headers or {}).get('x-fantasy-filter', '')
+    return f'{method} {parts.scheme}://{parts.netloc}{parts.path}?{query} {fantasy_filter}'
+
+
+def _build_response(request, entry: dict) -> requests.Response:
+    r = requests.Response()
+    r.status_code = entry['status']
+    r.reason = entry.get('reason', '')
+    r.headers = CaseInsensitiveDict({'Content-Type': entry.get('content_type', 'application/json')})
+    r._content = entry['body'].encode('utf-8')
+    r._content_consumed = True
+    r.encoding = 'utf-8'
+    r.url = request.url
+    r.request = request
+    return r
+
+
+class RecordingAdapter(HTTPAdapter):
+    '''Pooled transport that also captures every request/response pair for later replay'''
+    def __init__(self, path: str, pool_size: int = DEFAULT_POOL_SIZE):
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        entry = {
+            'status': response.status_code,
+            'reason': response.reason,
+            'content_type': response.headers.get('Content-Type', 'application/json'),
+            'body': response.content.decode('utf-8', errors='replace'),
+        }
+        with self._lock:
+            self.entries[request_key(request.method, request.url, request.headers)] = entry
+        return response
+
+    def save(self) -> str:
+        '''Writes the captured pairs as one gzip compressed json archive'''
+        with self._lock:
+            archive = {'version': ARCHIVE_VERSION, 'entries': dict(sorted(self.entries.items()))}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+            json.dump(archive, f, separators=(',', ':'))
+        return self.path
+
+
+class ReplayAdapter(BaseAdapter):
+    '''Offline transport answering requests from a recorded archive.
+    latency (seconds) and bandwidth (bytes per second) simulate the network deterministically.'''
+    def __init__(self, path: str, latency: float = 0.0, bandwidth: float = None):
+        super().__init__()
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            archive = json.load(f)
+        if archive.get('version') != ARCHIVE_VERSION:
+            raise ValueError(f'Unsupported replay archive version in {path}')
+        self.entries = archive['entries']
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.requests = 0
+
+    def send(self, request, **kwargs):
+        key = request_key(request.method, request.url, request.headers)
+        entry = self.entries.get(key)
+        if entry is None:
+            raise ReplayMiss(f'No recorded response for {key}')
+        delay = self.latency
+        if self.bandwidth:
+            delay += len(entry['body']) / self.bandwidth
+        if delay:
+            time.sleep(delay)
+        self.requests += 1
+        return _build_response(request, entry)
+
+    def close(self):
+        pass
+
+
+def record(path: str) -> RecordingAdapter:
+    '''Starts capturing all ESPN traffic; call save() on the returned adapter when done'''
+    adapter = RecordingAdapter(path)
+    mount_transport(adapter)
+    return adapter
+
+
+def replay(path: str, latency: float = 0.0, bandwidth: float = None) -> ReplayAdapter:
+    '''Serves all ESPN traffic from a recorded archive instead of the network'''
+    adapter = ReplayAdapter(path, latency=latency, bandwidth=bandwidth)
+    mount_transport(adapter)
+    return adapter
+
+
+def active() -> bool:
+    '''True while traffic is being recorded or replayed, when request sequences must stay repeatable'''
+    return isinstance(mounted_transport(), (RecordingAdapter, ReplayAdapter))
+
+
+def stop() -> None:
+    '''Restores the normal pooled transport'''
+    mount_transport(None)
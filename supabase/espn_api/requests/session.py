@@ -0,0 +1,166 @@
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .constant import DEFAULT_POOL_SIZE
+from . import throttle
+
+# one pooled session per (sport, year) so every League for the same season reuses connections
+_sessions = {}
+_sessions_lock = threading.Lock()
+# transport adapter mounted on every session instead of the pooled one (record/replay)
+_transport = None
+# connect/throttle (rate limiter plus retry backoff) milliseconds and retries of the current thread, drained by take_request_stats()
+_request_stats = threading.local()
+
+
+def _add_request_stat(name: str, value):
+    setattr(_request_stats, name, getattr(_request_stats, name, 0) + value)
+
+
+class _TimedConnectMixin(object):
+    '''Adds the time spent opening a connection (DNS, TCP and TLS) to the calling thread's total'''
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _add_request_stat('connect_ms', (time.perf_counter() - start) * 1000)
+
+
+class _TimedHTTPConnection(_TimedConnectMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _ESPNHTTPAdapter(HTTPAdapter):
+    '''HTTPAdapter that waits on the shared rate limiter before every send, retries 429/5xx
+    and connection errors per the endpoint's retry policy, and times every new connection'''
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _TimedHTTPConnectionPool, 'https': _TimedHTTPSConnectionPool}
+
+    def send(self, request, **kwargs):
+        policy = throttle.retry_policy(request.url)
+        attempt = 0
+        while True:
+            _add_request_stat('throttle_ms', throttle.wait_for_token() * 1000)
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= policy.retries:
+                    throttle.gave_up()
+                    raise
+                reason = type(e).__name__
+                delay = policy.delay(attempt)
+            else:
+                if response.status_code not in policy.statuses:
+                    return response
+                if attempt >= policy.retries:
+                    throttle.gave_up()
+                    return response
+                reason = response.status_code
+                delay = policy.delay(attempt, throttle.retry_after_seconds(response))
+                response.close()
+            _add_request_stat('retries', 1)
+            _add_request_stat('throttle_ms', delay * 1000)
+            throttle.backoff(reason, delay, rate_limited=reason == 429)
+            attempt += 1
+
+
+def take_request_stats() -> dict:
+    '''connect_ms, throttle_ms and retries of the current thread since the previous call'''
+    stats = {name: getattr(_request_stats, name, 0) for name in ('connect_ms', 'throttle_ms', 'retries')}
+    _request_stats.__dict__.clear()
+    return stats
+
+
+def _accept_encoding() -> str:
+    '''Only advertise brotli when urllib3 is able to decode it'''
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return 'gzip, deflate'
+    return 'gzip, deflate, br'
+
+
+def get_session(sport: str, year: int, pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    '''Returns the shared keep-alive session for a sport/season, creating it on first use.
+    The pool size of the first caller wins for the lifetime of the session.'''
+    key = (sport, year)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = _transport or _ESPNHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'Accept-Encoding': _accept_encoding(),
+                'Connection': 'keep-alive',
+            })
+            _sessions[key] = session
+    return session
+
+
+def mount_transport(adapter) -> None:
+    '''Routes every current and future shared session through adapter (None restores pooling)'''
+    global _transport
+    with _sessions_lock:
+        _transport = adapter
+        for session in _sessions.values():
+            transport = adapter or _ESPNHTTPAdapter(pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_SIZE)
+            session.mount('https://', transport)
+            session.mount('http://', transport)
+
+
+def mounted_transport():
+    '''The adapter installed by mount_transport, or None when using the pooled default'''
+    return _transport
+
+
+def connection_stats(session: requests.Session) -> dict:
+    '''Counts requests sent and connections opened across every host pool of a session'''
+    num_requests = 0
+    num_connections = 0
+    for adapter in set(session.adapters.values()):
+        if not hasattr(adapter, 'poolmanager'):
+            continue
+        pools = adapter.poolmanager.pools
+        for pool_key in pools.keys():
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            num_requests += pool.num_requests
+            num_connections += pool.num_connections
+    return {
+        'requests': num_requests,
+        'connections': num_connections,
+        'reused': max(num_requests - num_connections, 0),
+    }
+
+
+def close_sessions() -> None:
+    '''Closes every shared session and drops them from the registry'''
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,139 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+from .constant import NEWS_BASE_ENDPOINT, RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST, RETRY_STATUSES, RETRY_POLICIES
+
+
+class TokenBucket(object):
+    '''Lets rate requests per second through on average, with bursts of up to burst.
+    Kept as the time the next token is due (GCRA), so callers reserve under the lock
+    and sleep outside it, queueing fairly across threads'''
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._interval = 1.0 / rate
+        # how far ahead of the steady rate a burst may run
+        self._tolerance = (self.burst - 1) * self._interval
+        self._due = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        '''Takes a token, sleeping until one is available; returns the seconds waited'''
+        with self._lock:
+            now = time.monotonic()
+            due = max(self._due, now)
+            wait = max(due - self._tolerance - now, 0.0)
+            self._due = due + self._interval
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def hold(self, seconds: float):
+        '''Lets nobody through for seconds and drops any saved-up burst (ESPN said slow down)'''
+        with self._lock:
+            self._due = max(self._due, time.monotonic() + seconds + self._tolerance)
+
+
+class RetryPolicy(object):
+    '''Retries for one endpoint class: full-jitter exponential backoff capped at max_delay'''
+    def __init__(self, retries: int = 3, base_delay: float = 1, max_delay: float = 60, statuses=RETRY_STATUSES):
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+
+    def delay(self, attempt: int, retry_after: float = None) -> float:
+        '''Seconds to wait before retry number attempt + 1; Retry-After wins when ESPN sends one
+        (still capped at max_delay so one answer cannot park a refresh for an hour)'''
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+def endpoint_class(url: str) -> str:
+    '''league (league views), players (pro player list), season (pro schedule etc.) or news'''
+    if url.startswith(NEWS_BASE_ENDPOINT):
+        return 'news'
+    path = url.split('?', 1)[0]
+    if '/leagues/' in path or '/leagueHistory/' in path:
+        return 'league'
+    if path.rstrip('/').endswith('/players'):
+        return 'players'
+    return 'season'
+
+
+def retry_after_seconds(response) -> float:
+    '''Retry-After as seconds (delta-seconds or an HTTP date), None when absent or unreadable'''
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+    except (TypeError, ValueError):
+        return None
+
+
+# one bucket for the whole process so every League and thread shares ESPN's budget
+_limiter = TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST) if RATE_LIMIT_PER_SECOND else None
+_policies = {name: RetryPolicy(**policy) for name, policy in RETRY_POLICIES.items()}
+_stats_lock = threading.Lock()
+_stats = {'requests': 0, 'throttled': 0, 'throttle_seconds': 0.0, 'retries': {}, 'retry_seconds': 0.0, 'gave_up': 0}
+
+
+def set_rate_limit(rate: float = None, burst: int = None):
+    '''Replaces the shared bucket; rate=None turns rate limiting off'''
+    global _limiter
+    _limiter = TokenBucket(rate, burst or max(1, int(rate))) if rate else None
+
+
+def set_retry_policy(name: str, **policy):
+    '''Overrides the retry settings of one endpoint class (retries, base_delay, max_delay, statuses)'''
+    _policies[name] = RetryPolicy(**policy)
+
+
+def retry_policy(url: str) -> RetryPolicy:
+    return _policies.get(endpoint_class(url)) or RetryPolicy()
+
+
+def wait_for_token() -> float:
+    '''Blocks on the shared bucket; returns and records the seconds spent waiting'''
+    waited = _limiter.acquire() if _limiter else 0.0
+    with _stats_lock:
+        _stats['requests'] += 1
+        if waited > 0:
+            _stats['throttled'] += 1
+            _stats['throttle_seconds'] += waited
+    return waited
+
+
+def backoff(reason, seconds: float, rate_limited: bool = False):
+    '''Records a retry (reason is the HTTP status or exception name) and sleeps before it.
+    A 429 holds the shared bucket too, so other threads back off with us'''
+    if rate_limited and _limiter:
+        _limiter.hold(seconds)
+    with _stats_lock:
+        _stats['retries'][reason] = _stats['retries'].get(reason, 0) + 1
+        _stats['retry_seconds'] += seconds
+    time.sleep(seconds)
+
+
+def gave_up():
+    with _stats_lock:
+        _stats['gave_up'] += 1
+
+
+def throttle_stats() -> dict:
+    '''Process-wide counters: requests sent, how often/long the rate limiter made them wait,
+    retries by status and total backoff seconds, and requests that failed after every retry'''
+    with _stats_lock:
+        stats = dict(_stats, retries=dict(_stats['retries']))
+    stats['throttle_seconds'] = round(stats['throttle_seconds'], 3)
+    stats['retry_seconds'] = round(stats['retry_seconds'], 3)
+    return stats
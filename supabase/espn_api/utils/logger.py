@@ -1,15 +1,69 @@
 import logging
 import sys
 import json
+import threading
+from typing import Callable, List
+
+
+class _LazyJson(object):
+    '''Defers json.dumps of a response until a handler actually formats the record'''
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return self.value if isinstance(self.value, str) else json.dumps(self.value)
+
+
+def request_view(params: dict = None, endpoint: str = '') -> str:
+    '''The view a request is logged and timed under: its first view, else the last path segment.
+    Build spans use the same names, e.g. span('mMatchupScore') for the mMatchupScore+mScoreboard request'''
+    view = (params or {}).get('view')
+    if isinstance(view, (list, tuple)):
+        view = view[0] if view else None
+    return view or endpoint.rstrip('/').rsplit('/', 1)[-1]
+
+
+class RequestCollector(object):
+    '''In-memory request sink; keeps every structured record in .records'''
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def __call__(self, record: dict):
+        with self._lock:
+            self.records.append(record)
+
+    def clear(self):
+        with self._lock:
+            self.records = []
+
+
+class JsonLinesWriter(object):
+    '''Request sink appending one JSON object per line to path'''
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, record: dict):
+        line = json.dumps(record) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
 
 class Logger(object):
-    def __init__(self, name: str, debug=False):
+    def __init__(self, name: str, debug=False, sinks: List[Callable[[dict], None]] = None):
         level = logging.DEBUG if debug else logging.INFO
         self.logging = logging.getLogger(name)
+        # callables receiving one structured record per ESPN request
+        self.sinks = list(sinks or [])
 
         # if logger already exists don't add handlers
         if len(self.logging.handlers):
             self.logging.handlers[0].setLevel(level)
+            self.logging.setLevel(level)
             return
 
         handler = logging.StreamHandler(sys.stdout)
@@ -20,9 +74,37 @@ class Logger(object):
         self.logging.addHandler(handler)
         self.logging.setLevel(level)
 
-    def log_request(self, endpoint: str, response: dict, params: dict = None, headers: dict = None):
-        log = f'ESPN API Request: url: {endpoint} params: {params} headers: {headers} \nESPN API Response: {json.dumps(response)}'
-        self.logging.debug(log)
+    def add_sink(self, sink: Callable[[dict], None]):
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink: Callable[[dict], None]):
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+
+    @property
+    def enabled(self) -> bool:
+        '''True when a request record would go anywhere; callers skip building one otherwise'''
+        return bool(self.sinks) or self.logging.isEnabledFor(logging.DEBUG)
+
+    def log_request(self, endpoint: str, response, params: dict = None, headers: dict = None, status: int = None,
+                    nbytes: int = None, decode_ms: float = None, total_ms: float = None, spans: dict = None):
+        if self.sinks:
+            record = {
+                'endpoint': endpoint,
+                'view': request_view(params, endpoint),
+                'status': status,
+                'bytes': nbytes,
+                'decode_ms': None if decode_ms is None else round(decode_ms, 3),
+                'total_ms': None if total_ms is None else round(total_ms, 3),
+            }
+            # wait/connect/ttfb/download/build milliseconds and retries when the caller measured them
+            for phase, ms in (spans or {}).items():
+                record[phase] = round(ms, 3)
+            for sink in self.sinks:
+                sink(record)
+        # arguments are only formatted if a DEBUG handler takes the record
+        self.logging.debug('ESPN API Request: url: %s params: %s headers: %s \nESPN API Response: %s',
+                           endpoint, params, headers, _LazyJson(response))
 
 
 
@@ -39,4 +121,3 @@ class Logger(object):
 #     logger.addHandler(handler)
 #     logger.setLevel(level)
 #     return logger
-
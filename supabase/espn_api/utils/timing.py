@@ -0,0 +1,74 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# per-request phases, in the order they happen
+PHASES = ('wait_ms', 'connect_ms', 'ttfb_ms', 'download_ms', 'decode_ms', 'build_ms')
+
+
+class RequestTimings(object):
+    '''Thread-safe per-view totals of request counts, bytes and per-phase milliseconds
+
+    wait_ms      rate limiter waits and retry backoff before the request got through
+    connect_ms   new connections opened for the request (DNS lookup, TCP and TLS handshake)
+    ttfb_ms      request sent until response headers arrived
+    download_ms  reading the body
+    decode_ms    JSON decoding
+    build_ms     turning the decoded data into model objects
+    total_ms     wall time of the request including decode (build is timed separately,
+                 except for streamed views where objects are built while the body is read)'''
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def _entry(self, view: str) -> dict:
+        entry = self._views.get(view)
+        if entry is None:
+            entry = self._views[view] = dict({'requests': 0, 'retries': 0, 'bytes': 0, 'total_ms': 0.0}, **{phase: 0.0 for phase in PHASES})
+        return entry
+
+    def add(self, view: str, nbytes: int = 0, retries: int = 0, **phases_ms):
+        '''Counts one request for view with its byte count, retries and phase times'''
+        with self._lock:
+            entry = self._entry(view)
+            entry['requests'] += 1
+            entry['retries'] += retries
+            entry['bytes'] += nbytes or 0
+            for phase, ms in phases_ms.items():
+                entry[phase] += ms
+
+    def add_phase(self, view: str, phase: str, ms: float):
+        '''Adds time to one phase of view without counting a request'''
+        with self._lock:
+            self._entry(view)[phase] += ms
+
+    @contextmanager
+    def span(self, view: str, phase: str = 'build_ms'):
+        '''Times the enclosed block into a phase of view'''
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(view, phase, (time.perf_counter() - start) * 1000)
+
+    def summary(self) -> dict:
+        '''{view: {requests, retries, bytes, wait_ms, connect_ms, ttfb_ms, download_ms, decode_ms, build_ms, total_ms}}'''
+        with self._lock:
+            return {view: {key: round(value, 3) if isinstance(value, float) else value for key, value in entry.items()}
+                    for view, entry in sorted(self._views.items(), key=lambda item: -item[1]['total_ms'])}
+
+    def reset(self):
+        with self._lock:
+            self._views = {}
+
+
+def format_timings(summary: dict) -> str:
+    '''Human-readable table of a RequestTimings.summary(), slowest view first'''
+    if not summary:
+        return 'ESPN requests: none'
+    columns = ('wait', 'connect', 'ttfb', 'download', 'decode', 'build', 'total')
+    lines = [f"{'ESPN view':<24}{'reqs':>6}{'retry':>6}{'KiB':>10}" + ''.join(f'{column + " ms":>13}' for column in columns)]
+    for view, entry in summary.items():
+        lines.append(f"{view:<24}{entry['requests']:>6}{entry['retries']:>6}{entry['bytes'] / 1024:>10.0f}" +
+                     ''.join(f"{entry[column + '_ms']:>13.1f}" for column in columns))
+    return '\n'.join(lines)
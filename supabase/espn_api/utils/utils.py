@@ -19,3 +19,30 @@ def json_parsing(obj, key):
 
     results = extract(obj, arr, key)
     return results[0] if results else results
+
+
+def json_parsing_keys(obj, keys):
+    """Single pass json_parsing for several keys: {key: first value found} ([] when missing).
+    Matches json_parsing's depth-first order and stops once every key is found."""
+    wanted = set(keys)
+    found = {}
+
+    def extract(obj):
+        """Return True once all keys have been found."""
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                if isinstance(v, (dict)) or (isinstance(v, (list)) and  v and isinstance(v[0], (list, dict))):
+                    if extract(v):
+                        return True
+                elif k in wanted and k not in found:
+                    found[k] = v
+                    if len(found) == len(wanted):
+                        return True
+        elif isinstance(obj, list):
+            for item in obj:
+                if extract(item):
+                    return True
+        return False
+
+    extract(obj)
+    return {key: found.get(key, []) for key in keys}
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 
 class BoxPlayer(Player):
     '''player with extra data from a matchup'''
+    __slots__ = ('slot_position', 'pro_opponent', 'game_played', 'points', 'points_breakdown')
     def __init__(self, data, pro_schedule, year):
         super(BoxPlayer, self).__init__(data, year)
         self.slot_position = 'FA'
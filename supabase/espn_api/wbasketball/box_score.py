@@ -2,6 +2,8 @@ from .box_player import BoxPlayer
 
 class BoxScore(object):
     ''' '''
+    __slots__ = ('winner', 'home_team', 'home_projected', 'home_lineup', 'away_team', 'away_score', 'away_lineup',
+                 'away_projected', 'home_score')
     def __init__(self, data, pro_schedule, by_matchup, year):
         self.winner = data.get('winner', 'UNDECIDED')
         self.home_team = data['home']['teamId']
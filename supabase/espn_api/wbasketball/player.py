@@ -1,17 +1,22 @@
 from .constant import POSITION_MAP, PRO_TEAM_MAP, STATS_MAP, STAT_ID_MAP
-from espn_api.utils.utils import json_parsing
+from espn_api.utils.utils import json_parsing_keys
 
 class Player(object):
     '''Player are part of team'''
+    __slots__ = ('name', 'playerId', 'position', 'lineupSlot', 'eligibleSlots', 'acquisitionType', 'proTeam',
+                 'injuryStatus', 'stats', 'injured', 'total_points', 'avg_points', 'projected_total_points',
+                 'projected_avg_points')
     def __init__(self, data, year):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.position = POSITION_MAP[json_parsing(data, 'defaultPositionId')]
+        fields = json_parsing_keys(data, ('fullName', 'id', 'defaultPositionId', 'eligibleSlots', 'acquisitionType',
+                                          'proTeamId', 'injuryStatus'))
+        self.name = fields['fullName']
+        self.playerId = fields['id']
+        self.position = POSITION_MAP[fields['defaultPositionId']]
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP[pos] for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP[json_parsing(data, 'proTeamId')]
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
+        self.eligibleSlots = [POSITION_MAP[pos] for pos in fields['eligibleSlots']]
+        self.acquisitionType = fields['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP[fields['proTeamId']]
+        self.injuryStatus = fields['injuryStatus']
         self.stats = {}
 
         # add available stats
@@ -0,0 +1,117 @@
+"""
+Best possible starting lineup for a team-week, from the league's slot counts and each
+player's eligible slots.
+
+Lineup slots come from `football.Settings.position_slot_counts` (QB, RB, WR, TE, OP,
+RB/WR, WR/TE, RB/WR/TE, D/ST, K, ...), so superflex and two-flex leagues are scored
+the same way as standard ones. A player can start in any slot listed in their
+`eligibleSlots` (exported by `player_to_dict`).
+
+Players are taken best first and kept whenever the starters so far can be reseated to
+make room for them (an augmenting path over the slots). Sets of players that fit the
+slots form a matroid, so this greedy pass is exact: it fills as many slots as
+possible and, among those lineups, scores the most points.
+
+  optimizer = LineupOptimizer(league.settings.position_slot_counts)
+  optimizer.best_score([(points, eligible_slots, position), ...])
+  optimizer.best_scores(lineups)   # many team-weeks, sharing the slot lookups
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+# slots that never score
+RESERVE_SLOTS = ("BE", "IR", "")
+# the lineup the leaderboard assumed before it read league settings
+DEFAULT_SLOT_COUNTS = {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "RB/WR/TE": 1, "D/ST": 1, "K": 1}
+OFFENSE_POSITIONS = ("QB", "RB", "WR", "TE")
+
+# (points, eligible slots, position); eligible slots may be empty for old payloads
+LineupPlayer = tuple[float, Sequence[str], str]
+
+
+def position_slots(position: str) -> tuple[str, ...]:
+    """Slots a position can fill when a player carries no eligibleSlots."""
+    if position in ("DST", "D/ST"):
+        return ("D/ST",)
+    slots = (position, "RB/WR", "WR/TE", "RB/WR/TE", "OP") if position in OFFENSE_POSITIONS else (position,)
+    return tuple(s for s in slots if s == position or s == "OP" or position in s.split("/"))
+
+
+class LineupOptimizer:
+    def __init__(self, slot_counts: dict[str, int] | None = None) -> None:
+        slot_counts = slot_counts or DEFAULT_SLOT_COUNTS
+        # one entry per starting spot, e.g. ["QB", "RB", "RB", ...]
+        self.slots: list[str] = [
+            slot for slot, count in slot_counts.items() if slot not in RESERVE_SLOTS for _ in range(count or 0)
+        ]
+        self._spots_by_slot: dict[str, list[int]] = {}
+        for spot, slot in enumerate(self.slots):
+            self._spots_by_slot.setdefault(slot, []).append(spot)
+        # eligible slots -> starting spots; players share a handful of eligibility lists
+        self._spots_cache: dict[tuple[str, ...], tuple[int, ...]] = {}
+
+    def _spots(self, eligible_slots: Sequence[str], position: str) -> tuple[int, ...]:
+        key = eligible_slots if type(eligible_slots) is tuple else tuple(eligible_slots)
+        key = key or position_slots(position)
+        spots = self._spots_cache.get(key)
+        if spots is None:
+            spots = self._spots_cache[key] = tuple(
+                spot for slot in dict.fromkeys(key) for spot in self._spots_by_slot.get(slot, ())
+            )
+        return spots
+
+    def assign(self, players: Sequence[LineupPlayer]) -> dict[int, int]:
+        """{starting spot: index into players} for the highest-scoring full lineup."""
+        seated: dict[int, int] = {}
+        if not self.slots:
+            return seated
+        cache = self._spots_cache
+        spots_of = [
+            (type(eligible) is tuple and cache.get(eligible)) or self._spots(eligible, position)
+            for _, eligible, position in players
+        ]
+        points = [p[0] for p in players]
+        order = sorted(range(len(players)), key=points.__getitem__, reverse=True)
+
+        def reseat(player: int, visited: set[int]) -> bool:
+            for spot in spots_of[player]:
+                if spot in visited:
+                    continue
+                visited.add(spot)
+                if spot not in seated or reseat(seated[spot], visited):
+                    seated[spot] = player
+                    return True
+            return False
+
+        # players seated per eligibility; a group can hold at most as many players as it has spots
+        taken: dict[tuple[int, ...], int] = {}
+        remaining = len(self.slots)
+        for player in order:
+            spots = spots_of[player]
+            count = taken.get(spots, 0)
+            if count >= len(spots):
+                continue
+            for spot in spots:
+                if spot not in seated:
+                    seated[spot] = player
+                    break
+            else:
+                if not reseat(player, set()):
+                    # nobody with these spots fits later either: the seated set only grows
+                    taken[spots] = len(spots)
+                    continue
+            taken[spots] = count + 1
+            remaining -= 1
+            if not remaining:
+                break
+        return seated
+
+    def best_score(self, players: Sequence[LineupPlayer]) -> float:
+        seated = self.assign(players)
+        return sum(players[seated[spot]][0] for spot in sorted(seated))
+
+    def best_scores(self, lineups: Iterable[Sequence[LineupPlayer]]) -> list[float]:
+        """best_score for each lineup of a batch (a season's team-weeks)."""
+        return [self.best_score(players) for players in lineups]
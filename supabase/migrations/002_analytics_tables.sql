@@ -0,0 +1,30 @@
+-- Pre-aggregated season stats written by supabase/seed.py (see supabase/analytics.py).
+-- Same definitions as the seed.py docstring; safe to re-run.
+create table if not exists public.team_week_stats (
+  year int not null references public.seasons(year) on delete cascade,
+  week int not null,
+  team_id uuid not null references public.teams(id) on delete cascade,
+  opponent_id uuid references public.teams(id) on delete cascade,
+  score numeric not null,
+  opponent_score numeric not null,
+  is_playoff boolean not null default false,
+  actual_points numeric not null,
+  optimal_points numeric not null,
+  primary key (year, week, team_id)
+);
+
+create table if not exists public.team_season_stats (
+  year int not null references public.seasons(year) on delete cascade,
+  team_id uuid not null references public.teams(id) on delete cascade,
+  wins int not null,
+  losses int not null,
+  ties int not null,
+  points_for numeric not null,
+  points_against numeric not null,
+  weeks_played int not null,
+  high_score numeric,
+  low_score numeric,
+  actual_points numeric not null,
+  optimal_points numeric not null,
+  primary key (year, team_id)
+);
@@ -0,0 +1,9 @@
+-- Content digests written by supabase/seed.py, so in-season syncs only write what changed.
+-- Same definition as the seed.py docstring; safe to re-run.
+create table if not exists public.sync_state (
+  year int not null references public.seasons(year) on delete cascade,
+  key text not null,
+  digest text not null,
+  updated_at timestamptz not null default now(),
+  primary key (year, key)
+);
@@ -0,0 +1,4 @@
+-- weekly_scores and defense_points_against were created by earlier versions of 002 but
+-- nothing reads them; supabase/seed.py no longer writes them. Safe to re-run.
+drop table if exists public.weekly_scores;
+drop table if exists public.defense_points_against;
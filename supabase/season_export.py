@@ -0,0 +1,230 @@
+"""
+Compact columnar export of a season payload, written next to data-YYYY.json.
+
+`build_year_json` repeats every key and string per lineup entry (stat names such as
+`rushingYardsPerAttempt`, numeric-string stat ids, slot lists, team names). The export
+keeps one dictionary per string column and stores each week's lineups as columns of
+codes and numbers, with the stat breakdowns as flat (count, key code, value) arrays:
+
+  {"format": "season-columns", "version": 1, "year", "current_week", "draft", "slot_counts",
+   "playoff_start_week",
+   "dicts": {"team": [[id, name, owner], ...], "slot": [...], "position": [...],
+             "eligible": [[slot, ...], ...], "name": [...], "pro_team": [...],
+             "opponent": [...], "injury": [...], "stat": [...]},
+   "weeks": [{"week": "1",
+              "matchups": {"away": [team code], "home": [...], "away_score": [...], ...},
+              "lineups": {"side": [matchup * 2 + (0 away, 1 home)], "slot": [code], ...,
+                          "points": [...], "stat_count": [...], "stat_key": [...],
+                          "stat_value": [...]}}, ...]}
+
+Containers, picked by file name:
+
+  data-2025.season.json.gz      gzip'd JSON (standard library only)
+  data-2025.season.msgpack.zst  msgpack + zstandard (pip install msgpack zstandard)
+
+  write_export(payload, "data-2025.season.json.gz")
+  payload = load_payload("data-2025.season.json.gz")   # == json.load(data-2025.json)
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:  # optional: only the .msgpack.zst container needs it
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+FORMAT = "season-columns"
+VERSION = 1
+JSON_SUFFIX = ".season.json.gz"
+MSGPACK_SUFFIX = ".season.msgpack.zst"
+
+_STRING_COLUMNS = ("slot", "position", "name", "pro_team", "opponent", "injury")
+_SIDE_NUMBERS = ("score", "projected")
+
+
+class _Dictionary:
+    """Values -> codes in first-seen order."""
+
+    def __init__(self) -> None:
+        self.codes: dict[Any, int] = {}
+
+    def code(self, value: Any) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+        return code
+
+    def values(self) -> list[Any]:
+        return list(self.codes)
+
+
+def encode_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """Columnar form of a build_year_json payload (JSON and msgpack friendly)."""
+    dicts = {name: _Dictionary() for name in ("team", "eligible", "stat", *_STRING_COLUMNS)}
+    weeks_out = []
+    weeks = payload.get("weeks") or {}
+    for week in sorted(weeks, key=int):
+        matchups: dict[str, list] = {"away": [], "home": []}
+        for side in ("away", "home"):
+            for key in _SIDE_NUMBERS:
+                matchups[f"{side}_{key}"] = []
+        lineups: dict[str, list] = {key: [] for key in (
+            "side", *_STRING_COLUMNS, "eligible", "points", "proj", "game_played", "bye", "injured", "bench",
+            "stat_count", "stat_key", "stat_value")}
+        for m_idx, m in enumerate(weeks[week] or []):
+            for side_no, side in enumerate(("away", "home")):
+                t = m.get(side) or {}
+                matchups[side].append(dicts["team"].code((t.get("id", 0), t.get("name", "Unknown"), t.get("owner", "Unknown"))))
+                for key in _SIDE_NUMBERS:
+                    matchups[f"{side}_{key}"].append(t.get(key, 0.0))
+                for pl in t.get("lineup") or []:
+                    stats = pl.get("stats") or {}
+                    lineups["side"].append(m_idx * 2 + side_no)
+                    lineups["slot"].append(dicts["slot"].code(pl.get("slot", "")))
+                    lineups["position"].append(dicts["position"].code(pl.get("position", "")))
+                    lineups["eligible"].append(dicts["eligible"].code(tuple(pl.get("eligibleSlots") or ())))
+                    lineups["name"].append(dicts["name"].code(pl.get("name", "Unknown")))
+                    lineups["pro_team"].append(dicts["pro_team"].code(pl.get("proTeam", "")))
+                    lineups["opponent"].append(dicts["opponent"].code(pl.get("opp", "")))
+                    lineups["injury"].append(dicts["injury"].code(pl.get("injuryStatus", "")))
+                    lineups["points"].append(pl.get("points", 0.0))
+                    lineups["proj"].append(pl.get("proj", 0.0))
+                    lineups["game_played"].append(pl.get("gamePlayed", 0))
+                    lineups["bye"].append(int(bool(pl.get("bye"))))
+                    lineups["injured"].append(int(bool(pl.get("injured"))))
+                    lineups["bench"].append(int(bool(pl.get("bench"))))
+                    lineups["stat_count"].append(len(stats))
+                    lineups["stat_key"].extend(dicts["stat"].code(key) for key in stats)
+                    lineups["stat_value"].extend(stats.values())
+        weeks_out.append({"week": str(week), "matchups": matchups, "lineups": lineups})
+
+    return {
+        "format": FORMAT,
+        "version": VERSION,
+        "year": payload.get("year"),
+        "current_week": payload.get("current_week"),
+        "draft": payload.get("draft") or [],
+        "slot_counts": payload.get("slot_counts"),
+        "playoff_start_week": payload.get("playoff_start_week"),
+        "dicts": {name: [list(v) if isinstance(v, tuple) else v for v in d.values()] for name, d in dicts.items()},
+        "weeks": weeks_out,
+    }
+
+
+def decode_payload(doc: dict[str, Any]) -> dict[str, Any]:
+    """The build_year_json payload back from encode_payload output (week keys as strings,
+    like a data-YYYY.json read from disk)."""
+    if doc.get("format") != FORMAT or doc.get("version") != VERSION:
+        raise ValueError(f"not a {FORMAT} v{VERSION} export: {doc.get('format')!r} v{doc.get('version')!r}")
+    d = doc["dicts"]
+    teams, stat_keys, eligible = d["team"], d["stat"], d["eligible"]
+    slots, positions, names = d["slot"], d["position"], d["name"]
+    pro_teams, opponents, injuries = d["pro_team"], d["opponent"], d["injury"]
+
+    weeks: dict[str, list] = {}
+    for w in doc["weeks"]:
+        m_cols, l = w["matchups"], w["lineups"]
+        sides = []
+        for m_idx in range(len(m_cols["away"])):
+            for side in ("away", "home"):
+                team_id, name, owner = teams[m_cols[side][m_idx]]
+                sides.append({
+                    "id": team_id,
+                    "name": name,
+                    "owner": owner,
+                    "score": m_cols[f"{side}_score"][m_idx],
+                    "projected": m_cols[f"{side}_projected"][m_idx],
+                    "lineup": [],
+                })
+        # resolve each column's codes once per week, then zip the rows back together
+        keys = [stat_keys[k] for k in l["stat_key"]]
+        values = l["stat_value"]
+        offsets = [0]
+        for count in l["stat_count"]:
+            offsets.append(offsets[-1] + count)
+        columns = zip(
+            l["side"],
+            [slots[c] for c in l["slot"]],
+            [positions[c] for c in l["position"]],
+            [eligible[c] for c in l["eligible"]],
+            [names[c] for c in l["name"]],
+            [pro_teams[c] for c in l["pro_team"]],
+            [opponents[c] for c in l["opponent"]],
+            l["points"], l["proj"], l["game_played"], l["bye"],
+            [injuries[c] for c in l["injury"]],
+            l["injured"], l["bench"],
+            offsets, offsets[1:],
+        )
+        for side, slot, position, slot_list, name, pro_team, opp, points, proj, played, bye, injury, injured, bench, start, end in columns:
+            sides[side]["lineup"].append({
+                "slot": slot,
+                "position": position,
+                "eligibleSlots": list(slot_list),
+                "stats": dict(zip(keys[start:end], values[start:end])),
+                "name": name,
+                "proTeam": pro_team,
+                "opp": opp,
+                "points": points,
+                "proj": proj,
+                "gamePlayed": played,
+                "bye": bool(bye),
+                "injuryStatus": injury,
+                "injured": bool(injured),
+                "bench": bool(bench),
+            })
+        weeks[w["week"]] = [{"away": sides[i], "home": sides[i + 1]} for i in range(0, len(sides), 2)]
+
+    payload = {"year": doc["year"], "current_week": doc["current_week"], "weeks": weeks, "draft": doc["draft"]}
+    for key in ("slot_counts", "playoff_start_week"):
+        if doc.get(key) is not None:
+            payload[key] = doc[key]
+    return payload
+
+
+def _msgpack_zstd() -> None:
+    if msgpack is None or zstandard is None:
+        raise ImportError(f"{MSGPACK_SUFFIX} exports need msgpack and zstandard (pip install msgpack zstandard)")
+
+
+def dumps(doc: dict[str, Any], container: str = JSON_SUFFIX) -> bytes:
+    if container == MSGPACK_SUFFIX:
+        _msgpack_zstd()
+        return zstandard.ZstdCompressor(level=19).compress(msgpack.packb(doc, use_bin_type=True))
+    return gzip.compress(json.dumps(doc, separators=(",", ":")).encode("utf-8"), compresslevel=9)
+
+
+def loads(data: bytes, container: str = JSON_SUFFIX) -> dict[str, Any]:
+    if container == MSGPACK_SUFFIX:
+        _msgpack_zstd()
+        return msgpack.unpackb(zstandard.ZstdDecompressor().decompress(data), raw=False, strict_map_key=False)
+    return json.loads(gzip.decompress(data))
+
+
+def container_of(path: str | Path) -> str:
+    name = str(path)
+    for suffix in (MSGPACK_SUFFIX, JSON_SUFFIX):
+        if name.endswith(suffix):
+            return suffix
+    raise ValueError(f"unknown season export container: {name} (expected *{JSON_SUFFIX} or *{MSGPACK_SUFFIX})")
+
+
+def write_export(payload: dict[str, Any], path: str | Path) -> int:
+    """Encode payload into path (container from the file name); returns bytes written."""
+    data = dumps(encode_payload(payload), container_of(path))
+    Path(path).write_bytes(data)
+    return len(data)
+
+
+def load_payload(path: str | Path) -> dict[str, Any]:
+    """Read an export back as the payload seed.sync_year_payload takes."""
+    return decode_payload(loads(Path(path).read_bytes(), container_of(path)))
@@ -0,0 +1,182 @@
+"""
+One pass over a season's lineups, indexed for the per-team and per-player collectors.
+
+`slimify_fantasy_html` collectors used to rescan every week x matchup x lineup entry
+for each question they asked (points a player scored for a team, a team's lineup in
+a week, who played which defense). `SeasonIndex` walks the season once and answers
+those with dictionary lookups. Build it from the box scores of a live run or from a
+`data-YYYY.json` payload:
+
+  index = SeasonIndex.from_box_scores(all_weeks_data)
+  index = SeasonIndex.from_payload(json.load(open("data-2025.json")))
+  index.points_on_team(team_id, "Player Name")   # (points while starting, games scored in)
+  index.lineup(team_id, week)                    # [Appearance, ...] in lineup order
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+BENCH_SLOTS = ("BE", "IR")
+
+
+@dataclass(frozen=True)
+class Appearance:
+    """One lineup entry: a player in a team's lineup for a week."""
+
+    week: int
+    team_id: int
+    name: str
+    position: str
+    slot: str
+    points: float
+    pro_opponent: str
+    eligible_slots: tuple[str, ...] = ()
+
+    @property
+    def bench(self) -> bool:
+        return self.slot in BENCH_SLOTS
+
+
+@dataclass(frozen=True)
+class TeamScore:
+    """One side of a matchup; team/opponent are Team objects (box scores) or ids (payloads)."""
+
+    week: int
+    team: Any
+    score: float
+    opponent: Any
+    opponent_score: float
+
+    @property
+    def won(self) -> bool:
+        return self.score > self.opponent_score
+
+
+class SeasonIndex:
+    def __init__(self) -> None:
+        self.weeks: list[int] = []
+        self.scores: list[TeamScore] = []
+        # (team_id, week) -> lineup, and (team_id, name) -> {week: first appearance that week}
+        self._lineups: dict[tuple[int, int], list[Appearance]] = {}
+        self._by_player: dict[tuple[int, str], dict[int, Appearance]] = {}
+        self._names_by_team: dict[int, list[str]] = {}
+        self._teams_by_week: dict[int, list[int]] = {}
+
+    @classmethod
+    def from_box_scores(cls, all_weeks_data: dict[int, list]) -> "SeasonIndex":
+        """Index {week: [BoxScore, ...]} as returned by League.box_scores_range."""
+        index = cls()
+        for week in sorted(all_weeks_data.keys()):
+            index.weeks.append(week)
+            for matchup in all_weeks_data[week] or []:
+                if not matchup or not getattr(matchup, "home_team", None):
+                    continue
+                away, home = matchup.away_team, matchup.home_team
+                away_score = getattr(matchup, "away_score", 0.0) or 0.0
+                home_score = getattr(matchup, "home_score", 0.0) or 0.0
+                index.scores.append(TeamScore(week, away, away_score, home, home_score))
+                index.scores.append(TeamScore(week, home, home_score, away, away_score))
+                for team, lineup in ((away, getattr(matchup, "away_lineup", None)), (home, getattr(matchup, "home_lineup", None))):
+                    if not team:
+                        continue
+                    index._add_lineup(week, team.team_id, (
+                        Appearance(
+                            week=week,
+                            team_id=team.team_id,
+                            name=getattr(p, "name", "Unknown"),
+                            position=getattr(p, "position", "") or "",
+                            slot=getattr(p, "slot_position", "") or getattr(p, "lineupSlot", "") or "",
+                            points=getattr(p, "points", 0.0) or 0.0,
+                            pro_opponent=getattr(p, "pro_opponent", "") or getattr(p, "opponent", "") or "",
+                            eligible_slots=tuple(getattr(p, "eligibleSlots", None) or ()),
+                        )
+                        for p in lineup or []
+                    ))
+        return index
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "SeasonIndex":
+        """Index a build_year_json payload (points are the payload's, rounded to 2 places)."""
+        index = cls()
+        weeks = payload.get("weeks") or {}
+        for week in sorted(weeks.keys(), key=int):
+            wk = int(week)
+            index.weeks.append(wk)
+            for m in weeks[week] or []:
+                away, home = m.get("away") or {}, m.get("home") or {}
+                away_score = float(away.get("score") or 0.0)
+                home_score = float(home.get("score") or 0.0)
+                index.scores.append(TeamScore(wk, away.get("id"), away_score, home.get("id"), home_score))
+                index.scores.append(TeamScore(wk, home.get("id"), home_score, away.get("id"), away_score))
+                for side in (away, home):
+                    if not side.get("id"):
+                        continue
+                    index._add_lineup(wk, int(side["id"]), (
+                        Appearance(
+                            week=wk,
+                            team_id=int(side["id"]),
+                            name=pl.get("name") or "Unknown",
+                            position=pl.get("position") or "",
+                            slot=pl.get("slot") or "",
+                            points=float(pl.get("points") or 0.0),
+                            pro_opponent=pl.get("opp") or "",
+                            eligible_slots=tuple(pl.get("eligibleSlots") or ()),
+                        )
+                        for pl in side.get("lineup") or []
+                    ))
+        return index
+
+    def _add_lineup(self, week: int, team_id: int, appearances) -> None:
+        lineup = self._lineups.get((team_id, week))
+        if lineup is None:
+            lineup = self._lineups[(team_id, week)] = []
+            self._teams_by_week.setdefault(week, []).append(team_id)
+        for appearance in appearances:
+            lineup.append(appearance)
+            weeks = self._by_player.get((team_id, appearance.name))
+            if weeks is None:
+                weeks = self._by_player[(team_id, appearance.name)] = {}
+                self._names_by_team.setdefault(team_id, []).append(appearance.name)
+            # a name listed twice in one lineup counts once, as its first entry
+            weeks.setdefault(week, appearance)
+
+    def lineup(self, team_id: int, week: int) -> list[Appearance]:
+        return self._lineups.get((team_id, week), [])
+
+    def week_lineups(self, week: int) -> list[list[Appearance]]:
+        """Every lineup of a week, away side before home within a matchup."""
+        return [self._lineups[(team_id, week)] for team_id in self._teams_by_week.get(week, [])]
+
+    def lineups(self) -> Iterator[tuple[int, int, list[Appearance]]]:
+        """(week, team_id, lineup) in week order, away side before home within a matchup."""
+        for (team_id, week), lineup in self._lineups.items():
+            yield week, team_id, lineup
+
+    def appearances(self) -> Iterator[Appearance]:
+        for lineup in self._lineups.values():
+            yield from lineup
+
+    def player_weeks(self, team_id: int, name: str) -> dict[int, Appearance]:
+        """{week: appearance} for a player on a team."""
+        return self._by_player.get((team_id, name), {})
+
+    def points_on_team(self, team_id: int, name: str) -> tuple[float, int]:
+        """Points a player scored in the team's starting lineup, and the weeks they scored in."""
+        points = 0.0
+        games = 0
+        for appearance in self._by_player.get((team_id, name), {}).values():
+            if appearance.bench:
+                continue
+            points += appearance.points
+            if appearance.points > 0:
+                games += 1
+        return points, games
+
+    def top_players(self, team_id: int, n: int = 3) -> list[tuple[str, float, int]]:
+        """The n players with the most starting points for a team: (name, points, games)."""
+        totals = [(name, *self.points_on_team(team_id, name)) for name in self._names_by_team.get(team_id, [])]
+        totals = [t for t in totals if t[1] > 0]
+        totals.sort(key=lambda t: t[1], reverse=True)
+        return totals[:n]
@@ -8,6 +8,7 @@ Prerequisites:
 
 Run from repo root:
   python supabase/seed.py
+  python supabase/seed.py --compact   # from data-YYYY.season.json.gz (see season_export.py)
 
 Apply this SQL in the Supabase SQL editor before first run:
 
@@ -61,12 +62,55 @@ Apply this SQL in the Supabase SQL editor before first run:
   );
 
   create index if not exists player_slots_matchup_idx on public.player_slots (matchup_id);
+
+  -- pre-aggregated season stats (see analytics.py), rewritten on every sync; the week
+  -- rows are what live syncs rebuild team_season_stats from
+  create table if not exists public.team_week_stats (
+    year int not null references public.seasons(year) on delete cascade,
+    week int not null,
+    team_id uuid not null references public.teams(id) on delete cascade,
+    opponent_id uuid references public.teams(id) on delete cascade,
+    score numeric not null,
+    opponent_score numeric not null,
+    is_playoff boolean not null default false,
+    actual_points numeric not null,
+    optimal_points numeric not null,
+    primary key (year, week, team_id)
+  );
+
+  create table if not exists public.team_season_stats (
+    year int not null references public.seasons(year) on delete cascade,
+    team_id uuid not null references public.teams(id) on delete cascade,
+    wins int not null,
+    losses int not null,
+    ties int not null,
+    points_for numeric not null,
+    points_against numeric not null,
+    weeks_played int not null,
+    high_score numeric,
+    low_score numeric,
+    actual_points numeric not null,
+    optimal_points numeric not null,
+    primary key (year, team_id)
+  );
+
+  -- content digests from the last sync, so in-season syncs only write what changed
+  create table if not exists public.sync_state (
+    year int not null references public.seasons(year) on delete cascade,
+    key text not null,
+    digest text not null,
+    updated_at timestamptz not null default now(),
+    primary key (year, key)
+  );
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
 import os
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -74,6 +118,16 @@ from typing import Any
 from dotenv import load_dotenv
 from supabase import Client, create_client
 
+import analytics
+import season_export
+from season_index import SeasonIndex
+
+
+# Rows per player_slots insert request; SEED_BATCH_SIZE in .env overrides it.
+SLOT_BATCH_SIZE = 1000
+# Matchup ids per player_slots delete; they travel in the request URL.
+DELETE_ID_BATCH = 100
+
 
 def _project_root() -> Path:
     return Path(__file__).resolve().parent.parent
@@ -96,6 +150,29 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _execute(report: dict[str, dict[str, float]], phase: str, query: Any) -> Any:
+    """Run a PostgREST query, adding its round trip and wall time to report[phase]."""
+    start = time.perf_counter()
+    res = query.execute()
+    entry = report.setdefault(phase, {"requests": 0, "rows": 0, "seconds": 0.0})
+    entry["requests"] += 1
+    entry["seconds"] += time.perf_counter() - start
+    return res
+
+
+def format_sync_report(report: dict[str, dict[str, float]]) -> str:
+    """One line per phase: round trips, rows written and wall time."""
+    lines = []
+    for phase, entry in report.items():
+        lines.append(
+            f"  {phase:<22}{entry['requests']:>5} requests{entry['rows']:>7} rows{entry['seconds'] * 1000:>10.1f} ms"
+        )
+    total_requests = sum(e["requests"] for e in report.values())
+    total_seconds = sum(e["seconds"] for e in report.values())
+    lines.append(f"  {'total':<22}{total_requests:>5} requests{'':>12}{total_seconds * 1000:>10.1f} ms")
+    return "\n".join(lines)
+
+
 def _collect_teams_from_weeks(weeks: dict[str, Any]) -> dict[int, dict[str, str]]:
     """espn_id -> {name, owner} (last write wins if duplicates disagree)."""
     teams: dict[int, dict[str, str]] = {}
@@ -143,27 +220,80 @@ def _player_slot_rows(
     return rows
 
 
-def sync_year_payload(client: Client, payload: dict[str, Any]) -> None:
+def _digest(value: Any) -> str:
+    """Stable content hash of a JSON-able value."""
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _load_sync_state(client: Client, year: int, report: dict[str, dict[str, float]]) -> dict[str, str] | None:
+    """key -> digest stored by the last sync, or None when sync_state is unavailable."""
+    try:
+        res = _execute(report, "sync_state", client.table("sync_state").select("key, digest").eq("year", year))
+    except Exception as e:
+        print(f"  sync_state unavailable ({e}); doing a full sync (apply supabase/migrations/003_sync_state.sql)")
+        return None
+    return {r["key"]: r["digest"] for r in (res.data or [])}
+
+
+# sync_state keys scoped to one week: "<kind>:<week>[:<away espn id>:<home espn id>]"
+_WEEK_KEYS = ("week", "matchup", "lineup")
+
+
+def sync_year_payload(
+    client: Client,
+    payload: dict[str, Any],
+    batch_size: int | None = None,
+    incremental: bool = False,
+    merge: bool = False,
+) -> dict[str, dict[str, float]]:
     """
     Idempotent sync for one season JSON object:
     seasons -> teams (upsert on espn_id + year) -> matchups
-    -> delete player_slots for each matchup -> insert fresh slots.
+    -> delete the season's player_slots in bulk -> insert fresh slots in batches.
+
+    Content digests of the draft, teams, each week, each matchup's scores and each
+    matchup's lineups are saved to sync_state. With incremental=True only the parts
+    whose digest changed since the last sync are written; a full sync rewrites
+    everything and refreshes the digests.
+
+    merge=True is for payloads that carry only some weeks (e.g. the live week):
+    weeks missing from the payload keep their rows and stored digests.
+
+    Returns a per-phase report ({phase: {requests, rows, seconds}}), see
+    format_sync_report().
     """
+    if batch_size is None:
+        batch_size = int(os.environ.get("SEED_BATCH_SIZE") or SLOT_BATCH_SIZE)
+    report: dict[str, dict[str, float]] = {}
     year = int(payload["year"])
     current_week = int(payload["current_week"])
     weeks_raw = payload.get("weeks") or {}
     # Normalize week keys to strings like exported JSON
     weeks: dict[str, Any] = {str(k): v for k, v in weeks_raw.items()}
 
+    state = _load_sync_state(client, year, report)
+    stored: dict[str, str] = (state or {}) if incremental else {}
+    digests: dict[str, str] = {}
+    if merge and state:
+        digests.update({k: v for k, v in state.items() if k.split(":")[0] in _WEEK_KEYS and k.split(":")[1] not in weeks})
+
+    def changed(key: str, value: Any) -> bool:
+        digests[key] = _digest(value)
+        return stored.get(key) != digests[key]
+
     now = _now_iso()
-    client.table("seasons").upsert(
-        {"year": year, "current_week": current_week, "updated_at": now},
-        on_conflict="year",
-    ).execute()
+    _execute(
+        report,
+        "seasons",
+        client.table("seasons").upsert(
+            {"year": year, "current_week": current_week, "updated_at": now},
+            on_conflict="year",
+        ),
+    )
+    report["seasons"]["rows"] += 1
 
     # Draft picks (one row per drafted player for the year)
     draft_rows = payload.get("draft") or []
-    client.table("draft_picks").delete().eq("year", year).execute()
     seen: set[str] = set()
     rows = []
     for d in draft_rows:
@@ -180,27 +310,37 @@ def sync_year_payload(client: Client, payload: dict[str, Any]) -> None:
                 "drafted_by": d.get("draftedBy"),
             }
         )
-    if rows:
-        client.table("draft_picks").upsert(rows, on_conflict="year,player_name").execute()
+    if changed("draft", rows):
+        res = _execute(report, "draft_picks", client.table("draft_picks").delete().eq("year", year))
+        report["draft_picks"]["rows"] += len(res.data or [])
+        if rows:
+            _execute(report, "draft_picks", client.table("draft_picks").upsert(rows, on_conflict="year,player_name"))
+            report["draft_picks"]["rows"] += len(rows)
 
     teams_meta = _collect_teams_from_weeks(weeks)
-    if teams_meta:
-        team_rows = [
-            {"espn_id": eid, "year": year, "name": meta["name"], "owner": meta["owner"]}
-            for eid, meta in sorted(teams_meta.items())
-        ]
-        client.table("teams").upsert(team_rows, on_conflict="espn_id,year").execute()
-
-    team_map_res = client.table("teams").select("id, espn_id").eq("year", year).execute()
+    team_rows = [
+        {"espn_id": eid, "year": year, "name": meta["name"], "owner": meta["owner"]}
+        for eid, meta in sorted(teams_meta.items())
+    ]
+    if changed("teams", team_rows) and team_rows:
+        _execute(report, "teams", client.table("teams").upsert(team_rows, on_conflict="espn_id,year"))
+        report["teams"]["rows"] += len(team_rows)
+
+    team_map_res = _execute(report, "teams", client.table("teams").select("id, espn_id").eq("year", year))
     id_by_espn: dict[int, str] = {int(r["espn_id"]): r["id"] for r in (team_map_res.data or [])}
 
     matchup_rows: list[dict[str, Any]] = []
+    # (week, matchup) pairs whose lineups need rewriting
     ordered_matchups: list[tuple[int, dict[str, Any]]] = []
     for wk_str in sorted(weeks.keys(), key=lambda x: int(x)):
         wk = int(wk_str)
         games = weeks.get(wk_str) or []
         if not isinstance(games, list):
             continue
+        if not changed(f"week:{wk}", [games, id_by_espn]):
+            # carry the unchanged matchup and lineup digests forward untouched
+            digests.update({k: v for k, v in stored.items() if k.startswith((f"matchup:{wk}:", f"lineup:{wk}:"))})
+            continue
         for m in games:
             away = m.get("away") or {}
             home = m.get("home") or {}
@@ -210,36 +350,48 @@ def sync_year_payload(client: Client, payload: dict[str, Any]) -> None:
                 continue
             if aid not in id_by_espn or hid not in id_by_espn:
                 continue
-            matchup_rows.append(
-                {
-                    "year": year,
-                    "week": wk,
-                    "away_team_id": id_by_espn[aid],
-                    "home_team_id": id_by_espn[hid],
-                    "away_score": float(away.get("score", 0) or 0),
-                    "home_score": float(home.get("score", 0) or 0),
-                    "away_projected": float(away.get("projected", 0) or 0),
-                    "home_projected": float(home.get("projected", 0) or 0),
-                }
-            )
-            ordered_matchups.append((wk, m))
+            row = {
+                "year": year,
+                "week": wk,
+                "away_team_id": id_by_espn[aid],
+                "home_team_id": id_by_espn[hid],
+                "away_score": float(away.get("score", 0) or 0),
+                "home_score": float(home.get("score", 0) or 0),
+                "away_projected": float(away.get("projected", 0) or 0),
+                "home_projected": float(home.get("projected", 0) or 0),
+            }
+            if changed(f"matchup:{wk}:{aid}:{hid}", row):
+                matchup_rows.append(row)
+            lineups = [row["away_team_id"], row["home_team_id"], away.get("lineup") or [], home.get("lineup") or []]
+            if changed(f"lineup:{wk}:{aid}:{hid}", lineups):
+                ordered_matchups.append((wk, m))
 
     if matchup_rows:
-        client.table("matchups").upsert(
-            matchup_rows,
-            on_conflict="year,week,away_team_id,home_team_id",
-        ).execute()
+        _execute(
+            report,
+            "matchups",
+            client.table("matchups").upsert(
+                matchup_rows,
+                on_conflict="year,week,away_team_id,home_team_id",
+            ),
+        )
+        report["matchups"]["rows"] += len(matchup_rows)
 
-    mid_res = (
-        client.table("matchups")
-        .select("id, week, away_team_id, home_team_id")
-        .eq("year", year)
-        .execute()
-    )
     matchup_key_to_id: dict[tuple[int, str, str], str] = {}
-    for r in mid_res.data or []:
-        matchup_key_to_id[(int(r["week"]), r["away_team_id"], r["home_team_id"])] = r["id"]
+    if ordered_matchups:
+        mid_res = _execute(
+            report,
+            "matchups",
+            client.table("matchups")
+            .select("id, week, away_team_id, home_team_id")
+            .eq("year", year)
+            .in_("week", sorted({wk for wk, _ in ordered_matchups})),
+        )
+        for r in mid_res.data or []:
+            matchup_key_to_id[(int(r["week"]), r["away_team_id"], r["home_team_id"])] = r["id"]
 
+    matchup_ids: list[str] = []
+    slot_rows: list[dict[str, Any]] = []
     for (wk, m) in ordered_matchups:
         away = m.get("away") or {}
         home = m.get("home") or {}
@@ -249,18 +401,145 @@ def sync_year_payload(client: Client, payload: dict[str, Any]) -> None:
             continue
         mid = matchup_key_to_id.get((wk, aid, hid))
         if not mid:
+            # not written, so do not record it as synced
+            digests.pop(f"lineup:{wk}:{int(away.get('id', 0))}:{int(home.get('id', 0))}", None)
             continue
-        client.table("player_slots").delete().eq("matchup_id", mid).execute()
-        slot_rows: list[dict[str, Any]] = []
+        matchup_ids.append(mid)
         slot_rows.extend(_player_slot_rows(mid, team_side="away", lineup=away.get("lineup") or []))
         slot_rows.extend(_player_slot_rows(mid, team_side="home", lineup=home.get("lineup") or []))
-        if slot_rows:
-            client.table("player_slots").insert(slot_rows).execute()
 
+    for i in range(0, len(matchup_ids), DELETE_ID_BATCH):
+        res = _execute(
+            report,
+            "player_slots delete",
+            client.table("player_slots").delete().in_("matchup_id", matchup_ids[i : i + DELETE_ID_BATCH]),
+        )
+        report["player_slots delete"]["rows"] += len(res.data or [])
+    for i in range(0, len(slot_rows), batch_size):
+        batch = slot_rows[i : i + batch_size]
+        _execute(report, "player_slots insert", client.table("player_slots").insert(batch))
+        report["player_slots insert"]["rows"] += len(batch)
+
+    _sync_analytics(client, payload, id_by_espn, report, changed, merge=merge)
+
+    if state is not None:
+        state_rows = [
+            {"year": year, "key": key, "digest": digest, "updated_at": now}
+            for key, digest in digests.items()
+            if state.get(key) != digest
+        ]
+        stale = [key for key in state if key not in digests]
+        if stale:
+            for i in range(0, len(stale), DELETE_ID_BATCH):
+                _execute(
+                    report,
+                    "sync_state",
+                    client.table("sync_state").delete().eq("year", year).in_("key", stale[i : i + DELETE_ID_BATCH]),
+                )
+        if state_rows:
+            _execute(report, "sync_state", client.table("sync_state").upsert(state_rows, on_conflict="year,key"))
+            report["sync_state"]["rows"] += len(state_rows)
+
+    return report
+
+
+def _sync_analytics(
+    client: Client,
+    payload: dict[str, Any],
+    id_by_espn: dict[int, str],
+    report: dict[str, dict[str, float]],
+    changed: Any,
+    merge: bool = False,
+) -> None:
+    """
+    Rewrite the analytics tables for the season (see analytics.py).
+
+    team_week_stats rows are upserted for the payload's weeks (and weeks no longer in the
+    payload deleted unless merge=True); the season, weekly and defense tables are then
+    rebuilt from every stored week, so a live-week payload still yields season totals.
+    Skipped (nothing written, no digests recorded) when the tables do not exist yet.
+    """
+    year = int(payload["year"])
+    try:
+        _execute(report, "analytics", client.table("team_week_stats").select("year").eq("year", year).limit(1))
+    except Exception as e:
+        print(f"  analytics tables unavailable ({e}); apply supabase/migrations/002_analytics_tables.sql")
+        return
+    index = SeasonIndex.from_payload(payload)
+
+    def with_team_ids(row: dict[str, Any], *keys: str) -> dict[str, Any] | None:
+        out = {"year": year, **row}
+        for key in keys:
+            if row[key] is None:
+                continue
+            if row[key] not in id_by_espn:
+                return None
+            out[key] = id_by_espn[row[key]]
+        return out
+
+    week_rows = [
+        r for r in (with_team_ids(row, "team_id", "opponent_id") for row in analytics.team_week_rows(payload, index)) if r
+    ]
+    if changed("analytics:team_week_stats", week_rows):
+        if merge:
+            if week_rows:
+                _execute(report, "analytics", client.table("team_week_stats").upsert(week_rows, on_conflict="year,week,team_id"))
+                report["analytics"]["rows"] += len(week_rows)
+        else:
+            _replace_year_rows(client, report, "team_week_stats", year, ("week", "team_id"), week_rows)
+
+    if merge:
+        res = _execute(
+            report,
+            "analytics",
+            client.table("team_week_stats")
+            .select("week, team_id, score, opponent_score, is_playoff, actual_points, optimal_points")
+            .eq("year", year),
+        )
+        week_rows = res.data or []
+
+    season_rows = [{"year": year, **row} for row in analytics.team_season_rows(week_rows)]
+    if changed("analytics:team_season_stats", season_rows):
+        _replace_year_rows(client, report, "team_season_stats", year, ("team_id",), season_rows)
+
+
+def _replace_year_rows(
+    client: Client,
+    report: dict[str, dict[str, float]],
+    table: str,
+    year: int,
+    keys: tuple[str, ...],
+    rows: list[dict[str, Any]],
+) -> None:
+    """
+    Make a season's rows in an analytics table equal to rows: upsert them, then delete
+    only the stored rows whose (year, *keys) key is no longer present. Readers never see
+    the season half-written or empty, as they would between a delete and its upsert.
+    """
+    res = _execute(report, "analytics", client.table(table).select(", ".join(keys)).eq("year", year))
+    wanted = {tuple(row[k] for k in keys) for row in rows}
+    stale: dict[tuple[Any, ...], list[Any]] = {}
+    for row in res.data or []:
+        key = tuple(row[k] for k in keys)
+        if key not in wanted:
+            stale.setdefault(key[:-1], []).append(key[-1])
+    if rows:
+        _execute(report, "analytics", client.table(table).upsert(rows, on_conflict=",".join(("year", *keys))))
+        report["analytics"]["rows"] += len(rows)
+    for prefix, values in stale.items():
+        query = client.table(table).delete().eq("year", year)
+        for column, value in zip(keys, prefix):
+            query = query.eq(column, value)
+        _execute(report, "analytics", query.in_(keys[-1], values))
 
-def sync_player_season(client: Client, year: int, rows_in: list[dict[str, Any]]) -> None:
-    """Replace full-season player stat lines for a year (rostered + free agents)."""
-    client.table("player_season").delete().eq("year", year).execute()
+
+def sync_player_season(client: Client, year: int, rows_in: list[dict[str, Any]], replace: bool = True) -> None:
+    """
+    Replace full-season player stat lines for a year (rostered + free agents).
+    With replace=False the lines are upserted and players not in rows_in keep theirs.
+    """
+    if replace:
+        client.table("player_season").delete().eq("year", year).execute()
     seen: set[str] = set()
     rows = []
     for f in rows_in:
@@ -318,13 +597,31 @@ def _read_year_json(root: Path, year: int) -> dict[str, Any]:
         return json.load(f)
 
 
+def _read_year_export(root: Path, year: int) -> dict[str, Any]:
+    """The same payload from the compact export written next to data-YYYY.json."""
+    for suffix in (season_export.MSGPACK_SUFFIX, season_export.JSON_SUFFIX):
+        path = root / f"data-{year}{suffix}"
+        if path.is_file():
+            return season_export.load_payload(path)
+    raise FileNotFoundError(f"Missing data-{year}{season_export.JSON_SUFFIX} at project root")
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Load the season exports into Supabase.")
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help=f"read data-YYYY{season_export.JSON_SUFFIX} (or {season_export.MSGPACK_SUFFIX}) instead of data-YYYY.json",
+    )
+    args = parser.parse_args()
+
     root = _project_root()
     client = create_supabase_client()
     for year in (2024, 2025):
         print(f"Seeding {year}…")
-        payload = _read_year_json(root, year)
-        sync_year_payload(client, payload)
+        payload = _read_year_export(root, year) if args.compact else _read_year_json(root, year)
+        report = sync_year_payload(client, payload)
+        print(format_sync_report(report))
         print(f"Done {year}.")
     print("Seed complete.")
 
@@ -5,7 +5,8 @@ Requires python-dotenv and a .env file (see .env.example) with ESPN_LEAGUE_ID, E
 
 What this does:
 - Fetches matchups for years in YEARS.
-- Writes data-YYYY.json for each year (weeks, matchups, lineups).
+- Writes data-YYYY.json for each year (weeks, matchups, lineups), plus the compact
+  data-YYYY.season.json.gz export that `seed.py --compact` reads (season_export.py).
 - Writes a small index.html shell that loads app.js to render on demand.
 
 To keep your RB/WR/Fraud/Team Pages:
@@ -15,6 +16,12 @@ To keep your RB/WR/Fraud/Team Pages:
 """
 
 from espn_api.football import League
+from espn_api.requests import ResponseCache
+from espn_api.requests import replay as espn_replay
+from season_index import SeasonIndex
+from lineup_optimizer import LineupOptimizer
+import season_export
+import atexit
 import json
 import math
 import os
@@ -30,6 +37,17 @@ ESPN_S2 = os.getenv("ESPN_S2")
 SWID = os.getenv("ESPN_SWID")
 YEARS = [2025, 2024]  # order matters: first year becomes default view
 YEAR_DEFAULT = YEARS[0]
+# Optional on-disk ESPN response cache; completed weeks are then only downloaded once
+ESPN_CACHE_DIR = os.getenv("ESPN_CACHE_DIR")
+RESPONSE_CACHE = ResponseCache(ESPN_CACHE_DIR) if ESPN_CACHE_DIR else None
+# Optional record/replay of all ESPN traffic (gzip json archive) for offline runs;
+# when replaying, ESPN_S2/ESPN_SWID only need placeholder values
+ESPN_RECORD = os.getenv("ESPN_RECORD")
+ESPN_REPLAY = os.getenv("ESPN_REPLAY")
+if ESPN_REPLAY:
+    espn_replay.replay(ESPN_REPLAY, latency=float(os.getenv("ESPN_REPLAY_LATENCY", "0")))
+elif ESPN_RECORD:
+    atexit.register(espn_replay.record(ESPN_RECORD).save)
 
 # ---------- Helpers ----------
 def get_owner_name(team):
@@ -71,6 +89,15 @@ def build_year_json(league, all_weeks_data, year):
         "current_week": league.current_week,
         "weeks": {}
     }
+    # starting slots for optimal lineups and the regular-season length for records
+    # (analytics.team_week_rows)
+    settings = getattr(league, 'settings', None)
+    slot_counts = getattr(settings, 'position_slot_counts', None)
+    if slot_counts:
+        out["slot_counts"] = dict(slot_counts)
+    reg_season_count = getattr(settings, 'reg_season_count', None)
+    if reg_season_count:
+        out["playoff_start_week"] = int(reg_season_count) + 1
 
     for week in sorted(all_weeks_data.keys()):
         matchups = []
@@ -177,23 +204,17 @@ def build_player_season(league, payload):
         }
 
     out = {}
-    ids = list(id_by_name.values())
-    CHUNK = 40
-    for i in range(0, len(ids), CHUNK):
-        chunk = ids[i:i + CHUNK]
-        try:
-            res = league.player_info(playerId=chunk)
-        except Exception as e:
-            print(f"  player_season chunk error {e}")
-            continue
-        if res is None:
-            continue
-        if not isinstance(res, list):
-            res = [res]
-        for pl in res:
-            nm = getattr(pl, "name", None)
-            if nm:
-                out[nm] = line_from_player(pl)
+    ids = sorted(id_by_name.values())
+    errors = {}
+    # archives only hold the chunks they recorded, so chunking stays fixed while recording/replaying
+    cards = league.player_cards(ids, chunk_size=40, errors=errors, target_seconds=None if espn_replay.active() else 1.0)
+    if errors:
+        print(f"  player_season: {len(errors)} players failed ({next(iter(errors.values()))})")
+    for pid in ids:
+        pl = cards.get(pid)
+        nm = getattr(pl, "name", None)
+        if nm:
+            out[nm] = line_from_player(pl)
 
     # free agents (full season already)
     for f in build_free_agents(league):
@@ -211,13 +232,14 @@ def build_free_agents(league):
     out = []
     seen = set()
     week = getattr(league, "current_week", None) or 1
-    for pos in ["QB", "RB", "WR", "TE", "K", "D/ST"]:
-        try:
-            fas = league.free_agents(week=week, size=250, position=pos)
-        except Exception as e:
-            print(f"  Free agents {pos}: error {e}")
-            continue
-        for p in fas:
+    positions = ["QB", "RB", "WR", "TE", "K", "D/ST"]
+    try:
+        pool = league.free_agent_pool(week=week, positions=positions, size=250)
+    except Exception as e:
+        print(f"  Free agents: error {e}")
+        return out
+    for pos in positions:
+        for p in pool[pos]:
             name = getattr(p, "name", None)
             if not name or name in seen:
                 continue
@@ -467,7 +489,7 @@ def collect_running_backs(league):
     
     # Get free agent RBs
     try:
-        free_agent_rbs = league.free_agents(week=league.current_week, position='RB', size=100)
+        free_agent_rbs = league.free_agent_pool(week=league.current_week, positions=['RB'], size=100)['RB']
         for player in free_agent_rbs:
             if hasattr(player, 'position') and player.position == 'RB':
                 # Check if we already have this player (avoid duplicates)
@@ -747,7 +769,7 @@ def collect_wide_receivers(league):
     
     # Get free agent WRs
     try:
-        free_agent_wrs = league.free_agents(week=league.current_week, position='WR', size=100)
+        free_agent_wrs = league.free_agent_pool(week=league.current_week, positions=['WR'], size=100)['WR']
         for player in free_agent_wrs:
             if hasattr(player, 'position') and player.position == 'WR':
                 # Check if we already have this player (avoid duplicates)
@@ -924,9 +946,11 @@ def get_ordinal_suffix(n):
         suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
     return f"{n}{suffix}"
 
-def get_team_year_stats(league, all_weeks_data=None):
+def get_team_year_stats(league, all_weeks_data=None, index=None):
     """Get team statistics for a specific year including record, playoff placement, and top 3 players"""
     teams_data = []
+    if index is None and all_weeks_data:
+        index = SeasonIndex.from_box_scores(all_weeks_data)
     
     for team in league.teams:
         # Get team record
@@ -966,56 +990,8 @@ def get_team_year_stats(league, all_weeks_data=None):
                 points_on_team = 0.0
                 games_on_team = 0
                 
-                if all_weeks_data:
-                    # Look through all weeks to find when this player was on this team
-                    for week in sorted(all_weeks_data.keys()):
-                        player_found_this_week = False
-                        
-                        for matchup in all_weeks_data[week]:
-                            if not matchup or not hasattr(matchup, 'home_team') or not matchup.home_team:
-                                continue
-                            
-                            # Check away team lineup
-                            if matchup.away_team and matchup.away_team.team_id == team.team_id:
-                                away_lineup = getattr(matchup, 'away_lineup', []) or []
-                                for p in away_lineup:
-                                    if hasattr(p, 'name') and p.name == player.name:
-                                        # Check if player is in starting lineup (not bench)
-                                        slot = getattr(p, 'slot_position', '') or getattr(p, 'lineupSlot', '')
-                                        if slot in ['BE', 'IR']:
-                                            # Skip bench players
-                                            player_found_this_week = True
-                                            break
-                                        
-                                        points = getattr(p, 'points', 0.0) or 0.0
-                                        points_on_team += points
-                                        if points > 0:
-                                            games_on_team += 1
-                                        player_found_this_week = True
-                                        break
-                                if player_found_this_week:
-                                    break
-                            
-                            # Check home team lineup
-                            if not player_found_this_week and matchup.home_team and matchup.home_team.team_id == team.team_id:
-                                home_lineup = getattr(matchup, 'home_lineup', []) or []
-                                for p in home_lineup:
-                                    if hasattr(p, 'name') and p.name == player.name:
-                                        # Check if player is in starting lineup (not bench)
-                                        slot = getattr(p, 'slot_position', '') or getattr(p, 'lineupSlot', '')
-                                        if slot in ['BE', 'IR']:
-                                            # Skip bench players
-                                            player_found_this_week = True
-                                            break
-                                        
-                                        points = getattr(p, 'points', 0.0) or 0.0
-                                        points_on_team += points
-                                        if points > 0:
-                                            games_on_team += 1
-                                        player_found_this_week = True
-                                        break
-                                if player_found_this_week:
-                                    break
+                if index is not None and index.weeks:
+                    points_on_team, games_on_team = index.points_on_team(team.team_id, player.name)
                 else:
                     # Fallback: use total_points if no matchup data available
                     points_on_team = getattr(player, 'total_points', 0.0) or 0.0
@@ -1154,59 +1130,29 @@ def is_week_concluded(league, week, box_scores):
     
     return True  # All games appear to be complete
 
-def find_club_performances(league, all_weeks_data):
+def find_club_performances(league, all_weeks_data, index=None):
     """Find teams that scored 200+ or sub-100 in any week"""
     club_200 = []  # Teams that scored 200+
     club_sub100 = []  # Teams that scored < 100
+    if index is None:
+        index = SeasonIndex.from_box_scores(all_weeks_data)
     
-    for week, box_scores in all_weeks_data.items():
-        # For sub-100 club, skip current week if it hasn't concluded
+    for side in index.scores:
         # Always skip current week for sub-100 club to avoid showing incomplete scores
-        skip_sub100_this_week = (week == league.current_week)
-        
-        for matchup in box_scores:
-            if not matchup.home_team:
-                continue
-            
-            # Check away team
-            if matchup.away_score >= 200:
-                club_200.append({
-                    'team': matchup.away_team,
-                    'score': matchup.away_score,
-                    'week': week,
-                    'opponent': matchup.home_team,
-                    'opponent_score': matchup.home_score,
-                    'won': matchup.away_score > matchup.home_score
-                })
-            elif matchup.away_score < 100 and not skip_sub100_this_week:
-                club_sub100.append({
-                    'team': matchup.away_team,
-                    'score': matchup.away_score,
-                    'week': week,
-                    'opponent': matchup.home_team,
-                    'opponent_score': matchup.home_score,
-                    'won': matchup.away_score > matchup.home_score
-                })
-            
-            # Check home team
-            if matchup.home_score >= 200:
-                club_200.append({
-                    'team': matchup.home_team,
-                    'score': matchup.home_score,
-                    'week': week,
-                    'opponent': matchup.away_team,
-                    'opponent_score': matchup.away_score,
-                    'won': matchup.home_score > matchup.away_score
-                })
-            elif matchup.home_score < 100 and not skip_sub100_this_week:
-                club_sub100.append({
-                    'team': matchup.home_team,
-                    'score': matchup.home_score,
-                    'week': week,
-                    'opponent': matchup.away_team,
-                    'opponent_score': matchup.away_score,
-                    'won': matchup.home_score > matchup.away_score
-                })
+        if side.score >= 200:
+            club = club_200
+        elif side.score < 100 and side.week != league.current_week:
+            club = club_sub100
+        else:
+            continue
+        club.append({
+            'team': side.team,
+            'score': side.score,
+            'week': side.week,
+            'opponent': side.opponent,
+            'opponent_score': side.opponent_score,
+            'won': side.won
+        })
     
     # Sort by score (descending for 200 club, ascending for sub-100 club)
     club_200.sort(key=lambda x: x['score'], reverse=True)
@@ -1518,9 +1464,14 @@ def generate_mismanagement_rows(mismanagement_data):
     
     return rows_html
 
-def calculate_mismanagement_leaderboard(league, all_weeks_data):
+def calculate_mismanagement_leaderboard(league, all_weeks_data, index=None):
     """Calculate mismanagement scores - difference between optimal and actual lineups"""
     team_mismanagement = {}
+    if index is None:
+        index = SeasonIndex.from_box_scores(all_weeks_data)
+    # Optimal lineups use the league's own starting slots (superflex, extra flex, ...)
+    settings = getattr(league, 'settings', None)
+    optimizer = LineupOptimizer(getattr(settings, 'position_slot_counts', None))
     
     # Initialize teams
     for team in league.teams:
@@ -1533,29 +1484,9 @@ def calculate_mismanagement_leaderboard(league, all_weeks_data):
             'weeks': []
         }
     
-    # Process each week
-    for week in sorted(all_weeks_data.keys()):
-        for matchup in all_weeks_data[week]:
-            if not matchup or not hasattr(matchup, 'home_team') or not matchup.home_team:
-                continue
-            
-            # Process away team
-            if matchup.away_team:
-                process_team_mismanagement(
-                    matchup.away_team, 
-                    getattr(matchup, 'away_lineup', []) or [],
-                    week,
-                    team_mismanagement
-                )
-            
-            # Process home team
-            if matchup.home_team:
-                process_team_mismanagement(
-                    matchup.home_team,
-                    getattr(matchup, 'home_lineup', []) or [],
-                    week,
-                    team_mismanagement
-                )
+    # Process each team's lineup week by week
+    for week, team_id, lineup in index.lineups():
+        process_team_mismanagement(team_id, lineup, week, team_mismanagement, optimizer)
     
     # Convert to list and calculate percentage of optimal points scored
     mismanagement_list = []
@@ -1579,9 +1510,9 @@ def calculate_mismanagement_leaderboard(league, all_weeks_data):
     mismanagement_list.sort(key=lambda x: x['percentage_scored'])
     return mismanagement_list
 
-def process_team_mismanagement(team, lineup, week, team_mismanagement):
-    """Calculate optimal vs actual lineup for a team in a given week"""
-    if team.team_id not in team_mismanagement:
+def process_team_mismanagement(team_id, lineup, week, team_mismanagement, optimizer=None):
+    """Calculate optimal vs actual lineup for a team in a given week (lineup is SeasonIndex appearances)"""
+    if team_id not in team_mismanagement:
         return
     
     # Get all players (both starting and bench)
@@ -1589,135 +1520,40 @@ def process_team_mismanagement(team, lineup, week, team_mismanagement):
     actual_starting_score = 0.0
     
     for player in lineup:
-        slot = getattr(player, 'slot_position', '') or getattr(player, 'lineupSlot', '')
-        points = getattr(player, 'points', 0.0) or 0.0
-        position = getattr(player, 'position', '')
-        
-        # Store player info
-        all_players.append({
-            'name': getattr(player, 'name', 'Unknown'),
-            'position': position,
-            'slot': slot,
-            'points': points
-        })
+        all_players.append((player.points, player.eligible_slots, player.position))
         
         # Count actual starting lineup points (exclude bench)
-        if slot not in ['BE', 'IR']:
-            actual_starting_score += points
+        if not player.bench:
+            actual_starting_score += player.points
     
     # Calculate optimal lineup
-    optimal_score = calculate_optimal_lineup_score(all_players)
+    optimal_score = (optimizer or LineupOptimizer()).best_score(all_players)
     
     # Calculate mismanagement (difference)
     mismanagement = optimal_score - actual_starting_score
     
     # Store the data
-    team_mismanagement[team.team_id]['total_mismanagement'] += mismanagement
-    team_mismanagement[team.team_id]['total_optimal_points'] += optimal_score
-    team_mismanagement[team.team_id]['total_actual_points'] += actual_starting_score
-    team_mismanagement[team.team_id]['weeks'].append({
+    team_mismanagement[team_id]['total_mismanagement'] += mismanagement
+    team_mismanagement[team_id]['total_optimal_points'] += optimal_score
+    team_mismanagement[team_id]['total_actual_points'] += actual_starting_score
+    team_mismanagement[team_id]['weeks'].append({
         'week': week,
         'optimal': round(optimal_score, 2),
         'actual': round(actual_starting_score, 2),
         'mismanagement': round(mismanagement, 2)
     })
 
-def calculate_optimal_lineup_score(all_players):
-    """Calculate the best possible lineup score from available players"""
-    # Group players by position
-    qbs = []
-    rbs = []
-    wrs = []
-    tes = []
-    dsts = []
-    ks = []
-    
-    for p in all_players:
-        pos = p['position']
-        if pos == 'QB':
-            qbs.append(p)
-        elif pos == 'RB':
-            rbs.append(p)
-        elif pos == 'WR':
-            wrs.append(p)
-        elif pos == 'TE':
-            tes.append(p)
-        elif pos == 'DST' or pos == 'D/ST':
-            dsts.append(p)
-        elif pos == 'K':
-            ks.append(p)
-    
-    # Sort by points descending
-    qbs.sort(key=lambda x: x['points'], reverse=True)
-    rbs.sort(key=lambda x: x['points'], reverse=True)
-    wrs.sort(key=lambda x: x['points'], reverse=True)
-    tes.sort(key=lambda x: x['points'], reverse=True)
-    dsts.sort(key=lambda x: x['points'], reverse=True)
-    ks.sort(key=lambda x: x['points'], reverse=True)
-    
-    # Build optimal lineup (standard: 1 QB, 2 RB, 2 WR, 1 TE, 1 FLEX, 1 D/ST, 1 K)
-    optimal_score = 0.0
-    
-    # QB
-    if qbs:
-        optimal_score += qbs[0]['points']
-    
-    # RBs (2)
-    for i in range(min(2, len(rbs))):
-        optimal_score += rbs[i]['points']
-    
-    # WRs (2)
-    for i in range(min(2, len(wrs))):
-        optimal_score += wrs[i]['points']
-    
-    # TE
-    if tes:
-        optimal_score += tes[0]['points']
-    
-    # FLEX (best remaining RB/WR/TE)
-    flex_candidates = []
-    if len(rbs) > 2:
-        flex_candidates.extend(rbs[2:])
-    if len(wrs) > 2:
-        flex_candidates.extend(wrs[2:])
-    if len(tes) > 1:
-        flex_candidates.extend(tes[1:])
-    
-    flex_candidates.sort(key=lambda x: x['points'], reverse=True)
-    if flex_candidates:
-        optimal_score += flex_candidates[0]['points']
-    
-    # D/ST
-    if dsts:
-        optimal_score += dsts[0]['points']
-    
-    # K
-    if ks:
-        optimal_score += ks[0]['points']
-    
-    return optimal_score
-
-def collect_defense_rankings(league, all_weeks_data):
+def collect_defense_rankings(league, all_weeks_data, index=None):
     """Collect defense rankings based on RB and WR points scored against them"""
     defense_stats = {}
+    if index is None:
+        index = SeasonIndex.from_box_scores(all_weeks_data)
     
     # Process each week
-    for week in sorted(all_weeks_data.keys()):
-        # Process players from matchups (lineups include starters and bench)
-        for matchup in all_weeks_data[week]:
-            if not matchup or not hasattr(matchup, 'home_team') or not matchup.home_team:
-                continue
-            
-            # Get all players from both teams (lineup includes starters and bench)
-            away_lineup = getattr(matchup, 'away_lineup', []) or []
-            home_lineup = getattr(matchup, 'home_lineup', []) or []
-            
-            # Process all players from away team (including bench)
-            for player in away_lineup:
-                process_player_for_defense(player, defense_stats, week)
-            
-            # Process all players from home team (including bench)
-            for player in home_lineup:
+    for week in index.weeks:
+        # Process players from both teams' lineups (starters and bench)
+        for lineup in index.week_lineups(week):
+            for player in lineup:
                 process_player_for_defense(player, defense_stats, week)
         
         # Also process players from all team rosters to get complete data
@@ -1967,11 +1803,13 @@ def generate_defense_rankings_html(defense_data):
     </div>
     """
 
-def generate_fraud_watch_html(league, all_weeks_data):
+def generate_fraud_watch_html(league, all_weeks_data, index=None):
     """Generate HTML for fraud watch page and club pages"""
+    if index is None:
+        index = SeasonIndex.from_box_scores(all_weeks_data)
     fraud_data = calculate_fraud_watch(league)
-    club_200, club_sub100 = find_club_performances(league, all_weeks_data)
-    mismanagement_data = calculate_mismanagement_leaderboard(league, all_weeks_data)
+    club_200, club_sub100 = find_club_performances(league, all_weeks_data, index=index)
+    mismanagement_data = calculate_mismanagement_leaderboard(league, all_weeks_data, index=index)
     
     # Fraud Watch rows
     fraud_rows_html = ""
@@ -2538,8 +2376,10 @@ def generate_team_pages_html(teams_2024_data, teams_2025_data):
     </div>
     """
 
-def generate_shared_content_html(rbs, wrs, league_2025, all_weeks_data_2025, teams_2024_data, teams_2025_data):
+def generate_shared_content_html(rbs, wrs, league_2025, all_weeks_data_2025, teams_2024_data, teams_2025_data, index_2025=None):
     """Generate HTML content shared across years (Weekly Matchups, Player Comparisons, Year Stats, Team Pages)"""
+    if index_2025 is None:
+        index_2025 = SeasonIndex.from_box_scores(all_weeks_data_2025)
     
     # Generate year selector buttons dynamically
     year_buttons_html = ""
@@ -2577,7 +2417,7 @@ def generate_shared_content_html(rbs, wrs, league_2025, all_weeks_data_2025, tea
     wr_comparison_html = generate_wr_comparison_html(wrs)
     
     # Add Defense Rankings content (using 2025 data)
-    defense_data = collect_defense_rankings(league_2025, all_weeks_data_2025)
+    defense_data = collect_defense_rankings(league_2025, all_weeks_data_2025, index=index_2025)
     defense_rankings_html = generate_defense_rankings_html(defense_data)
     
     # Add Draft Pick Value content (using 2025 data)
@@ -2611,7 +2451,7 @@ def generate_shared_content_html(rbs, wrs, league_2025, all_weeks_data_2025, tea
     """
     
     # Add Total Year Stats content (using 2025 data)
-    year_stats_html = generate_fraud_watch_html(league_2025, all_weeks_data_2025)
+    year_stats_html = generate_fraud_watch_html(league_2025, all_weeks_data_2025, index=index_2025)
     
     # Add Team Pages content
     team_pages_html = generate_team_pages_html(teams_2024_data, teams_2025_data)
@@ -2634,7 +2474,7 @@ def main():
     for year in YEARS:
         print(f"\nProcessing Year {year}")
         try:
-            league = League(league_id=LEAGUE_ID, year=year, espn_s2=ESPN_S2, swid=SWID)
+            league = League(league_id=LEAGUE_ID, year=year, espn_s2=ESPN_S2, swid=SWID, cache=RESPONSE_CACHE)
         except Exception as e:
             print(f"ERROR: Failed to connect to league for year {year}: {e}")
             continue
@@ -2656,14 +2496,13 @@ def main():
         print(f"Current week for {year}: {current_week}")
         print(f"Fetching box scores weeks 1..{current_week}")
 
-        all_weeks_data = {}
+        errors = {}
+        all_weeks_data = league.box_scores_range(range(1, current_week + 1), errors=errors)
         for week in range(1, current_week + 1):
-            try:
-                box_scores = league.box_scores(week=week)
-                all_weeks_data[week] = box_scores
-                print(f"  Week {week}: OK ({len(box_scores)} matchups)")
-            except Exception as e:
-                print(f"  Week {week}: Error {e}")
+            if week in errors:
+                print(f"  Week {week}: Error {errors[week]}")
+            elif week in all_weeks_data:
+                print(f"  Week {week}: OK ({len(all_weeks_data[week])} matchups)")
 
         if year == 2025:
             all_weeks_data_2025 = all_weeks_data
@@ -2672,6 +2511,8 @@ def main():
         with open(f"data-{year}.json", "w", encoding="utf-8") as f:
             json.dump(year_json, f)
         print(f"Wrote data-{year}.json")
+        export_path = f"data-{year}{season_export.JSON_SUFFIX}"
+        print(f"Wrote {export_path} ({season_export.write_export(year_json, export_path) // 1024} KiB)")
 
     # If you pasted your old shared generators above, this will work unchanged:
     if "generate_shared_content_html" in globals() and league_2025:
@@ -2683,22 +2524,22 @@ def main():
         all_weeks_data_2024 = None
         if league_2024:
             try:
-                all_weeks_data_2024 = {}
                 current_week_2024 = league_2024.current_week
-                for week in range(1, current_week_2024 + 1):
-                    try:
-                        box_scores = league_2024.box_scores(week=week)
-                        all_weeks_data_2024[week] = box_scores
-                    except Exception as e:
-                        print(f"  Warning: Could not fetch week {week} for 2024: {e}")
+                errors_2024 = {}
+                all_weeks_data_2024 = league_2024.box_scores_range(range(1, current_week_2024 + 1), errors=errors_2024)
+                for week, e in sorted(errors_2024.items()):
+                    print(f"  Warning: Could not fetch week {week} for 2024: {e}")
             except Exception as e:
                 print(f"  Warning: Could not fetch matchup data for 2024: {e}")
         
-        teams_2024_data = get_team_year_stats(league_2024, all_weeks_data_2024) if league_2024 else []
-        teams_2025_data = get_team_year_stats(league_2025, all_weeks_data_2025) if league_2025 else []
+        # one pass over each season's lineups, shared by every collector below
+        index_2024 = SeasonIndex.from_box_scores(all_weeks_data_2024) if all_weeks_data_2024 else None
+        index_2025 = SeasonIndex.from_box_scores(all_weeks_data_2025) if all_weeks_data_2025 else None
+        teams_2024_data = get_team_year_stats(league_2024, all_weeks_data_2024, index=index_2024) if league_2024 else []
+        teams_2025_data = get_team_year_stats(league_2025, all_weeks_data_2025, index=index_2025) if league_2025 else []
         shared_content_html = generate_shared_content_html(
             rbs_2025, wrs_2025, league_2025, all_weeks_data_2025,
-            teams_2024_data, teams_2025_data
+            teams_2024_data, teams_2025_data, index_2025=index_2025
         )
     else:
         print("\nShared pages skipped (functions not present).")
@@ -2712,7 +2553,10 @@ def main():
     print("\nDone! Outputs:")
     for year in YEARS:
         print(f" - data-{year}.json")
+        print(f" - data-{year}{season_export.JSON_SUFFIX}")
     print(" - index.html (tiny shell)")
+    if RESPONSE_CACHE:
+        print(f"ESPN cache: {RESPONSE_CACHE.stats}")
     print("\nOpen index.html in your browser.")
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+from unittest import TestCase
+
+from espn_api.basketball.box_player import BoxPlayer
+from espn_api.basketball.player import Player
+
+
+def player_data(average_stats):
+    return {
+        'lineupSlotId': 0,
+        'playerPoolEntry': {'player': {
+            'fullName': 'Test Guard', 'id': 1, 'defaultPositionId': 1, 'eligibleSlots': [0, 5],
+            'proTeamId': 2, 'injuryStatus': 'ACTIVE',
+            'stats': [{
+                'seasonId': 2025, 'id': '002025', 'scoringPeriodId': 0,
+                'appliedTotal': 100, 'appliedAverage': 25.123,
+                'stats': {'0': 100.0, '19': 0.5},
+                'averageStats': average_stats,
+            }],
+        }},
+    }
+
+
+class PlayerTest(TestCase):
+    def test_nine_cat_averages(self):
+        player = Player(player_data({'0': 25.04, '19': 0.48765}), 2025)
+
+        self.assertEqual(player.nine_cat_averages, {'PTS': 25.0, 'FG%': 0.488})
+        self.assertIs(player.nine_cat_averages, player.nine_cat_averages)
+        self.assertFalse(hasattr(player, '__dict__'))
+
+    def test_box_player_nine_cat_averages(self):
+        player = BoxPlayer(player_data({'1': 1.26}), {}, 2025, 1)
+
+        self.assertEqual(player.nine_cat_averages, {'BLK': 1.3})
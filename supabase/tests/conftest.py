@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# espn_api and the sync scripts import from supabase/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
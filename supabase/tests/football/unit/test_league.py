@@ -0,0 +1,80 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+from espn_api.football import League
+
+ELIGIBLE_SLOTS = {'QB': [0, 7, 20, 21], 'RB': [2, 3, 23, 7, 20, 21], 'WR': [3, 4, 5, 23, 7, 20, 21],
+                  'K': [17, 20, 21], 'D/ST': [16, 20, 21]}
+
+
+def free_agent_pool():
+    '''best owned first: mostly RBs and WRs, a few QBs, kickers and defenses'''
+    players = []
+    for i in range(60):
+        position = ('RB', 'WR', 'RB', 'WR', 'QB', 'K', 'D/ST')[i % 7] if i < 28 else ('RB', 'WR')[i % 2]
+        players.append({'player': {'id': i, 'fullName': f'{position} {i}', 'proTeamId': 1, 'defaultPositionId': 1,
+                                   'eligibleSlots': ELIGIBLE_SLOTS[position], 'stats': []}})
+    return players
+
+
+class FakeRequests(object):
+    '''kona_player_info over free_agent_pool() with ESPN's slot filter, offset and limit'''
+    def __init__(self, league):
+        self.pool = free_agent_pool()
+        self.filters = []
+        self.timings = league.espn_request.timings
+
+    def league_get(self, params=None, headers=None):
+        players = json.loads(headers['x-fantasy-filter'])['players']
+        slots = players['filterSlotIds']['value']
+        self.filters.append(slots)
+        matching = [p for p in self.pool if not slots or set(slots) & set(p['player']['eligibleSlots'])]
+        offset = players.get('offset', 0)
+        return {'players': matching[offset:offset + players['limit']]}
+
+
+class FreeAgentPoolTest(TestCase):
+    def setUp(self):
+        self.league = League(league_id=1, year=2025, fetch_league=False)
+        self.league.current_week = 3
+        self.requests = FakeRequests(self.league)
+        self.league.espn_request = self.requests
+        for name in ('_get_pro_schedule', '_get_positional_ratings'):
+            patcher = patch.object(League, name, return_value={})
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def expected(self, position, size):
+        players = [p['player'] for p in free_agent_pool() if p['player']['fullName'].startswith(position + ' ')]
+        return [p['id'] for p in players][:size]
+
+    def test_positions_match_single_position_filters(self):
+        positions = ['QB', 'RB', 'WR', 'K', 'D/ST']
+        pool = self.league.free_agent_pool(positions=positions, size=8, page_size=10)
+
+        for position in positions:
+            self.assertEqual([p.playerId for p in pool[position]], self.expected(position, 8))
+
+    def test_short_positions_stop_when_they_run_out(self):
+        pool = self.league.free_agent_pool(positions=['RB', 'WR', 'K', 'D/ST'], size=8, page_size=10)
+
+        # one filter until RBs and WRs have 8, then kickers and defenses alone until they run
+        # out, instead of reading all 60 players
+        self.assertEqual(self.requests.filters, [[2, 4, 16, 17]] * 3 + [[16, 17]])
+        self.assertEqual([p.playerId for p in pool['K']], self.expected('K', 8))
+
+    def test_memo_fetches_only_new_positions(self):
+        self.league.free_agent_pool(positions=['RB', 'WR'], size=5, page_size=20)
+        self.league.free_agent_pool(positions=['RB'], size=3, page_size=20)
+        pool = self.league.free_agent_pool(positions=['RB', 'WR', 'QB'], size=5, page_size=20)
+
+        self.assertEqual(self.requests.filters, [[2, 4], [0]])
+        self.assertEqual([p.playerId for p in pool['QB']], self.expected('QB', 5))
+
+    def test_memo_pages_further_for_a_larger_size(self):
+        self.league.free_agent_pool(positions=['RB', 'WR'], size=5, page_size=10)
+        pool = self.league.free_agent_pool(positions=['RB', 'WR'], size=20, page_size=10)
+
+        self.assertEqual([p.playerId for p in pool['RB']], self.expected('RB', 20))
+        self.assertEqual([p.playerId for p in pool['WR']], self.expected('WR', 20))
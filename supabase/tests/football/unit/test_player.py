@@ -0,0 +1,53 @@
+import copy
+import json
+import pickle
+from unittest import TestCase
+
+from espn_api.football.player import PlayerStats
+
+
+def splits():
+    return {
+        1: [
+            {'statSourceId': 0, 'appliedTotal': 12.345, 'appliedAverage': 12.345,
+             'stats': {'3': 250.0}, 'appliedStats': {'3': 10.0}},
+            {'statSourceId': 1, 'appliedTotal': 15.0, 'stats': {'3': 280.0}, 'appliedStats': {'3': 11.2}},
+        ],
+        2: [{'statSourceId': 0, 'appliedTotal': 4.0, 'stats': {}, 'appliedStats': {}}],
+    }
+
+
+class PlayerStatsTest(TestCase):
+    def setUp(self):
+        self.decoded = PlayerStats(splits())
+        self.decoded._decode_all()
+
+    def test_json_dumps_undecoded(self):
+        stats = PlayerStats(splits())
+
+        self.assertEqual(json.loads(json.dumps(stats)), json.loads(json.dumps(dict(self.decoded))))
+        self.assertEqual(json.loads(json.dumps(stats))['1']['points'], 12.35)
+
+    def test_equality_undecoded(self):
+        self.assertEqual(PlayerStats(splits()), PlayerStats(splits()))
+        self.assertEqual(PlayerStats(splits()), self.decoded)
+        self.assertEqual(self.decoded, PlayerStats(splits()))
+        self.assertEqual(dict(self.decoded), PlayerStats(splits()))
+        self.assertEqual(PlayerStats(splits()), dict(self.decoded))
+        self.assertFalse(PlayerStats(splits()) != PlayerStats(splits()))
+        self.assertNotEqual(PlayerStats(splits()), {1: {}})
+
+    def test_lazy_reads(self):
+        stats = PlayerStats(splits())
+
+        self.assertEqual(len(stats), 2)
+        self.assertEqual(list(stats), [1, 2])
+        self.assertEqual(stats.totals(1), {'points': 12.35, 'avg_points': 12.35, 'projected_points': 15.0, 'projected_avg_points': 0})
+        self.assertEqual(stats[2]['points'], 4.0)
+        self.assertIn(1, stats._raw)
+
+    def test_copies_are_decoded(self):
+        for copied in (dict(PlayerStats(splits())), {**PlayerStats(splits())}, PlayerStats(splits()).copy(),
+                       copy.deepcopy(PlayerStats(splits())), pickle.loads(pickle.dumps(PlayerStats(splits()))),
+                       {} | PlayerStats(splits()), PlayerStats(splits()) | {}):
+            self.assertEqual(copied, dict(self.decoded))
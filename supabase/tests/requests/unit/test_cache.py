@@ -0,0 +1,50 @@
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from espn_api.requests.cache import ResponseCache
+
+
+class FakeSession(object):
+    def __init__(self, *bodies):
+        self.bodies = list(bodies)
+        self.calls = 0
+
+    def get(self, endpoint, params=None, headers=None, cookies=None, timeout=None):
+        r = requests.Response()
+        r.status_code = 200
+        r.url = endpoint
+        r._content = self.bodies[min(self.calls, len(self.bodies) - 1)]
+        self.calls += 1
+        return r
+
+
+class ResponseCacheTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_ttl_after_rollover(self):
+        params = {'view': 'mMatchupScore', 'scoringPeriodId': 4}
+
+        # week 4 right after week 5 went live still takes stat corrections
+        self.assertEqual(self.cache.ttl(params, live_scoring_period=5), 60)
+        self.assertEqual(self.cache.ttl(params, live_scoring_period=6), self.cache.settled_ttl)
+        self.assertIsNone(self.cache.ttl(params, live_scoring_period=6, season_complete=True))
+
+    def test_stat_correction_after_rollover(self):
+        session = FakeSession(b'{"points": 10}', b'{"points": 12}')
+        params = {'view': 'mMatchupScore', 'scoringPeriodId': 4}
+
+        self.cache.get(session, 'https://espn/league', params, live_scoring_period=5)
+        with patch('espn_api.requests.cache.time.time', return_value=time.time() + 61):
+            r = self.cache.get(session, 'https://espn/league', params, live_scoring_period=5)
+
+        self.assertEqual(r.json(), {'points': 12})
+        self.assertEqual(session.calls, 2)
@@ -0,0 +1,34 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from espn_api.requests.espn_requests import EspnFantasyRequests
+
+
+class SingleFlightTest(TestCase):
+    def test_followers_get_their_own_copy(self):
+        espn_request = EspnFantasyRequests('nfl', 2025, 1)
+        started, release = threading.Event(), threading.Event()
+
+        def fetch():
+            started.set()
+            release.wait()
+            return {'teams': [{'id': 1}]}
+
+        def call(_):
+            response = espn_request._single_flight('league', {'view': 'mTeam'}, {}, fetch)
+            response['teams'].append({'id': 2})
+            return response
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            leader = pool.submit(call, None)
+            started.wait()
+            followers = [pool.submit(call, None) for _ in range(2)]
+            while espn_request.coalescing_stats()['deduplicated'] < 2:
+                time.sleep(0.001)
+            release.set()
+            responses = [leader.result()] + [f.result() for f in followers]
+
+        self.assertEqual([r['teams'] for r in responses], [[{'id': 1}, {'id': 2}]] * 3)
+        self.assertEqual(len({id(r) for r in responses}), 3)
@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+import analytics
+
+
+def entry(slot, position, points, eligible, bench=False):
+    return {'slot': slot, 'position': position, 'eligibleSlots': eligible, 'name': f'{position} {points}', 'proTeam': 'KC',
+            'opp': 'BUF', 'points': points, 'proj': 0.0, 'gamePlayed': 100, 'bye': False, 'injuryStatus': 'ACTIVE',
+            'injured': False, 'bench': bench, 'stats': {}}
+
+
+def payload(**extra):
+    # team 1 left its flex empty and benched a 9 point receiver
+    away = [entry('QB', 'QB', 20.0, ['QB', 'OP', 'BE']), entry('WR', 'WR', 5.0, ['WR', 'RB/WR/TE', 'BE']),
+            entry('BE', 'WR', 9.0, ['WR', 'RB/WR/TE', 'BE'], bench=True)]
+    home = [entry('QB', 'QB', 15.0, ['QB', 'OP', 'BE']), entry('WR', 'WR', 4.0, ['WR', 'RB/WR/TE', 'BE']),
+            entry('RB/WR/TE', 'WR', 3.0, ['WR', 'RB/WR/TE', 'BE'])]
+    side = lambda team_id, lineup: {'id': team_id, 'name': '', 'owner': '', 'projected': 0.0, 'lineup': lineup,
+                                    'score': sum(p['points'] for p in lineup if not p['bench'])}
+    return {'year': 2025, 'current_week': 1, 'draft': [],
+            'weeks': {'1': [{'away': side(1, away), 'home': side(2, home)}]}, **extra}
+
+
+class TeamWeekRowsTest(TestCase):
+    def test_optimal_points_fill_league_slots(self):
+        rows = analytics.team_week_rows(payload(slot_counts={'QB': 1, 'WR': 1, 'RB/WR/TE': 1, 'BE': 6, 'IR': 1}))
+        optimal = {r['team_id']: r['optimal_points'] for r in rows}
+
+        # the empty flex counts the benched receiver
+        self.assertEqual(optimal, {1: 34.0, 2: 22.0})
+
+    def test_default_slots_without_slot_counts(self):
+        rows = analytics.team_week_rows(payload())
+
+        self.assertEqual({r['team_id']: r['optimal_points'] for r in rows}, {1: 34.0, 2: 22.0})
+
+    def test_playoff_weeks_from_league_schedule(self):
+        self.assertFalse(analytics.team_week_rows(payload())[0]['is_playoff'])
+        self.assertTrue(analytics.team_week_rows(payload(playoff_start_week=1))[0]['is_playoff'])
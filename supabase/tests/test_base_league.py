@@ -0,0 +1,68 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from espn_api.baseball import League as BaseballLeague
+from espn_api.basketball import League as BasketballLeague
+from espn_api.football import League as FootballLeague
+from espn_api.hockey import League as HockeyLeague
+from espn_api.wbasketball import League as WBasketballLeague
+
+
+class Fetched(Exception):
+    pass
+
+
+class Requests(object):
+    '''stops the fetch right after the league request'''
+    def get_league(self):
+        raise Fetched
+
+
+class ClearCacheTest(TestCase):
+    def test_every_sport_clears_its_cache_on_fetch(self):
+        for League in (FootballLeague, BasketballLeague, HockeyLeague, BaseballLeague, WBasketballLeague):
+            with self.subTest(League=League.__module__):
+                league = League(league_id=1, year=2025, fetch_league=False)
+                league._pro_schedule_data = {'settings': {'proTeams': []}}
+                league._pro_schedule_by_period = {1: {}}
+                league.espn_request = Requests()
+
+                with self.assertRaises(Fetched):
+                    league.fetch_league()
+                self.assertIsNone(league._pro_schedule_data)
+                self.assertEqual(league._pro_schedule_by_period, {})
+
+    def test_football_refresh_clears_memoized_pools(self):
+        league = FootballLeague(league_id=1, year=2025, fetch_league=False)
+        league._positional_ratings = {1: {}}
+        league._free_agent_pools = {1: {}}
+        league.espn_request = Requests()
+
+        with self.assertRaises(Fetched):
+            league.refresh()
+        self.assertEqual(league._positional_ratings, {})
+        self.assertEqual(league._free_agent_pools, {})
+
+
+class SlowRatings(object):
+    '''mPositionalRatings that takes long enough for concurrent callers to overlap'''
+    def __init__(self):
+        self.calls = 0
+
+    def league_get(self, params=None, headers=None):
+        self.calls += 1
+        time.sleep(0.05)
+        return {'positionAgainstOpponent': {'positionalRatings': {'1': {'ratingsByOpponent': {'2': {'rank': 5}}}}}}
+
+
+class MemoizedLookupTest(TestCase):
+    def test_concurrent_positional_ratings_fetch_once(self):
+        league = FootballLeague(league_id=1, year=2025, fetch_league=False)
+        league.espn_request = SlowRatings()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(league._get_positional_ratings, [3] * 4))
+
+        self.assertEqual(league.espn_request.calls, 1)
+        self.assertEqual(results, [{'1': {'2': 5}}] * 4)
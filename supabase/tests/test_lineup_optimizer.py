@@ -0,0 +1,23 @@
+from unittest import TestCase
+
+from lineup_optimizer import LineupOptimizer
+
+
+class AssignTest(TestCase):
+    def test_reseats_flex_player_for_a_later_one(self):
+        optimizer = LineupOptimizer({'RB': 1, 'RB/WR/TE': 1, 'BE': 5})
+        # the running back is taken first and lands in the flex; the tight end only fits there
+        players = [(20.0, ['RB/WR/TE', 'RB', 'BE'], 'RB'), (10.0, ['RB/WR/TE', 'BE'], 'TE'),
+                   (8.0, ['RB', 'RB/WR/TE', 'BE'], 'RB')]
+
+        seated = optimizer.assign(players)
+
+        self.assertEqual({optimizer.slots[spot]: player for spot, player in seated.items()}, {'RB': 0, 'RB/WR/TE': 1})
+        self.assertEqual(optimizer.best_score(players), 30.0)
+
+    def test_reseats_along_a_chain(self):
+        optimizer = LineupOptimizer({'WR': 1, 'WR/TE': 1, 'RB/WR/TE': 1})
+        players = [(30.0, ['RB/WR/TE', 'WR/TE', 'WR'], 'WR'), (20.0, ['WR/TE', 'RB/WR/TE'], 'TE'),
+                   (10.0, ['RB/WR/TE'], 'RB')]
+
+        self.assertEqual(optimizer.best_score(players), 60.0)
@@ -0,0 +1,66 @@
+import json
+import sys
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'benchmarks'))
+
+from fake_supabase import FakeSupabaseClient  # noqa: E402
+import seed  # noqa: E402
+
+ANALYTICS_TABLES = ('team_week_stats', 'team_season_stats')
+
+
+def payload():
+    def side(team_id, score, points):
+        return {'id': team_id, 'name': f'Team {team_id}', 'owner': f'Owner {team_id}', 'score': score, 'projected': 0.0,
+                'lineup': [{'slot': 'QB', 'position': 'QB', 'eligibleSlots': ['QB', 'OP', 'BE'], 'name': f'QB {team_id}',
+                            'proTeam': 'KC', 'opp': 'BUF', 'points': points, 'proj': 0.0, 'gamePlayed': 100,
+                            'bye': False, 'injuryStatus': 'ACTIVE', 'injured': False, 'bench': False, 'stats': {}}]}
+    return {'year': 2025, 'current_week': 1, 'draft': [],
+            'weeks': {'1': [{'away': side(1, 20.0, 20.0), 'home': side(2, 10.0, 10.0)}]}}
+
+
+class WithoutAnalytics(FakeSupabaseClient):
+    '''a database migration 002 was never applied to'''
+    def table(self, name):
+        if name in ANALYTICS_TABLES:
+            raise RuntimeError(f'relation "public.{name}" does not exist')
+        return super(WithoutAnalytics, self).table(name)
+
+
+class SyncYearPayloadTest(TestCase):
+    def sync(self, client, data=None, **kwargs):
+        with patch('builtins.print'):
+            return seed.sync_year_payload(client, json.loads(json.dumps(data or payload())), **kwargs)
+
+    def test_writes_analytics(self):
+        client = FakeSupabaseClient()
+        self.sync(client)
+
+        self.assertEqual(len(client.tables['team_week_stats']), 2)
+        self.assertEqual(len(client.tables['team_season_stats']), 2)
+
+    def test_resync_deletes_only_vanished_rows(self):
+        client = FakeSupabaseClient()
+        two_weeks = payload()
+        two_weeks['weeks']['2'] = two_weeks['weeks']['1']
+        self.sync(client, two_weeks)
+        kept = {r['id'] for r in client.tables['team_week_stats'] if r['week'] == 1}
+
+        self.sync(client)
+
+        rows = client.tables['team_week_stats']
+        self.assertEqual({r['week'] for r in rows}, {1})
+        self.assertEqual({r['id'] for r in rows}, kept)
+        self.assertEqual(len(client.tables['team_season_stats']), 2)
+
+    def test_missing_analytics_tables(self):
+        client = WithoutAnalytics()
+        self.sync(client)
+
+        self.assertEqual(len(client.tables['player_slots']), 2)
+        keys = {r['key'] for r in client.tables['sync_state']}
+        self.assertIn('week:1', keys)
+        self.assertFalse([k for k in keys if k.startswith('analytics:')])
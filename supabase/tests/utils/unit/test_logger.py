@@ -0,0 +1,22 @@
+from unittest import TestCase
+
+from espn_api.utils.logger import Logger, RequestCollector, request_view
+
+ENDPOINT = 'https://lm-api-reads.fantasy.espn.com/apis/v3/games/ffl/seasons/2025/segments/0/leagues/123'
+
+
+class RequestViewTest(TestCase):
+    def test_views(self):
+        self.assertEqual(request_view({'view': 'mTeam'}, ENDPOINT), 'mTeam')
+        self.assertEqual(request_view({'view': ['mMatchupScore', 'mScoreboard']}, ENDPOINT), 'mMatchupScore')
+        self.assertEqual(request_view({'view': []}, ENDPOINT), '123')
+        self.assertEqual(request_view(None, ENDPOINT + '/'), '123')
+
+    def test_log_record_view(self):
+        collector = RequestCollector()
+        logger = Logger('request_view_test', sinks=[collector])
+        params = {'view': ['mMatchupScore', 'mScoreboard']}
+        logger.log_request(ENDPOINT, {}, params=params, status=200)
+
+        # the same name RequestTimings aggregates the request and its build span under
+        self.assertEqual(collector.records[0]['view'], 'mMatchupScore')
@@ -8,13 +8,25 @@ Prerequisites:
   pip install -r requirements.txt
 
 Run from repo root:
-  python supabase/update_season.py
+  python supabase/update_season.py          # writes only what changed since the last sync
+  python supabase/update_season.py --full   # rewrites the whole season
+  python supabase/update_season.py --weeks live   # only the current and previous week
+  python supabase/update_season.py --since 9      # weeks 9..current
+  python supabase/update_season.py --request-log espn.jsonl   # one JSON line per ESPN request
+
+With --weeks live or --since only those weeks are fetched and merged into the stored
+season, and the player_season lines are only rebuilt when a lineup changed. The
+team_season_stats table is rebuilt from the stored team_week_stats rows either way.
+
+The run ends with a per-view table of ESPN request time split into connect, time to
+first byte, download, JSON decode and model build (`League.request_timings()` as a dict).
 
 Requires ESPN credentials in `.env` (see `.env.example`); `slimify_fantasy_html.py` loads them via python-dotenv.
 """
 
 from __future__ import annotations
 
+import argparse
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -31,10 +43,26 @@ def _ensure_import_paths() -> Path:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Refresh Supabase for the active season.")
+    parser.add_argument("--full", action="store_true", help="rewrite every row instead of only what changed")
+    parser.add_argument(
+        "--weeks",
+        choices=("all", "live"),
+        default="all",
+        help="live = current week plus the previous one (stat corrections)",
+    )
+    parser.add_argument("--since", type=int, metavar="N", help="only fetch weeks N..current")
+    parser.add_argument(
+        "--request-log",
+        metavar="PATH",
+        help="append endpoint/view/status/bytes/timings of every ESPN request to PATH as JSON lines",
+    )
+    args = parser.parse_args()
+
     _ensure_import_paths()
 
     import slimify_fantasy_html as slim
-    from seed import create_supabase_client, sync_year_payload, sync_player_season
+    from seed import create_supabase_client, format_sync_report, sync_year_payload, sync_player_season
 
     if not slim.ESPN_S2 or not slim.SWID:
         raise SystemExit(
@@ -42,6 +70,9 @@ def main() -> None:
         )
 
     from espn_api.football import League
+    from espn_api.utils.logger import JsonLinesWriter
+    from espn_api.utils.timing import format_timings
+    from espn_api.requests.throttle import throttle_stats
 
     client = create_supabase_client()
 
@@ -66,20 +97,38 @@ def main() -> None:
         year=year,
         espn_s2=slim.ESPN_S2,
         swid=slim.SWID,
+        cache=slim.RESPONSE_CACHE,
+        request_sinks=[JsonLinesWriter(args.request_log)] if args.request_log else None,
     )
 
     current_week = int(league.current_week)
-    all_weeks_data: dict[int, list] = {}
-    for week in range(1, current_week + 1):
-        try:
-            all_weeks_data[week] = league.box_scores(week=week)
+    first_week = 1
+    if args.since:
+        first_week = args.since
+    elif args.weeks == "live":
+        first_week = current_week - 1
+    first_week = min(max(first_week, 1), current_week)
+    partial = first_week > 1
+    weeks = range(first_week, current_week + 1)
+
+    errors: dict[int, Exception] = {}
+    all_weeks_data = league.box_scores_range(weeks, errors=errors)
+    for week in weeks:
+        if week in errors:
+            print(f"  Week {week}: error {errors[week]}")
+        elif week in all_weeks_data:
             print(f"  Week {week}: OK ({len(all_weeks_data[week])} matchups)")
-        except Exception as e:
-            print(f"  Week {week}: error {e}")
 
     payload = slim.build_year_json(league, all_weeks_data, year)
-    sync_year_payload(client, payload)
-    sync_player_season(client, year, slim.build_player_season(league, payload))
+    report = sync_year_payload(client, payload, incremental=not args.full, merge=partial)
+    print(format_sync_report(report))
+    if not partial:
+        sync_player_season(client, year, slim.build_player_season(league, payload))
+    elif report.get("player_slots insert", {}).get("rows"):
+        # season totals only move when somebody's lineup points did
+        sync_player_season(client, year, slim.build_player_season(league, payload), replace=False)
+    else:
+        print("No lineup changes; player_season left as is.")
 
     now = datetime.now(timezone.utc).isoformat()
     client.table("seasons").update({"current_week": current_week, "updated_at": now}).eq(
@@ -88,6 +137,26 @@ def main() -> None:
 
     print(f"Season {year} synced (current_week={current_week}).")
 
+    conn = league.espn_request.connection_stats()
+    print(
+        f"ESPN connections: {conn['connections']} opened for {conn['requests']} requests "
+        f"({conn['reused']} reused)."
+    )
+    if slim.RESPONSE_CACHE:
+        print(f"ESPN cache: {slim.RESPONSE_CACHE.stats}")
+    coalesced = league.espn_request.coalescing_stats()
+    print(
+        f"ESPN single-flight: {coalesced['deduplicated']} of {coalesced['calls']} calls shared an "
+        f"in-flight request {coalesced['by_view'] or ''}".rstrip() + "."
+    )
+    throttled = throttle_stats()
+    print(
+        f"ESPN rate limit: {throttled['throttled']} of {throttled['requests']} sends waited "
+        f"{throttled['throttle_seconds']}s; retries {throttled['retries'] or 'none'} "
+        f"({throttled['retry_seconds']}s backoff, {throttled['gave_up']} gave up)."
+    )
+    print(format_timings(league.request_timings()))
+
 
 if __name__ == "__main__":
     main()